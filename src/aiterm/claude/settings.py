@@ -1,6 +1,11 @@
 """Claude Code settings management.
 
 Handles reading, writing, and managing Claude Code settings.json files.
+
+Read-only consumers (statusLine segments, the usage tracker, MCP
+listing) go through ``read_settings``: each file is parsed at most once
+per change, keyed by its (mtime_ns, size), and callers share one
+immutable view of it.
 """
 
 import json
@@ -8,13 +13,19 @@ import shutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
 # Default settings file locations
 GLOBAL_SETTINGS = Path.home() / ".claude" / "settings.json"
 LOCAL_SETTINGS_NAME = ".claude/settings.local.json"
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Parsed settings views by path: (stamp, view)
+_VIEWS: Dict[Path, Tuple[Optional[Tuple[int, int]], Mapping[str, Any]]] = {}
+
 
 @dataclass
 class ClaudeSettings:
@@ -69,6 +80,61 @@ def find_settings_file(path: Optional[Path] = None) -> Optional[Path]:
     return None
 
 
+def get_global_settings_path() -> Path:
+    """Get ~/.claude/settings.json for the current home directory."""
+    return Path.home() / ".claude" / "settings.json"
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of a file, or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _freeze(value: Any) -> Any:
+    """Make parsed JSON read-only (objects become mappings, arrays tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def read_settings(path: Optional[Path] = None) -> Mapping[str, Any]:
+    """Read a settings file through the shared, change-validated cache.
+
+    The file is parsed again only when its mtime or size changes. The
+    returned view is shared, so it is read-only; use load_settings to
+    get a copy that can be modified and saved.
+
+    Args:
+        path: Settings file (defaults to ~/.claude/settings.json)
+
+    Returns:
+        Read-only settings (empty if the file is missing or invalid)
+    """
+    path = path or get_global_settings_path()
+    stamp = _file_stamp(path)
+    cached = _VIEWS.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    view = _EMPTY
+    if stamp is not None:
+        try:
+            data = json.loads(path.read_text())
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            data = None
+        if isinstance(data, dict):
+            view = _freeze(data)
+
+    _VIEWS[path] = (stamp, view)
+    return view
+
+
 def load_settings(path: Optional[Path] = None) -> Optional[ClaudeSettings]:
     """Load Claude settings from a file.
 
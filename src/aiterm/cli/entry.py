@@ -0,0 +1,79 @@
+"""Console script entry point for ``ait``/``aiterm``.
+
+Shell directory-change hooks run ``ait switch --cached`` on every ``cd``,
+and Claude Code runs ``ait statusline render`` on every statusLine
+refresh. Importing typer and rich alone costs more than either command,
+so both are served here before the Typer app is imported:
+
+- ``switch --cached`` from the persistent context cache (aiterm.context.cache)
+- ``statusline render`` by aiterm.statusline.__main__
+
+Everything else goes to aiterm.cli.main.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def _parse_fast_switch(args: List[str]) -> Optional[List[str]]:
+    """Match ``switch [PATH] --cached [--quiet] [--print]``.
+
+    Args:
+        args: Command-line arguments (without the program name)
+
+    Returns:
+        Positional arguments after ``switch``, or None if the fast path
+        does not apply (the full CLI then handles the command)
+    """
+    if not args or args[0] != 'switch' or '--cached' not in args:
+        return None
+
+    positional = []
+    for arg in args[1:]:
+        if arg in ('--cached', '--quiet', '-q', '--print'):
+            continue
+        if arg.startswith('-'):
+            return None  # Unknown option (e.g. --help): let typer handle it
+        positional.append(arg)
+    return positional if len(positional) <= 1 else None
+
+
+def fast_switch(path: Optional[str] = None, print_type: bool = False) -> int:
+    """Apply the (cached) context for a directory without the Typer app.
+
+    Args:
+        path: Directory (defaults to the current directory)
+        print_type: Print the context type first (e.g. "🐍 python"), so
+            hooks need no separate ``detect`` call
+
+    Returns:
+        Exit code
+    """
+    from aiterm.context.cache import detect_context_cached
+    from aiterm.terminal import apply_context
+
+    target = Path(path).expanduser() if path else None
+    if target is not None and not target.is_dir():
+        print(f"Error: not a directory: {path}", file=sys.stderr)
+        return 1
+
+    context = detect_context_cached(target)
+    if print_type:
+        print(context.label, flush=True)
+    apply_context(context)
+    return 0
+
+
+def main() -> None:
+    """Run ``ait``."""
+    fast_args = _parse_fast_switch(sys.argv[1:])
+    if fast_args is not None:
+        sys.exit(fast_switch(*fast_args, print_type='--print' in sys.argv[1:]))
+
+    if sys.argv[1:] == ['statusline', 'render']:
+        from aiterm.statusline.__main__ import main as render_statusline
+        sys.exit(render_statusline())
+
+    from aiterm.cli.main import app
+    app()
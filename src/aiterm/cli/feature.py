@@ -22,6 +22,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
+from aiterm.git.repo import find_repo
+
 app = typer.Typer(
     help="Feature branch workflow commands.",
     no_args_is_help=True,
@@ -131,6 +133,10 @@ def _get_feature_branches() -> list[FeatureBranch]:
 
 def _get_worktrees() -> list[WorktreeInfo]:
     """Get all git worktrees."""
+    worktrees = _read_worktrees()
+    if worktrees is not None:
+        return worktrees
+
     worktrees = []
     result = _run_git(["worktree", "list", "--porcelain"])
     if not result:
@@ -170,6 +176,23 @@ def _get_worktrees() -> list[WorktreeInfo]:
     return worktrees
 
 
+def _read_worktrees() -> Optional[list[WorktreeInfo]]:
+    """Read worktrees straight from .git (None = fall back to git)."""
+    repo = find_repo(Path.cwd())
+    if repo is None or not repo.is_supported:
+        return None
+
+    return [
+        WorktreeInfo(
+            path=Path(entry["path"]),
+            branch=str(entry["branch"]).replace("refs/heads/", ""),
+            commit=str(entry["head"])[:8],
+            is_bare=bool(entry["bare"]),
+        )
+        for entry in repo.worktrees()
+    ]
+
+
 @app.command(
     "status",
     epilog="""
@@ -0,0 +1,103 @@
+"""Lazy registration of ``ait`` command groups.
+
+Importing every CLI module just to register its Typer sub-app costs every
+``ait`` call (shell hooks included) several hundred milliseconds. Command
+groups are instead listed in a static manifest (name, module, help text)
+and a module is imported only when its group is invoked or completed.
+Help listings use the manifest text, so ``ait --help`` imports nothing.
+
+To add a command group, add an entry to LAZY_GROUPS; the module must
+define a Typer instance named ``app``.
+"""
+
+import importlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(NamedTuple):
+    """Manifest entry for a lazily imported command group."""
+
+    module: str
+    help: str
+    hidden: bool = False
+
+
+# Command groups in display order (help text mirrors each module's Typer help)
+LAZY_GROUPS: Dict[str, LazyGroup] = {
+    'hooks': LazyGroup('aiterm.cli.hooks', "Manage Claude Code hooks"),
+    'commands': LazyGroup('aiterm.cli.commands', "Manage Claude Code command templates"),
+    'mcp': LazyGroup('aiterm.cli.mcp', "Manage MCP servers for Claude Code"),
+    'docs': LazyGroup('aiterm.cli.docs', "Documentation validation and testing"),
+    'opencode': LazyGroup('aiterm.cli.opencode', "OpenCode CLI configuration and management."),
+    'ide': LazyGroup('aiterm.cli.ide', "Manage IDE integrations."),
+    'ghostty': LazyGroup('aiterm.cli.ghostty', "Ghostty terminal management commands."),
+    'config': LazyGroup('aiterm.cli.config', "Configuration management commands."),
+    'feature': LazyGroup('aiterm.cli.feature', "Feature branch workflow commands."),
+    'agents': LazyGroup('aiterm.cli.agents', "Manage Claude Code subagents."),
+    'memory': LazyGroup('aiterm.cli.memory', "Manage Claude Code memory system (CLAUDE.md files)."),
+    'styles': LazyGroup('aiterm.cli.styles', "Manage Claude Code output styles."),
+    'plugins': LazyGroup('aiterm.cli.plugins', "Manage Claude Code plugins."),
+    'gemini': LazyGroup('aiterm.cli.gemini', "Manage Gemini CLI integration."),
+    'statusbar': LazyGroup('aiterm.cli.statusbar', "Build and customize status bars."),
+    'statusline': LazyGroup('aiterm.cli.statusline', "Manage statusLine configuration for Claude Code."),
+    'terminals': LazyGroup('aiterm.cli.terminals', "Manage terminal emulator integrations."),
+    'workflows': LazyGroup('aiterm.cli.workflows', "Manage workflow templates for different contexts."),
+    'recipes': LazyGroup('aiterm.cli.workflows', "Manage workflow templates for different contexts.",
+                         hidden=True),  # Alias for workflows
+    'sessions': LazyGroup('aiterm.cli.sessions', "Manage development sessions."),
+    'craft': LazyGroup('aiterm.cli.craft', "Craft plugin management for Claude Code."),
+    'release': LazyGroup('aiterm.cli.release', "Release management commands for PyPI and Homebrew."),
+    'learn': LazyGroup('aiterm.cli.learn', "Interactive tutorials for learning aiterm."),
+}
+
+
+def load_group(name: str) -> TyperGroup:
+    """Import a lazy command group and build its click group.
+
+    Args:
+        name: Command name in LAZY_GROUPS
+
+    Returns:
+        The group, named and hidden as in the manifest
+    """
+    spec = LAZY_GROUPS[name]
+    module = importlib.import_module(spec.module)
+    group = typer.main.get_group(module.app)
+    group.name = name
+    group.hidden = spec.hidden
+    return group
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports manifest groups on first use."""
+
+    def list_commands(self, ctx) -> List[str]:
+        """List eager commands followed by manifest groups."""
+        names = list(super().list_commands(ctx))
+        return names + [name for name in LAZY_GROUPS if name not in names]
+
+    def get_command(self, ctx, cmd_name: str):
+        """Get a command; unloaded groups get a help-only placeholder."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_GROUPS:
+            spec = LAZY_GROUPS[cmd_name]
+            command = TyperGroup(name=cmd_name, help=spec.help, hidden=spec.hidden)
+        return command
+
+    def resolve_command(self, ctx, args: List[str]) -> Tuple[Optional[str], Optional[object], List[str]]:
+        """Load the invoked group before click resolves it."""
+        if args:
+            self.load(args[0])
+        return super().resolve_command(ctx, args)
+
+    def load(self, name: str) -> None:
+        """Import a manifest group (once) and register it.
+
+        Args:
+            name: Command name (ignored unless it is an unloaded lazy group)
+        """
+        if name in LAZY_GROUPS and name not in self.commands:
+            self.add_command(load_group(name), name)
@@ -11,13 +11,15 @@ from rich.panel import Panel
 from rich.table import Table
 
 from aiterm import __app_name__, __version__
+from aiterm.cli.lazy import LazyTyperGroup
 
-# Initialize Typer app
+# Initialize Typer app (command groups in aiterm.cli.lazy.LAZY_GROUPS load on first use)
 app = typer.Typer(
     name=__app_name__,
     help="Terminal optimizer CLI for AI-assisted development.",
     add_completion=True,
     rich_markup_mode="rich",
+    cls=LazyTyperGroup,
 )
 
 console = Console()
@@ -307,22 +309,40 @@ def info(
 # ─── Context detection implementation ────────────────────────────────────────
 
 
-def _context_detect_impl(path: Optional[Path], apply: bool, force_terminal: Optional[str] = None) -> None:
+def _context_detect_impl(
+    path: Optional[Path],
+    apply: bool,
+    force_terminal: Optional[str] = None,
+    cached: bool = False,
+    quiet: bool = False,
+    print_type: bool = False,
+) -> None:
     """Shared implementation for context detection commands."""
     from aiterm.context.detector import detect_context
     from aiterm.terminal import detect_terminal, apply_context as terminal_apply_context, TerminalType
 
     target = path or Path.cwd()
-    context = detect_context(target)
+    if cached:
+        from aiterm.context.cache import detect_context_cached
+        context = detect_context_cached(target)
+    else:
+        context = detect_context(target)
     terminal = detect_terminal()
 
+    if quiet:
+        if print_type:
+            print(context.label, flush=True)
+        if apply:
+            terminal_apply_context(context)
+        return
+
     # Build info table
     table = Table(title="Context Detection", show_header=False, border_style="cyan")
     table.add_column("Field", style="bold")
     table.add_column("Value")
 
     table.add_row("Directory", str(target))
-    table.add_row("Type", f"{context.icon} {context.type.value}" if context.icon else context.type.value)
+    table.add_row("Type", context.label)
     table.add_row("Name", context.name)
     table.add_row("Profile", context.profile)
     table.add_row("Terminal", terminal.value)
@@ -333,8 +353,10 @@ def _context_detect_impl(path: Optional[Path], apply: bool, force_terminal: Opti
 
     console.print(table)
 
-    # Apply to terminal if requested
+    # Apply to terminal if requested (an explicit switch re-sends everything)
     if apply:
+        from aiterm.terminal.state import clear_state
+        clear_state()
         if terminal_apply_context(context):
             terminal_name = terminal.value.replace("-", " ").title()
             console.print(f"\n[green]✓[/] Context applied to {terminal_name}")
@@ -503,13 +525,23 @@ def detect(
   ait switch              # Apply context for current dir
   ait switch ~/my-project # Apply context for path
   cd ~/project && ait switch  # Common workflow
+  ait switch --cached     # Fast, silent (for shell cd hooks)
 """
 )
 def switch(
     path: Optional[Path] = typer.Argument(None, help="Directory to analyze."),
+    cached: bool = typer.Option(
+        False, "--cached", help="Reuse the cached context if the project is unchanged (implies --quiet)."
+    ),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Apply without printing the context table."),
+    print_type: bool = typer.Option(
+        False, "--print", help="Print the context type (e.g. '🐍 python') instead of the table."
+    ),
 ) -> None:
     """Detect and apply context to terminal (shortcut for 'context apply')."""
-    _context_detect_impl(path, apply=True)
+    _context_detect_impl(
+        path, apply=True, cached=cached, quiet=quiet or cached or print_type, print_type=print_type
+    )
 
 
 # ─── Sub-command groups ──────────────────────────────────────────────────────
@@ -758,57 +790,5 @@ def approvals_add(
         raise typer.Exit(1)
 
 
-# ─── Register hooks, commands, MCP, docs, and opencode CLIs (must be after app is fully defined) ───
-from aiterm.cli import hooks as hooks_cli
-from aiterm.cli import commands as commands_cli
-from aiterm.cli import mcp as mcp_cli
-from aiterm.cli import docs as docs_cli
-from aiterm.cli import opencode as opencode_cli
-from aiterm.cli import ide as ide_cli
-from aiterm.cli import ghostty as ghostty_cli
-from aiterm.cli import config as config_cli
-from aiterm.cli import feature as feature_cli
-
-app.add_typer(hooks_cli.app, name="hooks")
-app.add_typer(commands_cli.app, name="commands")
-app.add_typer(mcp_cli.app, name="mcp")
-app.add_typer(docs_cli.app, name="docs")
-app.add_typer(opencode_cli.app, name="opencode")
-app.add_typer(ide_cli.app, name="ide")
-app.add_typer(ghostty_cli.app, name="ghostty")
-app.add_typer(config_cli.app, name="config")
-app.add_typer(feature_cli.app, name="feature")
-
-# ─── Phase 2.5-4: Advanced CLI modules ──────────────────────────────────────────
-from aiterm.cli import agents as agents_cli
-from aiterm.cli import memory as memory_cli
-from aiterm.cli import styles as styles_cli
-from aiterm.cli import plugins as plugins_cli
-from aiterm.cli import gemini as gemini_cli
-from aiterm.cli import statusbar as statusbar_cli
-from aiterm.cli import statusline as statusline_cli
-from aiterm.cli import terminals as terminals_cli
-from aiterm.cli import workflows as workflows_cli
-from aiterm.cli import sessions as sessions_cli
-from aiterm.cli import craft as craft_cli
-from aiterm.cli import release as release_cli
-from aiterm.cli import learn as learn_cli
-
-app.add_typer(agents_cli.app, name="agents")
-app.add_typer(memory_cli.app, name="memory")
-app.add_typer(styles_cli.app, name="styles")
-app.add_typer(plugins_cli.app, name="plugins")
-app.add_typer(gemini_cli.app, name="gemini")
-app.add_typer(statusbar_cli.app, name="statusbar")
-app.add_typer(statusline_cli.app, name="statusline")
-app.add_typer(terminals_cli.app, name="terminals")
-app.add_typer(workflows_cli.app, name="workflows")
-app.add_typer(workflows_cli.app, name="recipes", hidden=True)  # Alias for workflows
-app.add_typer(sessions_cli.app, name="sessions")
-app.add_typer(craft_cli.app, name="craft")
-app.add_typer(release_cli.app, name="release")
-app.add_typer(learn_cli.app, name="learn")
-
-
 if __name__ == "__main__":
     app()
@@ -853,6 +853,9 @@ def session_show(
 @app.command("stats")
 def session_stats(
     days: int = typer.Option(7, "--days", "-d", help="Days to include in stats."),
+    transcripts: bool = typer.Option(
+        True, "--transcripts/--no-transcripts", help="Include token and cost totals from Claude Code transcripts."
+    ),
 ) -> None:
     """Show session statistics."""
     sessions = load_sessions()
@@ -899,6 +902,64 @@ def session_stats(
         for project, count in sorted(projects.items(), key=lambda x: x[1], reverse=True)[:5]:
             console.print(f"  {project}: {count} sessions")
 
+    if transcripts:
+        _print_transcript_stats(days)
+
+
+def _format_tokens(count: int) -> str:
+    """Format a token count compactly (e.g. 1.2M, 45k)."""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.0f}k"
+    return str(count)
+
+
+def _print_transcript_stats(days: int) -> None:
+    """Print token, tool and cost totals from Claude Code transcripts.
+
+    Transcripts are analyzed incrementally (see aiterm.statusline.analytics),
+    so repeated reports only parse what was appended since the last run.
+    """
+    from aiterm.statusline.analytics import SessionStats, find_transcripts, summarize
+
+    paths = find_transcripts(days)
+    if not paths:
+        return
+
+    projects = summarize(paths)
+    total = SessionStats()
+    for stats in projects.values():
+        total.merge(stats)
+
+    console.print(f"\n[bold cyan]Claude Code Usage ({len(paths)} transcripts)[/]\n")
+
+    table = Table(border_style="dim")
+    table.add_column("Project", style="bold")
+    table.add_column("Messages", justify="right")
+    table.add_column("Input", justify="right")
+    table.add_column("Output", justify="right")
+    table.add_column("Cache", justify="right")
+    table.add_column("Est. cost", justify="right")
+
+    ranked = sorted(projects.items(), key=lambda item: item[1].cost_usd, reverse=True)
+    for project, stats in ranked[:10] + [("Total", total)]:
+        table.add_row(
+            project,
+            str(stats.messages),
+            _format_tokens(stats.input_tokens),
+            _format_tokens(stats.output_tokens),
+            _format_tokens(stats.cache_creation_tokens + stats.cache_read_tokens),
+            f"${stats.cost_usd:.2f}",
+        )
+    console.print(table)
+
+    if total.tool_calls:
+        top_tools = sorted(total.tool_calls.items(), key=lambda item: item[1], reverse=True)[:5]
+        console.print("\n[bold]Top Tools:[/]")
+        for name, count in top_tools:
+            console.print(f"  {name}: {count} calls")
+
 
 @app.command("delete")
 def session_delete(
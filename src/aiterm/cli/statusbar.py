@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.syntax import Syntax
 
+from aiterm.claude.settings import read_settings
+
 app = typer.Typer(
     help="Build and customize status bars.",
     no_args_is_help=True,
@@ -122,15 +125,8 @@ def get_claude_settings_path() -> Path:
 
 def load_current_statusbar() -> dict[str, Any] | None:
     """Load current status bar config from Claude Code settings."""
-    settings_path = get_claude_settings_path()
-    if not settings_path.exists():
-        return None
-
-    try:
-        data = json.loads(settings_path.read_text())
-        return data.get("statusLine")
-    except (json.JSONDecodeError, OSError):
-        return None
+    statusline = read_settings(get_claude_settings_path()).get("statusLine")
+    return dict(statusline) if isinstance(statusline, Mapping) else statusline
 
 
 def save_statusbar_to_settings(config: StatusBarConfig) -> bool:
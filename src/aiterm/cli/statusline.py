@@ -30,6 +30,14 @@ app.add_typer(config_app, name="config")
 theme_app = typer.Typer(name="theme", help="Manage statusLine themes")
 app.add_typer(theme_app, name="theme")
 
+# Daemon subcommand group
+daemon_app = typer.Typer(name="daemon", help="Manage the statusLine render daemon")
+app.add_typer(daemon_app, name="daemon")
+
+# Cache subcommand group
+cache_app = typer.Typer(name="cache", help="Inspect and clear statusLine caches")
+app.add_typer(cache_app, name="cache")
+
 
 # =============================================================================
 # Config Commands
@@ -69,7 +77,7 @@ def config_list(
     category: Optional[str] = typer.Option(
         None,
         "--category", "-c",
-        help="Filter by category (display, git, project, usage, theme, time)"
+        help="Filter by category (display, git, project, usage, theme, time, performance)"
     ),
     format: str = typer.Option(
         "table",
@@ -697,6 +705,152 @@ def theme_show():
     console.print(table)
 
 
+# =============================================================================
+# Daemon Commands
+# =============================================================================
+
+
+@daemon_app.command(
+    "start",
+    epilog="""
+\b
+Examples:
+  ait statusline daemon start                   # Start in background
+  ait statusline daemon start --idle-timeout 0  # Never exit when idle
+"""
+)
+def daemon_start(
+    idle_timeout: float = typer.Option(
+        3600,
+        "--idle-timeout",
+        help="Exit after N seconds without requests (0 = never)"
+    )
+):
+    """Start the render daemon in the background.
+
+    The daemon keeps the renderer warm so 'ait-statusline' can answer
+    Claude Code refreshes without Python/CLI startup cost.
+    """
+    from aiterm.statusline.daemon import get_socket_path, is_running, start_daemon
+
+    if is_running():
+        console.print("[yellow]Daemon already running[/]")
+        console.print(f"[dim]Socket: {get_socket_path()}[/]")
+        return
+
+    if start_daemon(idle_timeout=idle_timeout):
+        console.print("[green]✓[/] StatusLine daemon started")
+        console.print(f"[dim]Socket: {get_socket_path()}[/]")
+        console.print("\n[dim]Use 'ait-statusline' as the Claude Code statusLine command[/]")
+    else:
+        console.print("[red]Failed to start daemon[/]")
+        raise typer.Exit(1)
+
+
+@daemon_app.command(
+    "stop",
+    epilog="""
+\b
+Examples:
+  ait statusline daemon stop  # Stop the background daemon
+"""
+)
+def daemon_stop():
+    """Stop the render daemon."""
+    from aiterm.statusline.daemon import stop_daemon
+
+    if stop_daemon():
+        console.print("[green]✓[/] StatusLine daemon stopped")
+    else:
+        console.print("[yellow]Daemon not running[/]")
+
+
+@daemon_app.command(
+    "status",
+    epilog="""
+\b
+Examples:
+  ait statusline daemon status  # Show daemon state
+"""
+)
+def daemon_status():
+    """Show render daemon status."""
+    from aiterm.statusline.daemon import get_daemon_pid, get_socket_path, is_running
+
+    socket_path = get_socket_path()
+
+    table = Table(title="StatusLine Daemon", show_header=False)
+    table.add_column("Field", style="cyan")
+    table.add_column("Value")
+
+    if is_running(socket_path):
+        table.add_row("Status", "[green]running[/]")
+        pid = get_daemon_pid(socket_path)
+        if pid:
+            table.add_row("PID", str(pid))
+    else:
+        table.add_row("Status", "[dim]stopped[/]")
+
+    table.add_row("Socket", str(socket_path))
+    console.print(table)
+
+
+# =============================================================================
+# Cache Commands
+# =============================================================================
+
+
+@cache_app.command(
+    "stats",
+    epilog="""
+\b
+Examples:
+  ait statusline cache stats  # Show hit/miss counters
+"""
+)
+def cache_stats():
+    """Show cache hit/miss counters."""
+    from aiterm.utils.cache import get_cache_dir, get_stats
+
+    stats = get_stats()
+    if not stats:
+        console.print("[dim]No cache activity recorded yet[/]")
+        console.print(f"[dim]Cache dir: {get_cache_dir()}[/]")
+        return
+
+    table = Table(title="StatusLine Caches")
+    table.add_column("Cache", style="cyan")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit Rate", justify="right")
+
+    for name, counters in sorted(stats.items()):
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        total = hits + misses
+        rate = f"{hits / total:.1%}" if total else "-"
+        table.add_row(name, str(hits), str(misses), rate)
+
+    console.print(table)
+    console.print(f"[dim]Cache dir: {get_cache_dir()}[/]")
+
+
+@cache_app.command(
+    "clear",
+    epilog="""
+\b
+Examples:
+  ait statusline cache clear  # Drop cached data and counters
+"""
+)
+def cache_clear():
+    """Clear cached data and hit/miss counters."""
+    from aiterm.utils.cache import clear_cache
+
+    removed = clear_cache()
+    console.print(f"[green]✓[/] Removed {removed} cache file(s)")
+
+
 # =============================================================================
 # Main statusline commands (render, install, test, etc.)
 # =============================================================================
@@ -707,24 +861,251 @@ def statusline_render():
     """Render statusLine output (called by Claude Code).
 
     This command reads JSON from stdin and outputs formatted statusLine.
+    The installed ``ait`` script serves it without loading this CLI (see
+    aiterm.cli.entry); this command is the same render for other callers.
     """
-    from aiterm.statusline.renderer import StatusLineRenderer
+    from aiterm.statusline.__main__ import main
+
+    main()
+
+
+@app.command(
+    "overruns",
+    epilog="""
+\b
+Examples:
+  ait statusline overruns          # Show segments that overran their budget
+  ait statusline overruns --clear  # Reset overrun records
+"""
+)
+def statusline_overruns(
+    clear: bool = typer.Option(
+        False,
+        "--clear",
+        help="Reset overrun records"
+    )
+):
+    """Show segments that overran their render time budget.
+
+    Budgets are set with performance.*_budget_ms config keys.
+    """
+    from datetime import datetime
+    from aiterm.statusline.budget import OVERRUNS_FILE, get_overruns
+    from aiterm.utils.cache import get_cache_dir
+
+    if clear:
+        try:
+            (get_cache_dir() / OVERRUNS_FILE).unlink()
+        except OSError:
+            pass
+        console.print("[green]✓[/] Overrun records cleared")
+        return
+
+    overruns = get_overruns()
+    if not overruns:
+        console.print("[green]✓[/] No segment has overrun its budget")
+        return
+
+    table = Table(title="Segment Budget Overruns")
+    table.add_column("Segment", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Last (ms)", justify="right")
+    table.add_column("Budget (ms)", justify="right")
+    table.add_column("Last Seen", style="dim")
+
+    for name, entry in sorted(overruns.items(), key=lambda item: -item[1].get('count', 0)):
+        last_ms = entry.get('last_ms')
+        budget_ms = entry.get('budget_ms') or 0
+        last_time = entry.get('last_time')
+        table.add_row(
+            name,
+            str(entry.get('count', 0)),
+            "not started" if last_ms is None else str(last_ms),
+            str(budget_ms) if budget_ms else "total",
+            datetime.fromtimestamp(last_time).strftime('%Y-%m-%d %H:%M:%S') if last_time else "-"
+        )
+
+    console.print(table)
+
+
+@app.command(
+    "trace",
+    epilog="""
+\b
+Examples:
+  AITERM_TRACE=1 ait statusline daemon start  # Record traces
+  ait statusline trace                        # Summarise all records
+  ait statusline trace --last 100             # Only recent renders
+  ait statusline trace --clear                # Delete the trace file
+"""
+)
+def statusline_trace(
+    last: Optional[int] = typer.Option(None, "--last", "-n", help="Only the most recent N renders"),
+    clear: bool = typer.Option(False, "--clear", help="Delete the trace file"),
+):
+    """Summarise per-segment render traces.
+
+    Rendering appends trace records while AITERM_TRACE=1 is set.
+    """
+    from aiterm.statusline.trace import get_trace_path, read_records, summarize_records
+
+    path = get_trace_path()
+
+    if clear:
+        for candidate in (path, path.with_name(path.name + '.1')):
+            try:
+                candidate.unlink()
+            except OSError:
+                pass
+        console.print("[green]✓[/] Trace file cleared")
+        return
+
+    records = read_records(path, limit=last)
+    if not records:
+        console.print("[dim]No trace records yet[/]")
+        console.print("[dim]Set AITERM_TRACE=1 for the process that renders "
+                      "(restart the daemon with it set)[/]")
+        console.print(f"[dim]Trace file: {path}[/]")
+        return
+
+    summary = summarize_records(records)
+
+    table = Table(title=f"StatusLine Trace ({len(records)} renders)")
+    table.add_column("Segment", style="cyan")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Procs", justify="right")
+    table.add_column("KB read", justify="right")
+    table.add_column("Cache Hit", justify="right")
+    table.add_column("Overruns", justify="right")
+
+    # Slowest segments first, whole-render total last
+    names = sorted((n for n in summary if n != 'total'), key=lambda n: -summary[n]['p95'])
+    for name in names + ['total']:
+        stats = summary[name]
+        is_total = name == 'total'
+        hit_rate = stats['hit_rate']
+        table.add_row(
+            "[bold]total[/]" if is_total else name,
+            f"{stats['p50']:.1f}",
+            f"{stats['p95']:.1f}",
+            f"{stats['max']:.1f}",
+            "" if is_total else f"{stats['subprocs']:.1f}",
+            "" if is_total else f"{stats['kb']:.1f}",
+            "" if is_total else ("-" if hit_rate is None else f"{hit_rate:.0%}"),
+            "" if is_total else str(stats['overruns']),
+        )
+
+    console.print(table)
+    console.print(f"[dim]Trace file: {path}[/]")
 
-    # Create renderer
-    renderer = StatusLineRenderer()
 
-    # Render (reads from stdin)
+@app.command(
+    "bench",
+    epilog="""
+\b
+Examples:
+  ait statusline bench                          # All scenarios
+  ait statusline bench -s small -s huge -n 50   # Selected scenarios
+  ait statusline bench --payload session.json   # Replay recorded input
+  ait statusline bench -o v0.7.json --compare v0.6.json
+"""
+)
+def statusline_bench(
+    scenario: Optional[list[str]] = typer.Option(
+        None,
+        "--scenario", "-s",
+        help="Scenario to run (nogit, small, huge, untracked, worktrees; repeatable)"
+    ),
+    iterations: int = typer.Option(20, "--iterations", "-n", help="Warm renders per scenario"),
+    cold: int = typer.Option(5, "--cold", help="Cold renders per scenario"),
+    scale: float = typer.Option(1.0, "--scale", help="Size multiplier for synthetic repos"),
+    payload: Optional[list[Path]] = typer.Option(
+        None,
+        "--payload", "-p",
+        help="Recorded Claude Code JSON payload file (repeatable)"
+    ),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write results JSON"),
+    compare: Optional[Path] = typer.Option(None, "--compare", help="Baseline results JSON to diff against"),
+):
+    """Benchmark statusLine render latency.
+
+    Replays payloads through the renderer in synthetic repositories and
+    reports cold/warm p50/p95/p99 per segment and in total.
+    """
+    import json
+    from aiterm.statusline.bench import compare_results, load_payloads, run_benchmark, write_results
+
     try:
-        output = renderer.render()
-        # Print directly to stdout (no Rich formatting)
-        import sys
-        sys.stdout.write(output)
-        sys.stdout.flush()
-    except Exception as e:
-        # On error, output minimal statusLine
-        import sys
-        sys.stdout.write(f"╭─ ⚠️  StatusLine Error\n╰─ {str(e)[:50]}")
-        sys.stdout.flush()
+        payloads = load_payloads(payload) if payload else None
+        baseline = json.loads(compare.read_text()) if compare else None
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/]")
+        raise typer.Exit(1)
+
+    try:
+        results = run_benchmark(
+            scenarios=scenario,
+            payloads=payloads,
+            iterations=iterations,
+            cold_iterations=cold,
+            scale=scale,
+            progress=lambda name: console.print(f"[dim]Running {name}...[/]"),
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/]")
+        raise typer.Exit(1)
+    except (OSError, subprocess.CalledProcessError) as e:
+        console.print(f"[red]Error creating scenario: {e}[/]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"StatusLine Render Latency (aiterm {results['aiterm_version']})")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Phase")
+    table.add_column("Segment")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+
+    for name, phases in results['scenarios'].items():
+        for phase, summary in phases.items():
+            rows = [("total", summary['total'])] + list(summary['segments'].items())
+            for segment, stats in rows:
+                table.add_row(
+                    name, phase,
+                    f"[bold]{segment}[/]" if segment == "total" else segment,
+                    f"{stats['p50']:.1f}", f"{stats['p95']:.1f}", f"{stats['p99']:.1f}"
+                )
+    console.print(table)
+
+    if baseline:
+        diff = Table(title=f"p50 vs {compare.name} (aiterm {baseline.get('aiterm_version', '?')})")
+        diff.add_column("Scenario", style="cyan")
+        diff.add_column("Phase")
+        diff.add_column("Segment")
+        diff.add_column("Before ms", justify="right")
+        diff.add_column("After ms", justify="right")
+        diff.add_column("Change", justify="right")
+
+        for row in compare_results(baseline, results):
+            change = row['change_pct']
+            if change is None:
+                change_str = "-"
+            else:
+                color = "red" if change > 10 else "green" if change < -10 else "dim"
+                change_str = f"[{color}]{change:+.1f}%[/]"
+            before = row['baseline']
+            diff.add_row(
+                row['scenario'], row['phase'], row['name'],
+                "-" if before is None else f"{before:.1f}",
+                f"{row['current']:.1f}", change_str
+            )
+        console.print(diff)
+
+    if output:
+        write_results(results, output)
+        console.print(f"[green]✓[/] Results written to {output}")
 
 
 @app.command(
@@ -15,6 +15,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from aiterm.claude.settings import read_settings
+
 app = typer.Typer(
     help="Manage Claude Code output styles.",
     no_args_is_help=True,
@@ -164,14 +166,7 @@ def list_all_styles() -> list[OutputStyle]:
 
 def get_current_style() -> str | None:
     """Get the currently active style from settings."""
-    settings_file = Path.home() / ".claude" / "settings.json"
-    if settings_file.exists():
-        try:
-            data = json.loads(settings_file.read_text())
-            return data.get("outputStyle")
-        except (json.JSONDecodeError, OSError):
-            pass
-    return None
+    return read_settings().get("outputStyle")
 
 
 def set_current_style(style_name: str) -> bool:
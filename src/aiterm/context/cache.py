@@ -0,0 +1,167 @@
+"""Persistent context cache for shell directory-change hooks.
+
+``ait switch`` runs on every ``cd`` from the flow-cli zsh integration and
+the context-switcher hook. Full detection reads marker files and runs
+``git status``; for a project visited before, the answer is almost
+always the same. Detected contexts are kept in ~/.cache/aiterm/contexts.json,
+keyed by resolved path and validated by a stamp of:
+
+- the directory mtime (marker files added or removed)
+- marker file mtimes (DESCRIPTION, pyproject.toml, ... edited in place)
+- the repository's HEAD and index mtimes (branch switches, staging, commits)
+
+Edits to tracked files do not touch any of these, so the dirty flag is
+only trusted for MAX_AGE seconds before detection runs again.
+
+This module must stay importable without typer/rich: it backs the
+``ait switch --cached`` fast path in aiterm.cli.entry.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiterm.context.detector import ContextInfo, ContextType, detect_context
+from aiterm.git.repo import find_repo
+from aiterm.utils.cache import atomic_write_json, get_cache_dir, read_json, record_lookup
+
+CONTEXT_CACHE_FILE = 'contexts.json'
+
+# Files whose contents decide the context type and name
+MARKER_FILES = ('DESCRIPTION', 'pyproject.toml', 'package.json', '_quarto.yml')
+
+# Seconds a cached context (and its dirty flag) stays valid
+MAX_AGE = 300
+
+# Directories remembered (least recently detected dropped first)
+MAX_ENTRIES = 200
+
+
+def get_cache_path() -> Path:
+    """Get the context cache file path."""
+    return get_cache_dir() / CONTEXT_CACHE_FILE
+
+
+def _mtime(path: Path) -> Optional[int]:
+    """Get a path's mtime in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_stamp(path: Path) -> List[Optional[int]]:
+    """Build the validation stamp for a directory.
+
+    Args:
+        path: Resolved directory path
+
+    Returns:
+        List of mtimes (directory, marker files, git HEAD and index)
+    """
+    stamp = [_mtime(path)]
+    stamp.extend(_mtime(path / name) for name in MARKER_FILES)
+
+    repo = find_repo(path)
+    if repo is not None:
+        stamp.extend((_mtime(repo.git_dir / 'HEAD'), _mtime(repo.git_dir / 'index')))
+    return stamp
+
+
+def _to_dict(context: ContextInfo) -> Dict[str, Any]:
+    """Serialize a context for the cache file."""
+    return {
+        'type': context.type.value,
+        'name': context.name,
+        'icon': context.icon,
+        'profile': context.profile,
+        'branch': context.branch,
+        'is_dirty': context.is_dirty,
+    }
+
+
+def _from_dict(data: Dict[str, Any]) -> Optional[ContextInfo]:
+    """Rebuild a cached context (None if the entry is malformed)."""
+    try:
+        return ContextInfo(
+            type=ContextType(data['type']),
+            name=data['name'],
+            icon=data['icon'],
+            profile=data['profile'],
+            branch=data.get('branch'),
+            is_dirty=bool(data.get('is_dirty', False)),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _load() -> Dict[str, Any]:
+    """Load all cache entries."""
+    data = read_json(get_cache_path())
+    return data if isinstance(data, dict) else {}
+
+
+def get_cached_context(path: Path) -> Optional[ContextInfo]:
+    """Get a cached context if it is still valid.
+
+    Args:
+        path: Resolved directory path
+
+    Returns:
+        The cached ContextInfo, or None on a miss
+    """
+    entry = _load().get(str(path))
+    if (
+        not isinstance(entry, dict)
+        or time.time() - entry.get('t', 0) > MAX_AGE
+        or entry.get('stamp') != get_stamp(path)
+    ):
+        record_lookup('context', hit=False)
+        return None
+
+    context = _from_dict(entry.get('context') or {})
+    record_lookup('context', hit=context is not None)
+    return context
+
+
+def store_context(path: Path, context: ContextInfo, stamp: Optional[List[Optional[int]]] = None) -> None:
+    """Save a detected context.
+
+    Args:
+        path: Resolved directory path
+        context: Detected context
+        stamp: Stamp taken before detection (defaults to the current stamp)
+    """
+    entries = _load()
+    entries.pop(str(path), None)
+    entries[str(path)] = {
+        't': time.time(),
+        'stamp': stamp if stamp is not None else get_stamp(path),
+        'context': _to_dict(context),
+    }
+
+    # Entries are kept in insertion order, so the oldest come first
+    for key in list(entries)[:max(0, len(entries) - MAX_ENTRIES)]:
+        del entries[key]
+    atomic_write_json(get_cache_path(), entries)
+
+
+def detect_context_cached(path: Optional[Path] = None) -> ContextInfo:
+    """Detect the context for a directory, using the persistent cache.
+
+    Args:
+        path: Directory to analyze. Defaults to current working directory.
+
+    Returns:
+        ContextInfo (from the cache when still valid)
+    """
+    current_path = (path or Path.cwd()).resolve()
+
+    context = get_cached_context(current_path)
+    if context is None:
+        # Stamp first: a change during detection then invalidates the entry
+        stamp = get_stamp(current_path)
+        context = detect_context(current_path)
+        store_context(current_path, context, stamp)
+    return context
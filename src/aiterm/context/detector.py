@@ -7,9 +7,12 @@ Ported from zsh/iterm2-integration.zsh.
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Dict, Optional
 import subprocess
 
+from aiterm.context.index import get_index
+from aiterm.git.repo import find_repo
+
 
 class ContextType(Enum):
     """Project/context types that can be detected."""
@@ -49,6 +52,13 @@ class ContextInfo:
             return f"{self.icon} {self.name}{git_info}"
         return f"{self.name}{git_info}"
 
+    @property
+    def label(self) -> str:
+        """Context type with its icon (e.g. "🐍 python")."""
+        if self.icon:
+            return f"{self.icon} {self.type.value}"
+        return self.type.value
+
 
 # Mapping of context types to iTerm2 profiles and icons
 CONTEXT_CONFIG: Dict[ContextType, Dict[str, str]] = {
@@ -68,46 +78,25 @@ CONTEXT_CONFIG: Dict[ContextType, Dict[str, str]] = {
 def get_git_info(path: Path) -> tuple[Optional[str], bool]:
     """Get git branch name and dirty status.
 
+    Branch (or tag for a detached HEAD) is read straight from ``.git``;
+    only the dirty check runs git.
+
     Returns:
         Tuple of (branch_name, is_dirty). branch_name is None if not a git repo.
     """
-    git_dir = path / ".git"
-    if not git_dir.exists():
-        # Check if we're in a subdirectory of a git repo
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode != 0:
-                return None, False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return None, False
-
-    # Get branch name
+    repo = find_repo(path)
+    if repo is None:
+        return None, False
+
     try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        branch: Optional[str] = result.stdout.strip()
-
-        # If no branch (detached HEAD), try to get tag or show "detached"
-        if not branch:
-            result = subprocess.run(
-                ["git", "describe", "--tags", "--exact-match"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            branch = result.stdout.strip() if result.returncode == 0 else "detached"
+        branch: Optional[str] = None
+        if repo.is_supported:
+            try:
+                branch = repo.branch() or repo.tag_for(repo.head_oid()) or "detached"
+            except LookupError:
+                pass  # Tag object is packed; git peels it
+        if branch is None:
+            branch = _get_branch_via_git(path)
 
         # Truncate long branch names
         if branch and len(branch) > 20:
@@ -129,36 +118,29 @@ def get_git_info(path: Path) -> tuple[Optional[str], bool]:
         return None, False
 
 
-def _read_file_field(
-    path: Path, pattern: str, delimiter: str = " ", field: int = 1
-) -> Optional[str]:
-    """Read a field from a file matching a pattern."""
-    try:
-        content: str = path.read_text()
-        for line in content.splitlines():
-            if line.startswith(pattern):
-                parts: list[str] = line.split(delimiter, field + 1)
-                if len(parts) > field:
-                    return parts[field].strip().strip('"').strip("'")
-    except (OSError, UnicodeDecodeError):
-        pass
-    return None
-
-
-def _get_json_field(path: Path, field: str) -> Optional[str]:
-    """Get a field from a JSON file."""
-    try:
-        import json
+def _get_branch_via_git(path: Path) -> str:
+    """Get branch name (or tag/"detached") by running git."""
+    result = subprocess.run(
+        ["git", "branch", "--show-current"],
+        cwd=path,
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+    branch = result.stdout.strip()
+
+    # If no branch (detached HEAD), try to get tag or show "detached"
+    if not branch:
+        result = subprocess.run(
+            ["git", "describe", "--tags", "--exact-match"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+        branch = result.stdout.strip() if result.returncode == 0 else "detached"
 
-        content: Any = json.loads(path.read_text())
-        if not isinstance(content, dict):
-            return None
-        value = content.get(field)
-        if isinstance(value, str):
-            return value
-        return None
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return branch
 
 
 def detect_context(path: Optional[Path] = None) -> ContextInfo:
@@ -176,6 +158,9 @@ def detect_context(path: Optional[Path] = None) -> ContextInfo:
     name: str = current_path.name
     context_type: ContextType = ContextType.DEFAULT
 
+    # One directory listing answers every marker-file check below
+    index = get_index(current_path)
+
     # Get git info first (used for all types)
     branch: Optional[str]
     is_dirty: bool
@@ -191,57 +176,33 @@ def detect_context(path: Optional[Path] = None) -> ContextInfo:
         context_type = ContextType.AI_SESSION
 
     # Priority 3: MCP server detection
-    elif (current_path / "mcp-server").is_dir() or (
-        "mcp" in path_str and (current_path / "package.json").exists()
-    ):
+    elif index.has_dir("mcp-server") or ("mcp" in path_str and index.has("package.json")):
         context_type = ContextType.MCP_SERVER
 
-    # Priority 4: Specific project types
-    elif (current_path / "DESCRIPTION").exists():
-        # R package
+    # Priority 4: Specific project types (named from their marker file)
+    elif index.has("DESCRIPTION"):
         context_type = ContextType.R_PACKAGE
-        pkg_name: Optional[str] = _read_file_field(
-            current_path / "DESCRIPTION", "Package:", ":", 1
-        )
-        if pkg_name:
-            name = pkg_name
+        name = index.project_name
 
-    elif (current_path / "pyproject.toml").exists():
-        # Python project
+    elif index.has("pyproject.toml"):
         context_type = ContextType.PYTHON
-        # Try to get project name from pyproject.toml
-        proj_name: Optional[str] = _read_file_field(
-            current_path / "pyproject.toml", "name", "=", 1
-        )
-        if proj_name:
-            name = proj_name
+        name = index.project_name
 
-    elif (current_path / "package.json").exists():
-        # Node.js project
+    elif index.has("package.json"):
         context_type = ContextType.NODE
-        pkg_name = _get_json_field(current_path / "package.json", "name")
-        if pkg_name:
-            name = pkg_name
+        name = index.project_name
 
-    elif (current_path / "_quarto.yml").exists():
-        # Quarto project
+    elif index.has("_quarto.yml"):
         context_type = ContextType.QUARTO
-        title: Optional[str] = _read_file_field(
-            current_path / "_quarto.yml", "title:", ":", 1
-        )
-        if title:
-            name = title
+        name = index.project_name
 
-    elif any(
-        (current_path / f).exists()
-        for f in ["Cask", ".dir-locals.el", "init.el", "early-init.el"]
-    ):
+    elif index.has("Cask", ".dir-locals.el", "init.el", "early-init.el"):
         # Emacs project
         context_type = ContextType.EMACS
 
-    elif (current_path / ".git").is_dir() and any(
-        (current_path / d).is_dir() for d in ["commands", "scripts"]
-    ) or ((current_path / "bin").is_dir() and (current_path / "Makefile").exists()):
+    elif index.has_dir(".git") and index.has_dir("commands", "scripts") or (
+        index.has_dir("bin") and index.has("Makefile")
+    ):
         # Dev tools project
         context_type = ContextType.DEV_TOOLS
 
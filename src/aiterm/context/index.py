@@ -0,0 +1,201 @@
+"""Directory fingerprint index for project detection.
+
+Context detection (``ait detect``/``ait switch``) and the statusLine
+project segment ask many questions about the same directory: does it
+have a DESCRIPTION, pyproject.toml, package.json, tests/ ...? Each
+``exists()`` is a stat, and marker files were re-read for every answer.
+
+A DirectoryIndex lists the directory once with ``os.scandir`` and answers
+every marker question from that listing. Indexes are cached per process
+and reused while the directory's mtime is unchanged (adding, removing or
+renaming an entry bumps it). Marker file contents are cached separately
+by the file's own (mtime, size), since editing a file in place leaves
+the directory mtime alone.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Directories modified this recently are rescanned on every lookup: a
+# change within the same mtime tick would otherwise go unnoticed
+RACY_NS = 2_000_000_000
+
+# Cached indexes kept per process (oldest dropped first)
+MAX_INDEXES = 256
+
+
+class DirectoryIndex:
+    """One directory listing plus cached marker file contents.
+
+    Attributes:
+        path: Directory path
+        mtime_ns: Directory mtime when listed (None if it does not exist)
+        entries: Entry name -> True for directories, False for other entries
+    """
+
+    def __init__(self, path: Path):
+        """List a directory.
+
+        Args:
+            path: Directory to index
+        """
+        self.path = path
+        self.entries: Dict[str, bool] = {}
+        self._texts: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+        self.scanned_ns = time.time_ns()
+        try:
+            self.mtime_ns: Optional[int] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        self.entries[entry.name] = entry.is_dir()
+                    except OSError:
+                        self.entries[entry.name] = False
+        except OSError:
+            self.mtime_ns = None
+
+    def is_current(self, mtime_ns: Optional[int]) -> bool:
+        """Check whether the listing still matches the directory."""
+        if mtime_ns is None or mtime_ns != self.mtime_ns:
+            return False
+        return mtime_ns + RACY_NS < self.scanned_ns
+
+    def has(self, *names: str) -> bool:
+        """Check whether any of the entries exist."""
+        return any(name in self.entries for name in names)
+
+    def has_dir(self, *names: str) -> bool:
+        """Check whether any of the entries exist and are directories."""
+        return any(self.entries.get(name, False) for name in names)
+
+    def has_file(self, *names: str) -> bool:
+        """Check whether any of the entries exist and are not directories."""
+        return any(self.entries.get(name) is False for name in names)
+
+    def with_suffix(self, suffix: str) -> List[str]:
+        """Get entry names ending with a suffix (e.g. '.Rcheck')."""
+        return [name for name in self.entries if name.endswith(suffix)]
+
+    def read_text(self, name: str) -> Optional[str]:
+        """Read a file in the directory, cached by its mtime and size.
+
+        Args:
+            name: File name
+
+        Returns:
+            File contents, or None if missing or unreadable
+        """
+        if not self.has_file(name):
+            return None
+        file_path = self.path / name
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._texts.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            text: Optional[str] = file_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            text = None
+        self._texts[name] = (stamp, text)
+        return text
+
+    def read_field(self, name: str, pattern: str, delimiter: str = " ", field: int = 1) -> Optional[str]:
+        """Read a field from the first line of a file starting with a pattern.
+
+        Args:
+            name: File name
+            pattern: Line prefix (e.g. 'Package:')
+            delimiter: Field delimiter
+            field: Field index after splitting
+
+        Returns:
+            Field value with whitespace and quotes stripped, or None
+        """
+        text = self.read_text(name)
+        if text is None:
+            return None
+        for line in text.splitlines():
+            if line.startswith(pattern):
+                parts = line.split(delimiter, field + 1)
+                if len(parts) > field:
+                    return parts[field].strip().strip('"').strip("'")
+        return None
+
+    def json_field(self, name: str, field: str) -> Optional[str]:
+        """Get a string field from a JSON object file."""
+        text = self.read_text(name)
+        if text is None:
+            return None
+        try:
+            content: Any = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(content, dict):
+            return None
+        value = content.get(field)
+        return value if isinstance(value, str) else None
+
+    @property
+    def project_name(self) -> str:
+        """Get the project name from the first marker file present.
+
+        DESCRIPTION (Package:), pyproject.toml (name), package.json (name)
+        and _quarto.yml (title:) are checked in that order; the directory
+        name is used when the marker has no name or none exists.
+        """
+        name: Optional[str] = None
+        if self.has('DESCRIPTION'):
+            name = self.read_field('DESCRIPTION', 'Package:', ':', 1)
+        elif self.has('pyproject.toml'):
+            name = self.read_field('pyproject.toml', 'name', '=', 1)
+        elif self.has('package.json'):
+            name = self.json_field('package.json', 'name')
+        elif self.has('_quarto.yml'):
+            name = self.read_field('_quarto.yml', 'title:', ':', 1)
+        return name or self.path.name
+
+
+_INDEXES: Dict[str, DirectoryIndex] = {}
+_LOCK = threading.Lock()  # statusLine segments look up indexes from worker threads
+
+
+def get_index(path: Union[str, Path]) -> DirectoryIndex:
+    """Get the index for a directory, rescanning only when it changed.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        DirectoryIndex (empty if the directory does not exist)
+    """
+    key = str(path)
+    try:
+        mtime_ns: Optional[int] = os.stat(key).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    index = _INDEXES.get(key)
+    if index is not None and index.is_current(mtime_ns):
+        return index
+
+    index = DirectoryIndex(Path(path))
+    with _LOCK:
+        _INDEXES.pop(key, None)
+        _INDEXES[key] = index
+        while len(_INDEXES) > MAX_INDEXES:
+            del _INDEXES[next(iter(_INDEXES))]
+    return index
+
+
+def clear_indexes() -> None:
+    """Drop all cached indexes."""
+    with _LOCK:
+        _INDEXES.clear()
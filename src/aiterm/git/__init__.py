@@ -0,0 +1,6 @@
+"""Git repository inspection shared by the statusLine and context detection."""
+
+from aiterm.git.repo import GitRepo, find_repo
+from aiterm.git.status import GitStatus, parse_porcelain_v2, read_status
+
+__all__ = ["GitRepo", "GitStatus", "find_repo", "parse_porcelain_v2", "read_status"]
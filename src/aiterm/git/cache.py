@@ -0,0 +1,148 @@
+"""Disk cache of git status snapshots shared across statusLine invocations.
+
+Snapshots are keyed by git directory and stamped with the (mtime, size) of
+the files git updates when repository state changes:
+
+    <git_dir>/index, <git_dir>/HEAD        # Staging, checkout, commit
+    <common_dir>/packed-refs               # Packed branch/tag updates
+    <common_dir>/refs/heads/<branch>       # Commit on current branch
+    <common_dir>/refs/remotes/<upstream>   # Fetch (ahead/behind)
+    <common_dir>/logs/refs/stash           # Stash push/pop
+    <common_dir>/worktrees                 # Worktree add/remove
+    <worktree root>                        # Files added/removed at top level
+
+While the stamp matches, renders reuse the snapshot without running git.
+Edits to tracked files don't touch ``.git``, so snapshots also expire
+after a short TTL (``performance.git_cache_ttl``). A snapshot taken with
+a different untracked cap is not reused.
+"""
+
+import os
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import List, Optional
+
+from aiterm.git.repo import GitRepo, find_repo
+from aiterm.git.status import GitStatus, read_status
+from aiterm.utils.cache import atomic_write_json, get_cache_dir, read_json, record_lookup
+
+CACHE_FILE = 'git-status.json'
+
+# Keep snapshots for this many repositories
+MAX_ENTRIES = 32
+
+DEFAULT_TTL = 5
+
+_STATUS_FIELDS = {f.name for f in fields(GitStatus)}
+
+
+def _file_stamp(path: Path) -> List[int]:
+    """Get [mtime_ns, size] of a path ([0, 0] if missing)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [0, 0]
+    return [st.st_mtime_ns, st.st_size]
+
+
+def get_stamp(repo: GitRepo, cwd: str) -> List[List[int]]:
+    """Build the invalidation stamp for a repository.
+
+    Args:
+        repo: Repository reader
+        cwd: Directory the status is read for
+
+    Returns:
+        List of [mtime_ns, size] pairs
+    """
+    paths = [
+        repo.git_dir / 'index',
+        repo.git_dir / 'HEAD',
+        repo.common_dir / 'packed-refs',
+        repo.common_dir / 'logs' / 'refs' / 'stash',
+        repo.common_dir / 'worktrees',
+        repo.work_tree or Path(cwd),
+    ]
+
+    target = repo.read_symbolic_ref('HEAD')
+    if target:
+        paths.append(repo.common_dir / target)
+
+    upstream = repo.upstream()
+    if upstream:
+        paths.append(repo.common_dir / 'refs' / 'remotes' / upstream)
+
+    return [_file_stamp(p) for p in paths]
+
+
+def read_status_cached(
+    cwd: str,
+    ttl: float = DEFAULT_TTL,
+    untracked_cap: int = 0,
+    untracked_cache: bool = False,
+    collapse_untracked_dirs: bool = False
+) -> Optional[GitStatus]:
+    """Read a status snapshot, reusing the cached one while it is fresh.
+
+    Args:
+        cwd: Directory inside the working tree
+        ttl: Max snapshot age in seconds (0 disables the cache)
+        untracked_cap: Stop counting untracked files past this many (see read_status)
+        untracked_cache: Enable git's untracked cache (see read_status)
+        collapse_untracked_dirs: Count untracked directories once (see read_status)
+
+    Returns:
+        GitStatus or None if not in a git repository
+    """
+    if ttl <= 0:
+        return read_status(cwd, untracked_cap, untracked_cache, collapse_untracked_dirs)
+
+    repo = find_repo(cwd)
+    if repo is None:
+        return None
+    if not repo.is_supported:
+        return read_status(cwd, untracked_cap, untracked_cache, collapse_untracked_dirs)
+
+    path = get_cache_dir() / CACHE_FILE
+    key = str(repo.git_dir)
+    stamp = get_stamp(repo, cwd)
+    now = time.time()
+
+    entries = read_json(path)
+    if not isinstance(entries, dict):
+        entries = {}
+
+    entry = entries.get(key)
+    if (
+        isinstance(entry, dict)
+        and entry.get('stamp') == stamp
+        and entry.get('cap', 0) == untracked_cap
+        and entry.get('collapse', False) == collapse_untracked_dirs
+        and now - entry.get('time', 0) < ttl
+    ):
+        data = {k: v for k, v in entry.get('status', {}).items() if k in _STATUS_FIELDS}
+        record_lookup('git_status', hit=True)
+        return GitStatus(**data)
+
+    record_lookup('git_status', hit=False)
+    status = read_status(cwd, untracked_cap, untracked_cache, collapse_untracked_dirs)
+    if status is None:
+        return None
+
+    # git status may refresh the index, so stamp what it left behind
+    entries.pop(key, None)
+    entries[key] = {
+        'stamp': get_stamp(repo, cwd),
+        'time': now,
+        'cap': untracked_cap,
+        'collapse': collapse_untracked_dirs,
+        'status': asdict(status),
+    }
+
+    # Drop least recently refreshed repositories
+    while len(entries) > MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+
+    atomic_write_json(path, entries)
+    return status
@@ -0,0 +1,439 @@
+"""Zero-fork git repository metadata reader.
+
+Reads branch, HEAD, refs, worktree, stash and upstream information straight
+from the ``.git`` directory, so callers that only need metadata (not
+working tree status) never start a git process.
+
+Layout handled:
+    <git_dir>/HEAD                      # Per-worktree HEAD
+    <git_dir>/commondir                 # Linked worktree -> common dir
+    <common_dir>/refs/..., packed-refs  # Loose and packed refs
+    <common_dir>/worktrees/<name>/      # Linked worktree admin dirs
+    <common_dir>/logs/refs/stash        # Stash reflog (one line per entry)
+    <common_dir>/config                 # branch.<name>.remote/merge
+
+Repositories the reader cannot interpret (e.g. the reftable ref backend)
+report ``is_supported = False`` so callers fall back to running git.
+"""
+
+import os
+import re
+import subprocess
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Maximum symbolic ref / tag peeling depth
+MAX_REF_DEPTH = 5
+
+# Seconds before giving up on the git worktree list fallback
+GIT_TIMEOUT = 5
+
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+
+class GitRepo:
+    """Metadata reader for one working tree of a git repository."""
+
+    def __init__(
+        self,
+        git_dir: Path,
+        common_dir: Optional[Path] = None,
+        work_tree: Optional[Path] = None
+    ):
+        """Initialize reader.
+
+        Args:
+            git_dir: Git directory of this working tree
+            common_dir: Shared git directory (defaults to git_dir)
+            work_tree: Top-level directory of the working tree (if known)
+        """
+        self.git_dir = git_dir
+        self.common_dir = common_dir or git_dir
+        self.work_tree = work_tree
+        self._packed_refs: Optional[Dict[str, Tuple[str, Optional[str]]]] = None
+        self._config: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def is_supported(self) -> bool:
+        """Check whether refs can be read without git (files backend)."""
+        return not (self.common_dir / 'reftable').is_dir()
+
+    @property
+    def is_worktree(self) -> bool:
+        """Check whether this is a linked worktree (not the main one)."""
+        return self.git_dir != self.common_dir
+
+    @property
+    def worktree_name(self) -> Optional[str]:
+        """Get linked worktree name, or None for the main working directory."""
+        return self.git_dir.name if self.is_worktree else None
+
+    @property
+    def is_bare(self) -> bool:
+        """Check core.bare in the repository config."""
+        return self._get_config('core', 'bare', 'false').lower() == 'true'
+
+    # -- Refs -------------------------------------------------------------
+
+    def _read_ref_file(self, name: str) -> Optional[str]:
+        """Read a loose ref (per-worktree refs first, then shared refs)."""
+        per_worktree = name == 'HEAD' or name.startswith(('refs/worktree/', 'refs/bisect/'))
+        base = self.git_dir if per_worktree else self.common_dir
+        try:
+            return (base / name).read_text().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _get_packed_refs(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Parse packed-refs into {refname: (oid, peeled_oid)}."""
+        if self._packed_refs is None:
+            refs: Dict[str, Tuple[str, Optional[str]]] = {}
+            try:
+                content = (self.common_dir / 'packed-refs').read_text()
+            except (OSError, UnicodeDecodeError):
+                content = ''
+
+            last = None
+            for line in content.splitlines():
+                if not line or line.startswith('#'):
+                    continue
+                if line.startswith('^'):
+                    if last:
+                        refs[last] = (refs[last][0], line[1:].strip())
+                    continue
+                oid, _, name = line.partition(' ')
+                refs[name] = (oid, None)
+                last = name
+            self._packed_refs = refs
+        return self._packed_refs
+
+    def read_symbolic_ref(self, name: str = 'HEAD') -> Optional[str]:
+        """Get the ref a symbolic ref points to.
+
+        Args:
+            name: Ref name (e.g. "HEAD")
+
+        Returns:
+            Target ref name (e.g. "refs/heads/main") or None if not symbolic
+        """
+        value = self._read_ref_file(name)
+        if value and value.startswith('ref:'):
+            return value[4:].strip()
+        return None
+
+    def resolve_ref(self, name: str) -> Optional[str]:
+        """Resolve a ref name to an object id.
+
+        Args:
+            name: Full ref name (e.g. "HEAD", "refs/heads/main")
+
+        Returns:
+            Object id or None if the ref does not exist (e.g. unborn branch)
+        """
+        for _ in range(MAX_REF_DEPTH):
+            value = self._read_ref_file(name)
+            if value is None:
+                packed = self._get_packed_refs().get(name)
+                return packed[0] if packed else None
+            if not value.startswith('ref:'):
+                return value or None
+            name = value[4:].strip()
+        return None
+
+    def branch(self) -> Optional[str]:
+        """Get the current branch name.
+
+        Returns:
+            Branch name or None if HEAD is detached
+        """
+        target = self.read_symbolic_ref('HEAD')
+        if target and target.startswith('refs/heads/'):
+            return target[len('refs/heads/'):]
+        return None
+
+    def head_oid(self) -> Optional[str]:
+        """Get the commit HEAD points to (None for an unborn branch)."""
+        return self.resolve_ref('HEAD')
+
+    def _iter_tags(self) -> List[Tuple[str, str, Optional[str]]]:
+        """List tags as (name, oid, peeled_oid), loose refs overriding packed."""
+        tags = {
+            name: value
+            for name, value in self._get_packed_refs().items()
+            if name.startswith('refs/tags/')
+        }
+
+        tags_dir = self.common_dir / 'refs' / 'tags'
+        for dirpath, _dirnames, filenames in os.walk(tags_dir):
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                name = path.relative_to(self.common_dir).as_posix()
+                try:
+                    tags[name] = (path.read_text().strip(), None)
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+        return [
+            (name[len('refs/tags/'):], oid, peeled)
+            for name, (oid, peeled) in sorted(tags.items())
+        ]
+
+    def _peel_loose_tag(self, oid: str) -> Optional[str]:
+        """Peel an annotated tag object stored as a loose object.
+
+        Raises:
+            LookupError: A tag object is packed (only git can peel it)
+        """
+        for _ in range(MAX_REF_DEPTH):
+            try:
+                raw = zlib.decompress((self.common_dir / 'objects' / oid[:2] / oid[2:]).read_bytes())
+            except FileNotFoundError:
+                raise LookupError(oid) from None
+            except (OSError, zlib.error):
+                return None
+            header, _, body = raw.partition(b'\0')
+            if not header.startswith(b'tag '):
+                return oid
+            first_line = body.split(b'\n', 1)[0]
+            if not first_line.startswith(b'object '):
+                return None
+            oid = first_line[len(b'object '):].decode('ascii', errors='replace')
+        return None
+
+    def tag_for(self, oid: Optional[str]) -> Optional[str]:
+        """Get a tag pointing at a commit (like ``git describe --exact-match``).
+
+        Args:
+            oid: Commit object id
+
+        Returns:
+            Tag name or None
+
+        Raises:
+            LookupError: No tag matched, but a loose tag ref points at a
+                packed tag object (the usual state after ``git fetch``),
+                so callers must ask git
+        """
+        if not oid:
+            return None
+        unresolved = False
+        for name, tag_oid, peeled in self._iter_tags():
+            if oid in (tag_oid, peeled):
+                return name
+            if peeled is None:
+                try:
+                    if self._peel_loose_tag(tag_oid) == oid:
+                        return name
+                except LookupError:
+                    unresolved = True
+        if unresolved:
+            raise LookupError(oid)
+        return None
+
+    # -- Stash, config, worktrees ----------------------------------------
+
+    def stash_count(self) -> int:
+        """Get number of stash entries from the stash reflog."""
+        try:
+            with open(self.common_dir / 'logs' / 'refs' / 'stash', 'rb') as f:
+                return sum(1 for line in f if line.strip())
+        except OSError:
+            return 0
+
+    def _load_config(self) -> Dict[str, Dict[str, str]]:
+        """Parse the repository config into {section: {key: value}}.
+
+        Section keys are ``section`` or ``section "subsection"`` with the
+        section lowercased; variable names are lowercased. Include
+        directives are not followed.
+        """
+        if self._config is None:
+            config: Dict[str, Dict[str, str]] = {}
+            try:
+                content = (self.common_dir / 'config').read_text()
+            except (OSError, UnicodeDecodeError):
+                content = ''
+
+            section = ''
+            for raw_line in content.splitlines():
+                line = raw_line.strip()
+                if not line or line[0] in '#;':
+                    continue
+                match = _SECTION_RE.match(line)
+                if match:
+                    name, sub = match.group(1).lower(), match.group(2)
+                    section = f'{name} "{sub}"' if sub is not None else name
+                    config.setdefault(section, {})
+                    continue
+                key, sep, value = line.partition('=')
+                value = value.split(' #')[0].split(' ;')[0].strip().strip('"') if sep else 'true'
+                config.setdefault(section, {})[key.strip().lower()] = value
+            self._config = config
+        return self._config
+
+    def _get_config(self, section: str, key: str, default: str = '') -> str:
+        """Get a config value (section may include a quoted subsection)."""
+        return self._load_config().get(section, {}).get(key, default)
+
+    def upstream(self, branch: Optional[str] = None) -> Optional[str]:
+        """Get the upstream of a branch from branch.<name>.remote/merge.
+
+        Args:
+            branch: Branch name (defaults to current branch)
+
+        Returns:
+            Upstream short name (e.g. "origin/main") or None
+        """
+        branch = branch or self.branch()
+        if not branch:
+            return None
+
+        section = f'branch "{branch}"'
+        remote = self._get_config(section, 'remote')
+        merge = self._get_config(section, 'merge')
+        if not remote or not merge:
+            return None
+
+        short = merge[len('refs/heads/'):] if merge.startswith('refs/heads/') else merge
+        if remote == '.':
+            return short
+        return f'{remote}/{short}'
+
+    def worktrees(self) -> List[Dict[str, object]]:
+        """List all worktrees (main first), like ``git worktree list --porcelain``.
+
+        Returns:
+            List of dicts with path, head (oid), branch (full ref or "") and bare
+        """
+        main = GitRepo(self.common_dir) if self.is_worktree else self
+        if main.is_bare:
+            entries: List[Dict[str, object]] = [
+                {'path': self.common_dir, 'head': '', 'branch': '', 'bare': True}
+            ]
+        else:
+            entries = [_worktree_entry(main, self.main_worktree_path())]
+
+        admin_root = self.common_dir / 'worktrees'
+        try:
+            admin_dirs = sorted(p for p in admin_root.iterdir() if p.is_dir())
+        except OSError:
+            admin_dirs = []
+
+        for admin_dir in admin_dirs:
+            try:
+                gitdir = (admin_dir / 'gitdir').read_text().strip()
+            except (OSError, UnicodeDecodeError):
+                continue
+            linked = GitRepo(admin_dir, self.common_dir)
+            entries.append(_worktree_entry(linked, Path(gitdir).parent))
+
+        return entries
+
+    def main_worktree_path(self) -> Path:
+        """Get the top-level directory of the main working tree.
+
+        Uses the known working tree when this is the main one, then
+        ``core.worktree``, then the usual ``<worktree>/.git`` layout.
+        Submodules (``.git/modules/<name>``) and ``--separate-git-dir``
+        repositories without ``core.worktree`` are resolved by git.
+
+        Returns:
+            Main working tree path
+        """
+        if not self.is_worktree and self.work_tree is not None:
+            return self.work_tree
+
+        core_worktree = self._get_config('core', 'worktree')
+        if core_worktree:
+            return (self.common_dir / core_worktree).resolve()
+
+        if self.common_dir.name == '.git':
+            return self.common_dir.parent
+
+        cwd = self.work_tree or self.git_dir
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(cwd), 'worktree', 'list', '--porcelain'],
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT
+            )
+        except (OSError, subprocess.SubprocessError):
+            result = None
+        if result is not None and result.returncode == 0:
+            first = result.stdout.partition('\n')[0]
+            if first.startswith('worktree '):
+                return Path(first[len('worktree '):])
+        return self.common_dir.parent
+
+    def worktree_count(self) -> int:
+        """Get total number of worktrees (including main)."""
+        try:
+            linked = [p for p in (self.common_dir / 'worktrees').iterdir() if (p / 'gitdir').is_file()]
+        except OSError:
+            linked = []
+        return 1 + len(linked)
+
+
+def _worktree_entry(repo: GitRepo, path: Path) -> Dict[str, object]:
+    """Build a worktree list entry for a working tree."""
+    return {
+        'path': path,
+        'head': repo.head_oid() or '',
+        'branch': repo.read_symbolic_ref('HEAD') or '',
+        'bare': False,
+    }
+
+
+def find_repo(cwd) -> Optional[GitRepo]:
+    """Find the repository containing a directory.
+
+    Honors GIT_DIR like git does; otherwise walks up looking for ``.git``
+    (a directory, or a ``gitdir:`` file for linked worktrees/submodules).
+
+    Args:
+        cwd: Directory inside the working tree
+
+    Returns:
+        GitRepo or None if not inside a repository
+    """
+    env_dir = os.environ.get('GIT_DIR')
+    if env_dir:
+        return _open_git_dir(Path(cwd) / env_dir, None)
+
+    try:
+        current = Path(cwd).resolve()
+    except OSError:
+        return None
+
+    for directory in (current, *current.parents):
+        dot_git = directory / '.git'
+        try:
+            if dot_git.is_dir():
+                return _open_git_dir(dot_git, directory)
+            if dot_git.is_file():
+                content = dot_git.read_text().strip()
+                if content.startswith('gitdir:'):
+                    return _open_git_dir(directory / content[len('gitdir:'):].strip(), directory)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    return None
+
+
+def _open_git_dir(git_dir: Path, work_tree: Optional[Path]) -> Optional[GitRepo]:
+    """Open a git directory, resolving its common dir."""
+    try:
+        git_dir = git_dir.resolve()
+        if not (git_dir / 'HEAD').is_file():
+            return None
+
+        common_dir = git_dir
+        commondir_file = git_dir / 'commondir'
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return GitRepo(git_dir, common_dir, work_tree)
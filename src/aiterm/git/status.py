@@ -0,0 +1,267 @@
+"""Single-pass git status engine.
+
+Runs one ``git status --porcelain=v2 --branch --show-stash`` and parses it
+into a typed snapshot. Branch, upstream, ahead/behind, change counts and
+stash count all come from that one process; worktree and tag information
+is read straight from the git directory (see aiterm.git.repo).
+
+Porcelain v2 format (see ``git help status``):
+    # branch.oid <commit> | (initial)
+    # branch.head <branch> | (detached)
+    # branch.upstream <upstream>
+    # branch.ab +<ahead> -<behind>
+    # stash <count>
+    1 <XY> ...                  # Ordinary changed entry
+    2 <XY> ...                  # Renamed or copied entry
+    u <XY> ...                  # Unmerged entry
+    ? <path>                    # Untracked
+    ! <path>                    # Ignored
+
+git lists untracked files only after it has scanned the whole working
+tree, so with ``--untracked-files=all`` the scan of a large untracked
+data directory costs as much as the directory is big. Opting in with
+``collapse_untracked_dirs`` runs status with ``--untracked-files=normal``:
+git stops at the top of an untracked directory and lists it once, so the
+count is of untracked files and directories. Untracked entries come after
+all changed entries, and git is stopped once the count passes the cap.
+git's own ``core.untrackedCache`` and ``core.fsmonitor`` settings are
+honoured, and ``read_status(untracked_cache=True)`` turns the untracked
+cache on for the call.
+"""
+
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from aiterm.git.repo import find_repo
+from aiterm.utils.tracing import note_read
+
+# Seconds before giving up on git status
+STATUS_TIMEOUT = 5
+
+
+@dataclass
+class GitStatus:
+    """Snapshot of a repository's working tree state."""
+
+    branch: Optional[str] = None
+    oid: Optional[str] = None
+    upstream: Optional[str] = None
+    ahead: int = 0
+    behind: int = 0
+    staged: int = 0
+    unstaged: int = 0
+    untracked: int = 0
+    untracked_capped: bool = False
+    conflicted: int = 0
+    stash: int = 0
+    tag: Optional[str] = None
+    git_dir: Optional[str] = None
+    worktree_count: int = 1
+
+    @property
+    def is_detached(self) -> bool:
+        """Check whether HEAD is detached."""
+        return self.branch is None
+
+    @property
+    def has_changes(self) -> bool:
+        """Check for staged, unstaged or conflicted changes (not untracked)."""
+        return bool(self.staged or self.unstaged or self.conflicted)
+
+    @property
+    def is_worktree(self) -> bool:
+        """Check whether this is a linked worktree (not the main one)."""
+        return self.git_dir is not None and '/worktrees/' in self.git_dir
+
+    @property
+    def worktree_name(self) -> Optional[str]:
+        """Get linked worktree name, or None for the main working directory."""
+        if self.is_worktree:
+            return Path(self.git_dir).name
+        return None
+
+    @property
+    def display_branch(self) -> str:
+        """Get branch for display: branch name, tag, or "detached"."""
+        return self.branch or self.tag or "detached"
+
+
+def parse_porcelain_v2(output: Union[str, Iterable[str]], untracked_cap: int = 0) -> GitStatus:
+    """Parse ``git status --porcelain=v2 --branch --show-stash`` output.
+
+    Args:
+        output: Raw stdout from git status, or an iterable of its lines
+        untracked_cap: Stop reading once more untracked files than this
+            are seen (0 = count them all)
+
+    Returns:
+        GitStatus with branch and change fields populated
+    """
+    status = GitStatus()
+    lines = output.splitlines() if isinstance(output, str) else output
+
+    for line in lines:
+        line = line.rstrip('\n')
+        if not line:
+            continue
+
+        if line.startswith('# '):
+            key, _, value = line[2:].partition(' ')
+            if key == 'branch.oid':
+                status.oid = None if value == '(initial)' else value
+            elif key == 'branch.head':
+                status.branch = None if value == '(detached)' else value
+            elif key == 'branch.upstream':
+                status.upstream = value
+            elif key == 'branch.ab':
+                ahead, _, behind = value.partition(' ')
+                status.ahead = _parse_count(ahead.lstrip('+'))
+                status.behind = _parse_count(behind.lstrip('-'))
+            elif key == 'stash':
+                status.stash = _parse_count(value)
+            continue
+
+        kind = line[0]
+        if kind in ('1', '2'):
+            xy = line[2:4]
+            if xy[:1] != '.':
+                status.staged += 1
+            if xy[1:2] != '.':
+                status.unstaged += 1
+        elif kind == 'u':
+            status.conflicted += 1
+        elif kind == '?':
+            if untracked_cap and status.untracked >= untracked_cap:
+                status.untracked_capped = True
+                break
+            status.untracked += 1
+
+    return status
+
+
+def _parse_count(value: str) -> int:
+    """Parse a non-negative count, defaulting to 0."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _describe_tag(cwd: str) -> Optional[str]:
+    """Get the tag pointing at HEAD via git (fallback for unsupported repos)."""
+    try:
+        result = subprocess.run(
+            ['git', '-C', cwd, 'describe', '--tags', '--exact-match'],
+            capture_output=True,
+            text=True,
+            timeout=STATUS_TIMEOUT
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _run_status(
+    cwd: str,
+    untracked_cap: int,
+    untracked_cache: bool,
+    collapse_untracked_dirs: bool
+) -> Optional[GitStatus]:
+    """Run git status and parse its output as it streams in.
+
+    Returns:
+        GitStatus, or None if git failed or timed out
+    """
+    command = ['git', '-C', cwd]
+    if untracked_cache:
+        command += ['-c', 'core.untrackedCache=true']
+    # Collapsed untracked directories are listed once instead of walked
+    untracked = 'normal' if collapse_untracked_dirs else 'all'
+    command += ['status', '--porcelain=v2', '--branch', '--show-stash', f'--untracked-files={untracked}']
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+
+    # Bytes of output consumed (reported to an active trace span)
+    read = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal read
+        for raw in process.stdout:
+            read += len(raw)
+            yield raw.decode('utf-8', errors='replace')
+
+    timer = threading.Timer(STATUS_TIMEOUT, process.kill)
+    timer.start()
+    try:
+        status = parse_porcelain_v2(lines(), untracked_cap)
+        note_read(read)
+        if status.untracked_capped:
+            process.kill()  # The remaining entries are not needed
+        process.stdout.close()
+        returncode = process.wait()
+    finally:
+        timer.cancel()
+
+    if returncode != 0 and not status.untracked_capped:
+        return None
+    return status
+
+
+def read_status(
+    cwd: str,
+    untracked_cap: int = 0,
+    untracked_cache: bool = False,
+    collapse_untracked_dirs: bool = False
+) -> Optional[GitStatus]:
+    """Read the full status snapshot for a directory.
+
+    Args:
+        cwd: Directory inside the working tree
+        untracked_cap: Stop counting untracked files past this many; the
+            snapshot is then marked ``untracked_capped`` (0 = no cap)
+        untracked_cache: Enable git's untracked cache for this call (git
+            stores it in the index, which speeds up later scans)
+        collapse_untracked_dirs: Count an untracked directory once instead
+            of every file in it (git then does not walk it)
+
+    Returns:
+        GitStatus or None if not in a git repository (or git unavailable)
+    """
+    # Outside a repository there is nothing to ask git
+    repo = find_repo(cwd)
+    if repo is None:
+        return None
+
+    status = _run_status(cwd, untracked_cap, untracked_cache, collapse_untracked_dirs)
+    if status is None:
+        return None
+
+    status.git_dir = str(repo.git_dir)
+    status.worktree_count = repo.worktree_count()
+
+    if not repo.is_supported:
+        if status.is_detached:
+            status.tag = _describe_tag(cwd)
+        return status
+
+    # git < 2.35 has no "# stash" header
+    if not status.stash:
+        status.stash = repo.stash_count()
+    if status.is_detached:
+        try:
+            status.tag = repo.tag_for(status.oid)
+        except LookupError:
+            status.tag = _describe_tag(cwd)
+
+    return status
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+from aiterm.claude.settings import read_settings
+
 
 @dataclass
 class MCPServer:
@@ -49,22 +51,13 @@ class MCPManager:
         """
         servers = []
 
-        if not self.settings_path.exists():
-            return servers
-
-        # Load settings
-        try:
-            settings = json.loads(self.settings_path.read_text())
-        except (json.JSONDecodeError, OSError):
-            return servers
-
-        # Extract MCP servers
-        mcp_servers = settings.get("mcpServers", {})
+        # Shared read-only view, parsed once per change of the file
+        mcp_servers = read_settings(self.settings_path).get("mcpServers", {})
 
         for name, config in mcp_servers.items():
             command = config.get("command", "")
-            args = config.get("args", [])
-            env = config.get("env", {})
+            args = list(config.get("args", []))
+            env = dict(config.get("env", {}))
 
             servers.append(MCPServer(
                 name=name,
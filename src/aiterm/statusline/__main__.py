@@ -0,0 +1,27 @@
+"""Render the statusLine in-process: ``python -m aiterm.statusline``.
+
+The Claude Code statusLine command runs once per refresh, so start-up
+time is the cost that matters. This path (and ``ait statusline render``,
+which aiterm.cli.entry routes here) imports only the renderer, its
+segments, config and themes; typer, rich and the CLI modules are never
+loaded. tests/test_statusline_entry.py enforces an import-time budget.
+"""
+
+import sys
+
+from aiterm.statusline.client import render_local
+
+
+def main() -> int:
+    """Read Claude Code's JSON from stdin and print the statusLine.
+
+    Returns:
+        Exit code
+    """
+    sys.stdout.write(render_local(sys.stdin.read()))
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,14 +2,247 @@
 
 This module detects running Task agents launched via run_in_background.
 
-Current implementation uses process detection as a placeholder.
+Agents are kept in a small registry per session
+(~/.cache/aiterm/agents/<session>.json) instead of being rediscovered on
+every render:
+
+- Tracking directories (see AgentDetector.get_locations) are watched by
+  polling their mtime. A directory is only listed again when an agent
+  file was added or removed since the last scan.
+- Hooks can record agents directly as events:
+
+      python -m aiterm.statusline.agents start <session> <agent> [--pid PID]
+      python -m aiterm.statusline.agents stop <session> <agent>
+
+Liveness is checked in-process with ``os.kill(pid, 0)``, so a render costs
+one state file read, a stat per tracking directory and a signal check per
+known agent. Every read-modify-write of a state file holds the shared
+``agents/registry.lock``, so hooks starting agents at the same time (or
+during a render) do not drop each other's events. State files are only
+written once something changes; writing a new one drops those untouched
+for PRUNE_AGE, so finished sessions do not pile up.
+
 Future improvements could parse transcript files or use Claude Code's internal API.
 """
 
 from pathlib import Path
-from typing import Optional
-import subprocess
+from typing import Any, Dict, List, Optional
+import os
 import re
+import subprocess
+import sys
+import time
+
+from aiterm.utils.cache import atomic_write_json, file_lock, get_cache_dir, read_json
+
+AGENTS_DIR = 'agents'
+
+# Lock shared by every session's state file
+LOCK_FILE = 'registry.lock'
+
+# Seconds to wait for the registry lock
+LOCK_TIMEOUT = 2.0
+
+# Session state files untouched this long are removed (seconds)
+PRUNE_AGE = 7 * 24 * 3600
+
+# Directories modified this recently are listed again on the next render:
+# a PID file may have been created but not yet written
+RACY_NS = 2_000_000_000
+
+
+def is_pid_alive(pid: int) -> bool:
+    """Check whether a process exists (signal 0, no subprocess).
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        True if the process exists
+    """
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    except OSError:
+        return False
+    return True
+
+
+def _read_pid(agent_file: Path) -> Optional[int]:
+    """Read the PID from a tracking file (None for non-PID files).
+
+    Returns:
+        PID, 0 if a .pid file is unreadable or invalid, None for other files
+    """
+    if agent_file.suffix != '.pid':
+        return None
+    try:
+        return int(agent_file.read_text().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+class AgentRegistry:
+    """Known background agents of one session, kept in one state file.
+
+    State layout::
+
+        {"dirs": {"<dir>": [mtime_ns, scanned_ns]},
+         "files": {"<dir>": {"<file>": pid or null}},
+         "events": {"<agent>": pid or null}}
+    """
+
+    def __init__(self, session_id: str, locations: Optional[List[Path]] = None):
+        """Initialize registry.
+
+        Args:
+            session_id: Claude Code session ID
+            locations: Tracking directories to watch (defaults to
+                AgentDetector.get_locations)
+        """
+        self.session_id = session_id
+        self.locations = locations if locations is not None else AgentDetector.get_locations(session_id)
+        safe_id = re.sub(r'[^A-Za-z0-9._-]', '_', session_id)
+        self.path = get_cache_dir() / AGENTS_DIR / f"{safe_id}.json"
+        self.lock_path = self.path.parent / LOCK_FILE
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the session's state."""
+        state = read_json(self.path)
+        if not isinstance(state, dict):
+            state = {}
+        for key in ('dirs', 'files', 'events'):
+            if not isinstance(state.get(key), dict):
+                state[key] = {}
+        return state
+
+    def _save(self, state: Dict[str, Any]) -> None:
+        """Write the session's state (pruning stale sessions on first write)."""
+        if not self.path.exists():
+            _prune_states(self.path.parent, PRUNE_AGE)
+        atomic_write_json(self.path, state)
+
+    def _sync_locations(self, state: Dict[str, Any]) -> bool:
+        """Rescan tracking directories whose mtime changed.
+
+        Returns:
+            True if the state changed
+        """
+        changed = False
+        for location in self.locations:
+            key = str(location)
+            try:
+                mtime_ns: Optional[int] = os.stat(location).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            seen = state['dirs'].get(key)
+            if mtime_ns is None:
+                if seen is not None or key in state['files']:
+                    state['dirs'].pop(key, None)
+                    state['files'].pop(key, None)
+                    changed = True
+                continue
+            if isinstance(seen, list) and seen[0] == mtime_ns and mtime_ns + RACY_NS < seen[1]:
+                continue
+
+            files = {}
+            try:
+                with os.scandir(location) as it:
+                    for entry in it:
+                        if entry.name.endswith('.pid') or entry.name.startswith('agent-'):
+                            files[entry.name] = _read_pid(Path(entry.path))
+            except OSError:
+                pass
+            state['dirs'][key] = [mtime_ns, time.time_ns()]
+            state['files'][key] = files
+            changed = True
+        return changed
+
+    def running_count(self) -> int:
+        """Count running agents (events and tracking files).
+
+        Only the first tracking directory (in ``locations`` order) that has
+        agent files is counted, as a full scan does.
+
+        Returns:
+            Number of running agents
+        """
+        with file_lock(self.lock_path, LOCK_TIMEOUT):
+            state = self._load()
+            changed = self._sync_locations(state)
+
+            count = 0
+            for location in self.locations:
+                files = state['files'].get(str(location))
+                if files:
+                    count += sum(1 for pid in files.values() if pid is None or is_pid_alive(pid))
+                    break
+
+            # Agents recorded by events are dropped once their process is gone
+            for agent_id, pid in list(state['events'].items()):
+                if pid is None or is_pid_alive(pid):
+                    count += 1
+                else:
+                    del state['events'][agent_id]
+                    changed = True
+
+            if changed:
+                self._save(state)
+        return count
+
+    def start(self, agent_id: str, pid: Optional[int] = None) -> None:
+        """Record a started agent.
+
+        Args:
+            agent_id: Agent identifier (unique within the session)
+            pid: Agent process ID (without one the agent counts until stopped)
+        """
+        with file_lock(self.lock_path, LOCK_TIMEOUT):
+            state = self._load()
+            state['events'][agent_id] = pid
+            self._save(state)
+
+    def stop(self, agent_id: str) -> None:
+        """Record a finished agent.
+
+        Args:
+            agent_id: Agent identifier
+        """
+        with file_lock(self.lock_path, LOCK_TIMEOUT):
+            state = self._load()
+            if agent_id in state['events']:
+                del state['events'][agent_id]
+                self._save(state)
+
+    def clear(self) -> None:
+        """Forget the session's state."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def _prune_states(directory: Path, max_age: float) -> None:
+    """Remove session files in the registry directory untouched for max_age seconds."""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name == LOCK_FILE:
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
 
 
 class AgentDetector:
@@ -19,6 +252,22 @@ class AgentDetector:
         """Initialize agent detector."""
         pass
 
+    @staticmethod
+    def get_locations(session_id: str) -> List[Path]:
+        """Get the directories where agent tracking files may appear.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Candidate directories
+        """
+        return [
+            Path.home() / '.claude' / 'sessions' / session_id / 'agents',
+            Path.home() / '.claude' / 'agents' / session_id,
+            Path(f'/tmp/claude-agents-{session_id}'),
+        ]
+
     def get_running_count(self, session_id: Optional[str] = None) -> int:
         """Get count of running background agents.
 
@@ -28,10 +277,11 @@ class AgentDetector:
         Returns:
             Number of running agents (0 if detection unavailable)
         """
-        # PLACEHOLDER: Multiple detection strategies
+        if not session_id:
+            return 0
 
-        # Strategy 1: Check for agent tracking files
-        count = self._check_agent_files(session_id)
+        # Strategy 1: Session registry (events + watched tracking files)
+        count = AgentRegistry(session_id).running_count()
         if count > 0:
             return count
 
@@ -45,7 +295,7 @@ class AgentDetector:
         return 0
 
     def _check_agent_files(self, session_id: Optional[str]) -> int:
-        """Check for agent tracking files.
+        """Check for agent tracking files (full scan, bypassing the registry).
 
         Claude Code may create files to track background agents.
 
@@ -58,14 +308,7 @@ class AgentDetector:
         if not session_id:
             return 0
 
-        # Check common locations for agent tracking
-        possible_locations = [
-            Path.home() / '.claude' / 'sessions' / session_id / 'agents',
-            Path.home() / '.claude' / 'agents' / session_id,
-            Path(f'/tmp/claude-agents-{session_id}'),
-        ]
-
-        for location in possible_locations:
+        for location in self.get_locations(session_id):
             if location.exists() and location.is_dir():
                 # Count agent PID files or status files (use set to avoid duplicates)
                 agent_files = list(set(location.glob('*.pid')) | set(location.glob('agent-*')))
@@ -88,23 +331,11 @@ class AgentDetector:
         Returns:
             True if agent is running, False otherwise
         """
-        # If it's a PID file, check if process is alive
-        if agent_file.suffix == '.pid':
-            try:
-                pid = int(agent_file.read_text().strip())
-                # Check if process exists (works on Unix-like systems)
-                subprocess.run(
-                    ['kill', '-0', str(pid)],
-                    capture_output=True,
-                    check=True
-                )
-                return True
-            except (ValueError, subprocess.CalledProcessError, FileNotFoundError):
-                return False
+        pid = _read_pid(agent_file)
 
         # For other files, assume they exist = agent running
         # (Future: parse file content for status)
-        return True
+        return pid is None or is_pid_alive(pid)
 
     def _check_processes(self) -> int:
         """Check process tree for agent processes.
@@ -166,3 +397,36 @@ def format_agent_display(count: int, compact: bool = True) -> str:
     else:
         plural = "s" if count > 1 else ""
         return f"{count} agent{plural}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Hook entry point: record agent start/stop events.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m aiterm.statusline.agents',
+        description='Record background agent events for the statusLine',
+    )
+    parser.add_argument('event', choices=['start', 'stop'], help='Event type')
+    parser.add_argument('session', help='Claude Code session ID')
+    parser.add_argument('agent', help='Agent identifier')
+    parser.add_argument('--pid', type=int, default=None, help='Agent process ID')
+    parsed = parser.parse_args(argv)
+
+    registry = AgentRegistry(parsed.session)
+    if parsed.event == 'start':
+        registry.start(parsed.agent, parsed.pid)
+    else:
+        registry.stop(parsed.agent)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
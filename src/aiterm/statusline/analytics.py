@@ -0,0 +1,463 @@
+"""Token, tool and cost analytics from Claude Code session transcripts.
+
+Claude Code only hands the statusLine the current context window, and the
+cost-tracker hook relies on environment variables. The transcript has the
+full picture: every assistant message carries its model and token usage,
+and tool calls are recorded as ``tool_use`` content blocks.
+
+A TranscriptAnalyzer follows one transcript with a TranscriptReader and
+folds new records into running SessionStats. The reader offset and the
+totals are checkpointed together in ~/.cache/aiterm/analytics/, so each
+render (and ``ait sessions stats``) parses only the lines appended since
+the previous run instead of the whole history. Renders never build the
+first checkpoint themselves (see get_resumed_stats); a detached builder
+does, off the render path:
+
+    python -m aiterm.statusline.analytics <transcript>
+
+Costs are estimates from list prices per model family (MODEL_PRICES).
+"""
+
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aiterm.statusline.transcript import TranscriptReader, parse_timestamp
+from aiterm.utils.cache import atomic_write_json, get_cache_dir, read_json
+
+ANALYTICS_DIR = 'analytics'
+
+# Bump when SessionStats changes meaning (old checkpoints are discarded)
+CHECKPOINT_VERSION = 1
+
+# USD per million tokens: (input, output, cache write, cache read). The
+# first entry whose key occurs in the model id wins, so specific model
+# generations come before their family.
+MODEL_PRICES: Tuple[Tuple[str, Tuple[float, float, float, float]], ...] = (
+    ('opus-4-5', (5.0, 25.0, 6.25, 0.50)),
+    ('opus', (15.0, 75.0, 18.75, 1.50)),
+    ('sonnet', (3.0, 15.0, 3.75, 0.30)),
+    ('haiku-4-5', (1.0, 5.0, 1.25, 0.10)),
+    ('haiku', (0.80, 4.0, 1.0, 0.08)),
+)
+
+# Context window assumed when Claude Code does not report one
+DEFAULT_CONTEXT_WINDOW = 200_000
+
+# Analyzers kept per process (oldest dropped first)
+MAX_ANALYZERS = 32
+
+# Don't start another checkpoint build for a transcript within this many seconds
+BUILD_GRACE = 30
+
+
+def get_model_prices(model: str) -> Optional[Tuple[float, float, float, float]]:
+    """Get per-million-token prices for a model id (None if unknown)."""
+    model = model.lower()
+    for key, prices in MODEL_PRICES:
+        if key in model:
+            return prices
+    return None
+
+
+def _usage_tokens(usage: Dict[str, Any]) -> List[int]:
+    """Get [input, output, cache write, cache read] tokens from a usage block."""
+    tokens = []
+    for name in ('input_tokens', 'output_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens'):
+        value = usage.get(name)
+        tokens.append(value if isinstance(value, int) and not isinstance(value, bool) else 0)
+    return tokens
+
+
+def _usage_cost(model: str, tokens: List[int]) -> float:
+    """Estimate the cost of one message's tokens in USD."""
+    prices = get_model_prices(model)
+    if prices is None:
+        return 0.0
+    return sum(count * price for count, price in zip(tokens, prices)) / 1_000_000
+
+
+@dataclass
+class SessionStats:
+    """Running totals for one transcript.
+
+    Attributes:
+        messages: Assistant messages
+        prompts: User prompts (tool results are not counted)
+        input_tokens: Uncached input tokens
+        output_tokens: Output tokens
+        cache_creation_tokens: Tokens written to the prompt cache
+        cache_read_tokens: Tokens read from the prompt cache
+        cost_usd: Estimated cost
+        context_tokens: Context used by the latest main-thread message
+        tool_calls: Tool name -> calls
+        models: Model id -> assistant messages
+        first_timestamp: Epoch seconds of the first timed record
+        last_timestamp: Epoch seconds of the latest timed record
+    """
+
+    messages: int = 0
+    prompts: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+    cost_usd: float = 0.0
+    context_tokens: int = 0
+    tool_calls: Dict[str, int] = field(default_factory=dict)
+    models: Dict[str, int] = field(default_factory=dict)
+    first_timestamp: Optional[float] = None
+    last_timestamp: Optional[float] = None
+    # Claude Code writes one record per content block, each repeating the
+    # message's usage: remember the last message so it is counted once
+    last_message: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        """All input, output and cache tokens."""
+        return self.input_tokens + self.output_tokens + self.cache_creation_tokens + self.cache_read_tokens
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one transcript record into the totals.
+
+        Args:
+            record: Parsed transcript record
+        """
+        timestamp = parse_timestamp(record)
+        if timestamp is not None:
+            if self.first_timestamp is None:
+                self.first_timestamp = timestamp
+            self.last_timestamp = timestamp
+
+        message = record.get('message')
+        if not isinstance(message, dict):
+            return
+
+        if record.get('type') == 'user':
+            content = message.get('content')
+            if isinstance(content, str) or (
+                isinstance(content, list)
+                and not any(isinstance(b, dict) and b.get('type') == 'tool_result' for b in content)
+            ):
+                self.prompts += 1
+            return
+
+        if record.get('type') != 'assistant':
+            return
+
+        message_id = message.get('id')
+        repeated = message_id is not None and message_id == self.last_message.get('id')
+
+        content = message.get('content')
+        if isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict) and block.get('type') == 'tool_use':
+                    name = str(block.get('name') or 'unknown')
+                    self.tool_calls[name] = self.tool_calls.get(name, 0) + 1
+
+        usage = message.get('usage')
+        if not isinstance(usage, dict):
+            return
+
+        model = str(message.get('model') or 'unknown')
+        tokens = _usage_tokens(usage)
+        cost = _usage_cost(model, tokens)
+        if repeated:
+            # Replace the earlier record's contribution (same message)
+            previous = self.last_message.get('tokens', [0, 0, 0, 0])
+            delta = [new - old for new, old in zip(tokens, previous)]
+            cost_delta = cost - self.last_message.get('cost', 0.0)
+        else:
+            delta, cost_delta = tokens, cost
+            self.messages += 1
+            self.models[model] = self.models.get(model, 0) + 1
+
+        self.input_tokens += delta[0]
+        self.output_tokens += delta[1]
+        self.cache_creation_tokens += delta[2]
+        self.cache_read_tokens += delta[3]
+        self.cost_usd += cost_delta
+        self.last_message = {'id': message_id, 'tokens': tokens, 'cost': cost}
+
+        if not record.get('isSidechain'):
+            self.context_tokens = tokens[0] + tokens[2] + tokens[3]
+
+    def merge(self, other: 'SessionStats') -> None:
+        """Add another session's totals (for reports across sessions)."""
+        self.messages += other.messages
+        self.prompts += other.prompts
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cost_usd += other.cost_usd
+        for name, count in other.tool_calls.items():
+            self.tool_calls[name] = self.tool_calls.get(name, 0) + count
+        for model, count in other.models.items():
+            self.models[model] = self.models.get(model, 0) + count
+        if other.first_timestamp is not None:
+            if self.first_timestamp is None or other.first_timestamp < self.first_timestamp:
+                self.first_timestamp = other.first_timestamp
+        if other.last_timestamp is not None:
+            if self.last_timestamp is None or other.last_timestamp > self.last_timestamp:
+                self.last_timestamp = other.last_timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the checkpoint file."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionStats':
+        """Rebuild from a checkpoint (unknown keys are ignored)."""
+        known = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        return cls(**known)
+
+
+def get_checkpoint_path(transcript_path: str) -> Path:
+    """Get the checkpoint file for a transcript (named after its session)."""
+    stem = re.sub(r'[^A-Za-z0-9._-]', '_', Path(transcript_path).stem) or 'transcript'
+    return get_cache_dir() / ANALYTICS_DIR / f"{stem}.json"
+
+
+class TranscriptAnalyzer:
+    """Keeps SessionStats for one transcript up to date, incrementally.
+
+    Attributes:
+        path: Transcript path
+        stats: Totals up to the reader's offset
+    """
+
+    def __init__(self, path: str):
+        """Initialize analyzer, resuming from its checkpoint when valid.
+
+        Args:
+            path: Transcript path
+        """
+        self.path = path
+        self.stats = SessionStats()
+        self._reader = TranscriptReader(path, from_start=True)
+        self._lock = threading.Lock()
+
+        checkpoint = read_json(get_checkpoint_path(path))
+        if (
+            isinstance(checkpoint, dict)
+            and checkpoint.get('version') == CHECKPOINT_VERSION
+            and checkpoint.get('path') == path
+        ):
+            try:
+                stats = SessionStats.from_dict(checkpoint['stats'])
+                offset = int(checkpoint['offset'])
+                identity = (int(checkpoint['identity'][0]), int(checkpoint['identity'][1]))
+            except (KeyError, IndexError, TypeError, ValueError):
+                return
+            self.stats = stats
+            self._reader.restore(offset, identity)
+
+    @property
+    def offset(self) -> int:
+        """Bytes of the transcript already folded into the stats."""
+        return self._reader.offset
+
+    def update(self) -> SessionStats:
+        """Fold records appended since the last update into the stats.
+
+        Returns:
+            Current stats (reset if the transcript was replaced or truncated)
+        """
+        with self._lock:
+            resets = self._reader.resets
+            offset = self._reader.offset
+            records = self._reader.poll()
+
+            if self._reader.resets != resets:
+                self.stats = SessionStats()
+            for record in records:
+                self.stats.add(record)
+
+            if self._reader.offset != offset or self._reader.resets != resets:
+                self._save()
+            return self.stats
+
+    def _save(self) -> None:
+        """Checkpoint the offset and the totals together."""
+        identity = self._reader.identity
+        if identity is None:
+            return
+        atomic_write_json(get_checkpoint_path(self.path), {
+            'version': CHECKPOINT_VERSION,
+            'path': self.path,
+            'offset': self._reader.offset,
+            'identity': list(identity),
+            'stats': self.stats.to_dict(),
+        })
+
+
+_ANALYZERS: Dict[str, TranscriptAnalyzer] = {}
+_ANALYZERS_LOCK = threading.Lock()
+
+
+def get_analyzer(path: str) -> TranscriptAnalyzer:
+    """Get the shared analyzer for a transcript.
+
+    Args:
+        path: Transcript path
+
+    Returns:
+        TranscriptAnalyzer (created on first use)
+    """
+    with _ANALYZERS_LOCK:
+        analyzer = _ANALYZERS.get(path)
+        if analyzer is None:
+            analyzer = _ANALYZERS[path] = TranscriptAnalyzer(path)
+            while len(_ANALYZERS) > MAX_ANALYZERS:
+                del _ANALYZERS[next(iter(_ANALYZERS))]
+        return analyzer
+
+
+def get_session_stats(path: str) -> SessionStats:
+    """Get up-to-date stats for a transcript.
+
+    Args:
+        path: Transcript path
+
+    Returns:
+        SessionStats (empty if the transcript is missing)
+    """
+    return get_analyzer(path).update()
+
+
+def get_resumed_stats(path: str) -> Optional[SessionStats]:
+    """Get stats for a transcript only if they can resume from a checkpoint.
+
+    Render-path variant of get_session_stats. Without a checkpoint the
+    whole transcript would be parsed inline, so a detached builder is
+    started instead.
+
+    Args:
+        path: Transcript path
+
+    Returns:
+        SessionStats, or None until the checkpoint exists
+    """
+    with _ANALYZERS_LOCK:
+        analyzer = _ANALYZERS.get(path)
+    if analyzer is None or analyzer.offset == 0:
+        checkpoint = get_checkpoint_path(path)
+        if not checkpoint.exists():
+            if _claim_build(checkpoint.with_suffix('.pending')):
+                _spawn_builder(path)
+            return None
+        with _ANALYZERS_LOCK:
+            _ANALYZERS.pop(path, None)  # Resume from the builder's checkpoint
+    return get_session_stats(path)
+
+
+def _claim_build(pending_file: Path) -> bool:
+    """Claim a checkpoint build unless one started within BUILD_GRACE."""
+    try:
+        if time.time() - pending_file.stat().st_mtime < BUILD_GRACE:
+            return False
+    except OSError:
+        pass
+    try:
+        pending_file.parent.mkdir(parents=True, exist_ok=True)
+        pending_file.touch()
+    except OSError:
+        return False
+    return True
+
+
+def _spawn_builder(path: str) -> None:
+    """Start a detached process that builds a transcript's checkpoint."""
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'aiterm.statusline.analytics', path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def get_projects_dir() -> Path:
+    """Get the directory where Claude Code keeps per-project transcripts."""
+    return Path.home() / '.claude' / 'projects'
+
+
+def find_transcripts(days: Optional[float] = None, projects_dir: Optional[Path] = None) -> List[Path]:
+    """Find session transcripts, most recently modified first.
+
+    Args:
+        days: Only transcripts modified within this many days (all if None)
+        projects_dir: Transcript root (defaults to ~/.claude/projects)
+
+    Returns:
+        Transcript paths
+    """
+    root = projects_dir or get_projects_dir()
+    cutoff = time.time() - days * 86400 if days is not None else None
+
+    found: List[Tuple[float, Path]] = []
+    try:
+        project_dirs = [p for p in root.iterdir() if p.is_dir()]
+    except OSError:
+        return []
+    for project_dir in project_dirs:
+        for transcript in project_dir.glob('*.jsonl'):
+            try:
+                mtime = transcript.stat().st_mtime
+            except OSError:
+                continue
+            if cutoff is None or mtime >= cutoff:
+                found.append((mtime, transcript))
+
+    return [path for _, path in sorted(found, reverse=True)]
+
+
+def summarize(paths: Iterable[Path]) -> Dict[str, SessionStats]:
+    """Get stats for several transcripts, grouped by project directory.
+
+    Args:
+        paths: Transcript paths (see find_transcripts)
+
+    Returns:
+        Project directory name -> merged stats
+    """
+    projects: Dict[str, SessionStats] = {}
+    for path in paths:
+        stats = TranscriptAnalyzer(str(path)).update()
+        projects.setdefault(path.parent.name, SessionStats()).merge(stats)
+    return projects
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Builder entry point: bring transcript checkpoints up to date.
+
+    Args:
+        argv: Transcript paths (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print('usage: python -m aiterm.statusline.analytics <transcript>...', file=sys.stderr)
+        return 2
+    for path in paths:
+        TranscriptAnalyzer(path).update()
+        try:
+            get_checkpoint_path(path).with_suffix('.pending').unlink()
+        except OSError:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
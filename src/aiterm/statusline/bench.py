@@ -0,0 +1,436 @@
+"""Latency benchmark for statusLine rendering.
+
+Replays Claude Code stdin JSON payloads through ``StatusLineRenderer.render``
+inside synthetic repositories and reports p50/p95/p99 render times, per
+segment and in total, for cold renders (empty caches, fresh process state)
+and warm renders (caches populated, as in the render daemon).
+
+Scenarios:
+- nogit: plain directory, no repository
+- small: small committed repository
+- huge: repository with many committed files
+- untracked: small repository with many untracked files
+- worktrees: repository with many linked worktrees
+
+Results are JSON so runs can be diffed between aiterm versions:
+
+    ait statusline bench --output before.json
+    ait statusline bench --compare before.json
+
+Segment timings come from the render's RenderBudget, so a segment that
+overruns its budget is timed up to the point it was abandoned.
+
+Cold renders run in a child process (imports are not timed):
+
+    python -m aiterm.statusline.bench <config path> < payload.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from aiterm import __version__
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.renderer import StatusLineRenderer
+from aiterm.statusline.trace import percentile
+
+# Bump when the results layout changes
+RESULTS_VERSION = 1
+
+PERCENTILES = (50, 95, 99)
+
+# Built-in payloads modelled on real Claude Code statusLine input
+# (workspace paths are replaced with the scenario directory)
+DEFAULT_PAYLOADS: List[Dict[str, Any]] = [
+    {
+        "session_id": "bench-session",
+        "workspace": {"current_dir": "", "project_dir": ""},
+        "model": {"id": "claude-sonnet-4-5-20250929", "display_name": "Claude Sonnet 4.5"},
+        "output_style": {"name": "default"},
+        "cost": {
+            "total_cost_usd": 0.42,
+            "total_duration_ms": 1250000,
+            "total_lines_added": 156,
+            "total_lines_removed": 23,
+        },
+        "context_window": {
+            "context_window_size": 200000,
+            "current_usage": {"input_tokens": 45000, "output_tokens": 3200},
+        },
+    },
+    {
+        "session_id": "bench-session",
+        "workspace": {"current_dir": "", "project_dir": ""},
+        "model": {"id": "claude-opus-4-1", "display_name": "Claude Opus 4.1"},
+        "output_style": {"name": "learning"},
+        "cost": {"total_lines_added": 0, "total_lines_removed": 0},
+    },
+]
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command for scenario setup."""
+    subprocess.run(
+        ['git', *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            'GIT_AUTHOR_NAME': 'bench', 'GIT_AUTHOR_EMAIL': 'bench@example.com',
+            'GIT_COMMITTER_NAME': 'bench', 'GIT_COMMITTER_EMAIL': 'bench@example.com',
+        }
+    )
+
+
+def _write_files(root: Path, count: int, prefix: str = 'file') -> None:
+    """Write count small files spread over subdirectories."""
+    for i in range(count):
+        directory = root / f'{prefix}s' / f'{i // 500:03d}'
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f'{prefix}_{i}.py').write_text(f'VALUE = {i}\n')
+
+
+def _init_repo(path: Path, files: int) -> Path:
+    """Create a committed repository with a Python project layout."""
+    path.mkdir(parents=True)
+    _git(path, 'init', '-q', '-b', 'main')
+    (path / 'pyproject.toml').write_text('[project]\nname = "bench"\n')
+    _write_files(path, files)
+    _git(path, 'add', '-A')
+    _git(path, 'commit', '-q', '-m', 'initial')
+    return path
+
+
+def _scenario_nogit(path: Path, scale: float) -> Path:
+    """Plain directory outside any repository."""
+    path.mkdir(parents=True)
+    (path / 'notes.txt').write_text('bench\n')
+    return path
+
+
+def _scenario_small(path: Path, scale: float) -> Path:
+    """Small repository with one modified file."""
+    repo = _init_repo(path, 10)
+    (repo / 'files' / '000' / 'file_0.py').write_text('VALUE = -1\n')
+    return repo
+
+
+def _scenario_huge(path: Path, scale: float) -> Path:
+    """Repository with 20k committed files (at scale 1)."""
+    return _init_repo(path, max(1, int(20000 * scale)))
+
+
+def _scenario_untracked(path: Path, scale: float) -> Path:
+    """Small repository with 5k untracked files (at scale 1)."""
+    repo = _init_repo(path, 10)
+    _write_files(repo, max(1, int(5000 * scale)), prefix='untracked')
+    return repo
+
+
+def _scenario_worktrees(path: Path, scale: float) -> Path:
+    """Repository with 10 linked worktrees (at scale 1)."""
+    repo = _init_repo(path / 'main', 10)
+    for i in range(max(1, int(10 * scale))):
+        _git(repo, 'worktree', 'add', '-q', '-b', f'feature-{i}', str(path / f'wt-{i}'))
+    return repo
+
+
+SCENARIOS: Dict[str, Callable[[Path, float], Path]] = {
+    'nogit': _scenario_nogit,
+    'small': _scenario_small,
+    'huge': _scenario_huge,
+    'untracked': _scenario_untracked,
+    'worktrees': _scenario_worktrees,
+}
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize samples in seconds as milliseconds.
+
+    Args:
+        samples: Durations in seconds
+
+    Returns:
+        Dict with n, mean and p50/p95/p99 in ms
+    """
+    summary: Dict[str, float] = {'n': len(samples)}
+    summary['mean'] = round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0
+    for pct in PERCENTILES:
+        summary[f'p{pct}'] = round(percentile(samples, pct) * 1000, 3)
+    return summary
+
+
+def load_payloads(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Load recorded Claude Code payloads.
+
+    Args:
+        paths: JSON files, each holding one payload (or a list of payloads)
+
+    Returns:
+        Payload dicts
+
+    Raises:
+        ValueError: If a file is not a JSON object or list of objects
+    """
+    payloads = []
+    for path in paths:
+        data = json.loads(Path(path).read_text())
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                raise ValueError(f"{path}: payload must be a JSON object")
+            payloads.append(item)
+    return payloads
+
+
+def _payload_for(payload: Dict[str, Any], cwd: Path) -> str:
+    """Point a payload's workspace at the scenario directory."""
+    data = dict(payload)
+    data['workspace'] = {**(payload.get('workspace') or {}),
+                         'current_dir': str(cwd), 'project_dir': str(cwd)}
+    data.pop('transcript_path', None)
+    return json.dumps(data)
+
+
+class _Recorder:
+    """Collects total and per-segment samples for one phase."""
+
+    def __init__(self):
+        """Initialize empty sample lists."""
+        self.total: List[float] = []
+        self.segments: Dict[str, List[float]] = {}
+
+    def render(self, renderer: StatusLineRenderer, json_input: str) -> None:
+        """Render once and record timings."""
+        self.record(_timed_render(renderer, json_input))
+
+    def record(self, sample: Dict[str, Any]) -> None:
+        """Record one render's {"total": s, "segments": {name: s}}."""
+        self.total.append(sample['total'])
+        for name, elapsed in sample['segments'].items():
+            self.segments.setdefault(name, []).append(elapsed)
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize recorded samples."""
+        return {
+            'total': summarize(self.total),
+            'segments': {name: summarize(samples) for name, samples in sorted(self.segments.items())},
+        }
+
+
+def _timed_render(renderer: StatusLineRenderer, json_input: str) -> Dict[str, Any]:
+    """Render once and return the total and per-segment seconds."""
+    with contextlib.redirect_stdout(io.StringIO()):  # Window title
+        start = time.perf_counter()
+        renderer.render(json_input)
+        total = time.perf_counter() - start
+    return {'total': total, 'segments': dict(renderer.budget.timings)}
+
+
+def _cold_render(config: StatusLineConfig, json_input: str) -> Dict[str, Any]:
+    """Render once in a fresh interpreter (see main()).
+
+    Raises:
+        RuntimeError: If the child process fails
+    """
+    result = subprocess.run(
+        [sys.executable, '-m', 'aiterm.statusline.bench', str(config.config_path)],
+        input=json_input,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"cold render failed: {result.stderr.strip()[-200:]}")
+    return json.loads(result.stdout)
+
+
+def run_scenario(
+    name: str,
+    workdir: Path,
+    payloads: List[Dict[str, Any]],
+    iterations: int = 20,
+    cold_iterations: int = 5,
+    scale: float = 1.0,
+    config: Optional[StatusLineConfig] = None
+) -> Dict[str, Any]:
+    """Benchmark one scenario.
+
+    Args:
+        name: Scenario name (key of SCENARIOS)
+        workdir: Empty directory to build the scenario in
+        payloads: Payloads to replay (cycled)
+        iterations: Warm renders
+        cold_iterations: Cold renders (each in a fresh process with empty caches)
+        scale: Size multiplier for generated files/worktrees
+        config: Config to render with (defaults to the user's config)
+
+    Returns:
+        Dict with "cold" and "warm" summaries
+    """
+    cwd = SCENARIOS[name](workdir / name, scale)
+    inputs = [_payload_for(payload, cwd) for payload in payloads]
+    cache_dir = workdir / 'cache'
+    config = config or StatusLineConfig()
+
+    previous = os.environ.get('AITERM_CACHE_DIR')
+    os.environ['AITERM_CACHE_DIR'] = str(cache_dir)
+    try:
+        cold = _Recorder()
+        for i in range(cold_iterations):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.record(_cold_render(config, inputs[i % len(inputs)]))
+
+        warm = _Recorder()
+        renderer = StatusLineRenderer(config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            renderer.render(inputs[0])  # Populate caches (not recorded)
+        for i in range(iterations):
+            warm.render(renderer, inputs[i % len(inputs)])
+    finally:
+        if previous is None:
+            os.environ.pop('AITERM_CACHE_DIR', None)
+        else:
+            os.environ['AITERM_CACHE_DIR'] = previous
+
+    return {'cold': cold.summary(), 'warm': warm.summary()}
+
+
+def run_benchmark(
+    scenarios: Optional[List[str]] = None,
+    payloads: Optional[List[Dict[str, Any]]] = None,
+    iterations: int = 20,
+    cold_iterations: int = 5,
+    scale: float = 1.0,
+    config: Optional[StatusLineConfig] = None,
+    progress: Optional[Callable[[str], None]] = None
+) -> Dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        scenarios: Scenario names (defaults to all)
+        payloads: Payloads to replay (defaults to DEFAULT_PAYLOADS)
+        iterations: Warm renders per scenario
+        cold_iterations: Cold renders per scenario
+        scale: Size multiplier for generated files/worktrees
+        config: Config to render with (defaults to the user's config)
+        progress: Called with each scenario name before it runs
+
+    Returns:
+        Results dict (see write_results)
+
+    Raises:
+        ValueError: If a scenario name is unknown
+    """
+    scenarios = scenarios or list(SCENARIOS)
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {
+        'version': RESULTS_VERSION,
+        'aiterm_version': __version__,
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'timestamp': time.time(),
+        'params': {'iterations': iterations, 'cold_iterations': cold_iterations, 'scale': scale},
+        'scenarios': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='aiterm-bench-') as tmp:
+        for name in scenarios:
+            if progress:
+                progress(name)
+            results['scenarios'][name] = run_scenario(
+                name, Path(tmp), payloads or DEFAULT_PAYLOADS,
+                iterations=iterations, cold_iterations=cold_iterations,
+                scale=scale, config=config
+            )
+
+    return results
+
+
+def write_results(results: Dict[str, Any], path: Path) -> None:
+    """Write results as JSON.
+
+    Args:
+        results: Results from run_benchmark
+        path: Output file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + '\n')
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    metric: str = 'p50'
+) -> List[Dict[str, Any]]:
+    """Compare two result sets.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        metric: Summary field to compare (e.g. "p50", "p95")
+
+    Returns:
+        Rows with scenario, phase, name ("total" or segment), baseline,
+        current and change_pct (None when the baseline is 0 or missing)
+    """
+    rows = []
+    for scenario, phases in current.get('scenarios', {}).items():
+        for phase, summary in phases.items():
+            base_phase = baseline.get('scenarios', {}).get(scenario, {}).get(phase, {})
+            entries = [('total', summary['total'], base_phase.get('total'))]
+            entries += [
+                (name, seg, base_phase.get('segments', {}).get(name))
+                for name, seg in summary['segments'].items()
+            ]
+            for name, new, old in entries:
+                old_value = (old or {}).get(metric)
+                new_value = new.get(metric)
+                change = None
+                if old_value:
+                    change = round((new_value - old_value) / old_value * 100, 1)
+                rows.append({
+                    'scenario': scenario,
+                    'phase': phase,
+                    'name': name,
+                    'baseline': old_value,
+                    'current': new_value,
+                    'change_pct': change,
+                })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Cold render entry point: render stdin once and print its timings.
+
+    Args:
+        argv: [config path] (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        return 2
+
+    config = StatusLineConfig()
+    config.config_path = Path(argv[0])
+    sample = _timed_render(StatusLineRenderer(config), sys.stdin.read())
+    sys.stdout.write(json.dumps(sample))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
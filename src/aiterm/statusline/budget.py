@@ -0,0 +1,289 @@
+"""Concurrent segment evaluation with render time budgets.
+
+Segments are independent, so the renderer starts each one in a daemon
+thread up front and collects the results in display order: a render
+takes as long as the slowest segment rather than the sum of all of them.
+
+A hung ``git`` on a network filesystem or a slow usage API call must not
+stall the whole statusLine either. In the render daemon, the renderer
+waits at most the segment's budget (and never past the total render
+budget). A segment that overruns shows its last good output for the same
+arguments, or nothing, and the overrun is recorded in
+~/.cache/aiterm/overruns.json (see ``ait statusline overruns``).
+
+Budgets are only enforced in the daemon. A one-shot render process exits
+right after printing, which kills an abandoned segment before it can save
+anything (such as the git snapshot), and the last good output does not
+outlive the process: a segment slower than its budget would never be
+shown. One-shot renders therefore wait for every segment.
+
+Budgets come from statusline.json:
+
+    performance.render_budget_ms     Total budget for one render (0 = off)
+    performance.segment_budget_ms    Default per-segment budget
+    performance.<segment>_budget_ms  Per-segment override (git, project, usage)
+    performance.parallel_segments    Evaluate segments concurrently
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from aiterm.utils import tracing
+from aiterm.utils.cache import atomic_write_json, get_cache_dir, read_json
+
+OVERRUNS_FILE = 'overruns.json'
+
+# Last good output per (segment, key), shared by all renderers in the
+# process so the render daemon keeps it across config reloads
+_LAST_GOOD: Dict[Tuple[str, Hashable], Any] = {}
+
+# Segments whose previous run for the same key is still going (never
+# start a second one)
+_RUNNING: Dict[Tuple[str, Hashable], threading.Thread] = {}
+_LOCK = threading.Lock()
+
+
+class SegmentTask:
+    """A segment evaluation running in a background thread."""
+
+    def __init__(self, name: str, key: Hashable, trace: bool = False):
+        """Initialize task.
+
+        Args:
+            name: Segment name (used for budgets and overrun records)
+            key: Hashable key identifying the segment arguments
+            trace: Count subprocesses, bytes read and cache lookups
+        """
+        self.name = name
+        self.key = key
+        self.span: Optional[tracing.Span] = None
+        self.trace = trace
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.thread: Optional[threading.Thread] = None
+        # False when the segment was skipped without running
+        self.started_run = True
+
+    def run(self, func: Callable[..., Any], args: tuple) -> None:
+        """Thread body: evaluate the segment and store the result."""
+        if self.trace:
+            self.span = tracing.start_span()
+        try:
+            self.value = func(*args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            if self.trace:
+                tracing.end_span()
+            self.finished = time.monotonic()
+            self.done.set()
+            with _LOCK:
+                if self.thread is not None and _RUNNING.get((self.name, self.key)) is self.thread:
+                    del _RUNNING[(self.name, self.key)]
+
+
+class RenderBudget:
+    """Segment runner and deadline tracker for one statusLine render."""
+
+    def __init__(
+        self,
+        total_ms: int = 0,
+        segment_ms: int = 0,
+        overrides: Optional[Dict[str, int]] = None,
+        parallel: bool = False,
+        trace: bool = False
+    ):
+        """Initialize budget.
+
+        Args:
+            total_ms: Total budget for the render in ms (0 = no budgets)
+            segment_ms: Default per-segment budget in ms (0 = total only)
+            overrides: Per-segment budgets in ms keyed by segment name
+            parallel: Run segments in background threads even without budgets
+            trace: Count per-segment work (see aiterm.utils.tracing)
+        """
+        self.total_ms = total_ms
+        self.segment_ms = segment_ms
+        self.overrides = overrides or {}
+        self.parallel = parallel
+        self.trace = trace
+        # Seconds each collected segment ran (to completion or abandonment)
+        self.timings: Dict[str, float] = {}
+        # Collected tasks by segment name (spans and completion state)
+        self.tasks: Dict[str, SegmentTask] = {}
+        self.deadline = time.monotonic() + total_ms / 1000
+
+    @classmethod
+    def from_config(cls, config, trace: bool = False, enforce: bool = True) -> 'RenderBudget':
+        """Build a budget for one render from config.
+
+        Args:
+            config: StatusLineConfig instance
+            trace: Count per-segment work
+            enforce: Apply the configured budgets (False waits for every
+                segment, as one-shot render processes do)
+
+        Returns:
+            RenderBudget starting now
+        """
+        overrides = {}
+        for name in ('git', 'project', 'usage'):
+            value = config.get(f'performance.{name}_budget_ms')
+            if value is not None:
+                overrides[name] = value
+
+        return cls(
+            total_ms=config.get('performance.render_budget_ms', 0) if enforce else 0,
+            segment_ms=config.get('performance.segment_budget_ms', 0),
+            overrides=overrides,
+            parallel=config.get('performance.parallel_segments', True),
+            trace=trace
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether budgets are enforced."""
+        return self.total_ms > 0
+
+    def get_segment_budget(self, name: str) -> float:
+        """Get a segment's budget in seconds (0 = bounded by total only)."""
+        return self.overrides.get(name, self.segment_ms) / 1000
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        key: Hashable = None
+    ) -> SegmentTask:
+        """Start evaluating a segment in the background.
+
+        Args:
+            name: Segment name
+            func: Segment render callable
+            *args: Arguments for func
+            key: Cache key for the last good output (defaults to args)
+
+        Returns:
+            Running task; not started if the render budget is used up or the
+            previous run of this segment with the same key is still going
+            (treated as overrun)
+        """
+        task = SegmentTask(name, args if key is None else key, trace=self.trace)
+
+        if not self.enabled and not self.parallel:
+            task.run(func, args)
+            return task
+
+        if self.enabled and time.monotonic() >= self.deadline:
+            task.started_run = False
+            return task
+
+        with _LOCK:
+            previous = _RUNNING.get((name, task.key))
+            if previous is not None and previous.is_alive():
+                task.started_run = False
+                return task
+            task.thread = threading.Thread(
+                target=task.run, args=(func, args), name=f'segment-{name}', daemon=True
+            )
+            _RUNNING[(name, task.key)] = task.thread
+        task.thread.start()
+        return task
+
+    def collect(self, task: SegmentTask, default: Any = "") -> Any:
+        """Wait for a segment within its budget.
+
+        Args:
+            task: Task from submit()
+            default: Output when the segment overran and has no last good value
+
+        Returns:
+            Segment output, or its last good output / default on overrun
+
+        Raises:
+            Exception: Re-raises an error from the segment itself
+        """
+        name = task.name
+        try:
+            return self._collect(task, default)
+        finally:
+            self.tasks[name] = task
+            if task.started_run:
+                self.timings[name] = (task.finished or time.monotonic()) - task.started
+
+    def _collect(self, task: SegmentTask, default: Any) -> Any:
+        """Wait for a segment and pick its output (see collect())."""
+        name = task.name
+        if not task.started_run:
+            record_overrun(name, None, self.get_segment_budget(name))
+            return _LAST_GOOD.get((name, task.key), default)
+
+        if self.enabled:
+            timeout = self.deadline - time.monotonic()
+            segment_budget = self.get_segment_budget(name)
+            if segment_budget:
+                timeout = min(timeout, task.started + segment_budget - time.monotonic())
+
+            if not task.done.wait(max(timeout, 0)):
+                elapsed = time.monotonic() - task.started
+                record_overrun(name, elapsed, segment_budget)
+                return _LAST_GOOD.get((name, task.key), default)
+        else:
+            task.done.wait()
+
+        if task.error is not None:
+            raise task.error
+
+        _LAST_GOOD[(name, task.key)] = task.value
+        return task.value
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any, key: Hashable = None) -> Any:
+        """Evaluate a segment within its budget.
+
+        Args:
+            name: Segment name
+            func: Segment render callable
+            *args: Arguments for func
+            key: Cache key for the last good output (defaults to args)
+
+        Returns:
+            Segment output, or its last good output / "" on overrun
+        """
+        return self.collect(self.submit(name, func, *args, key=key))
+
+
+def record_overrun(name: str, elapsed: Optional[float], budget: float) -> None:
+    """Record a segment overrunning its budget.
+
+    Args:
+        name: Segment name
+        elapsed: Seconds the segment had run when abandoned (None = not
+            started: render budget used up or still busy from a previous render)
+        budget: Segment budget in seconds (0 = total budget only)
+    """
+    path = get_cache_dir() / OVERRUNS_FILE
+    overruns = read_json(path)
+    if not isinstance(overruns, dict):
+        overruns = {}
+
+    entry = overruns.setdefault(name, {'count': 0})
+    entry['count'] = entry.get('count', 0) + 1
+    entry['last_ms'] = None if elapsed is None else round(elapsed * 1000)
+    entry['budget_ms'] = round(budget * 1000)
+    entry['last_time'] = time.time()
+    atomic_write_json(path, overruns)
+
+
+def get_overruns() -> Dict[str, Dict[str, Any]]:
+    """Get recorded overruns.
+
+    Returns:
+        Dict mapping segment name to {"count", "last_ms", "budget_ms", "last_time"}
+    """
+    overruns = read_json(get_cache_dir() / OVERRUNS_FILE)
+    return overruns if isinstance(overruns, dict) else {}
@@ -0,0 +1,129 @@
+"""Thin statusLine client for Claude Code.
+
+Forwards the stdin JSON to the render daemon over its Unix socket and
+prints the reply. When no daemon is running (or it does not answer in
+time) the statusLine is rendered in-process instead, so the output is the
+same either way.
+
+Installed as the ``ait-statusline`` console script.
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+# Give up on the daemon after this long and render in-process
+CLIENT_TIMEOUT = 1.0
+
+# Environment variables segments read, sent with each request so the shared
+# daemon renders with the calling session's values
+FORWARDED_ENV = (
+    'PATH',
+    'CONDA_DEFAULT_ENV',
+    'VIRTUAL_ENV',
+    'ANTHROPIC_API_KEY',
+    'AITERM_TRACE',
+    'AITERM_TRACE_FILE',
+)
+
+
+def session_env() -> Dict[str, str]:
+    """Get the forwarded environment variables set in this process."""
+    return {key: os.environ[key] for key in FORWARDED_ENV if key in os.environ}
+
+
+def render_via_daemon(
+    json_input: str,
+    columns: Optional[int] = None,
+    socket_path: Optional[Path] = None,
+    timeout: float = CLIENT_TIMEOUT,
+    env: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """Render through the daemon.
+
+    Args:
+        json_input: JSON string from Claude Code
+        columns: Terminal width to render for
+        socket_path: Daemon socket (defaults to the daemon's standard path)
+        timeout: Seconds to wait for the daemon
+        env: Session environment to render with (defaults to session_env())
+
+    Returns:
+        Rendered output, or None if the daemon is unavailable
+    """
+    if socket_path is None:
+        from aiterm.statusline.daemon import get_socket_path
+        socket_path = get_socket_path()
+
+    if env is None:
+        env = session_env()
+
+    request = json.dumps({'input': json_input, 'columns': columns, 'env': env}).encode('utf-8')
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+        sock.sendall(request)
+        sock.shutdown(socket.SHUT_WR)
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    if not chunks:
+        return None
+    return b''.join(chunks).decode('utf-8', errors='replace')
+
+
+def render_local(json_input: str) -> str:
+    """Render in-process (fallback when the daemon is down).
+
+    Args:
+        json_input: JSON string from Claude Code
+
+    Returns:
+        Rendered statusLine (window title is written to stdout directly)
+    """
+    from aiterm.statusline.renderer import StatusLineRenderer
+
+    try:
+        return StatusLineRenderer(memoize=True).render(json_input)
+    except Exception as e:
+        return f"╭─ ⚠️  StatusLine Error\n╰─ {str(e)[:50]}"
+
+
+def _get_columns() -> int:
+    """Get terminal width the same way the renderer does."""
+    import shutil
+
+    try:
+        return shutil.get_terminal_size((120, 24)).columns
+    except (OSError, ValueError):
+        return 120
+
+
+def main() -> None:
+    """Entry point: read stdin, render via daemon or in-process, print."""
+    json_input = sys.stdin.read()
+
+    output = render_via_daemon(json_input, _get_columns())
+    if output is None:
+        output = render_local(json_input)
+
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,16 +2,79 @@
 
 This module handles loading, saving, and validating statusLine configuration.
 Configuration is stored at ~/.config/aiterm/statusline.json in XDG-compliant location.
+
+The file is parsed once per process into a shared snapshot: defaults
+merged, every dotted key (and key prefix) pre-flattened into one dict,
+and values validated against the schema. Instances reuse the snapshot for
+their path until the file's mtime/size changes, so ``get`` is a single
+dict lookup and constructing a config is cheap.
 """
 
+import copy
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 
 
+# Schema (built once per process, see StatusLineConfig._load_schema)
+_SCHEMA: Optional[dict] = None
+
+# Parsed config files by path (shared by all StatusLineConfig instances)
+_SNAPSHOTS: Dict[Path, '_ConfigSnapshot'] = {}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of a file, or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _flatten(config: dict, prefix: str = '', flat: Optional[dict] = None) -> dict:
+    """Flatten a nested config into {dotted key: value}, including prefixes."""
+    if flat is None:
+        flat = {}
+    for key, value in config.items():
+        dotted = f"{prefix}{key}"
+        flat[dotted] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{dotted}.", flat)
+    return flat
+
+
+class _ConfigSnapshot:
+    """Parsed, merged, flattened and validated config file."""
+
+    __slots__ = ('path', 'stamp', 'config', 'flat', 'errors')
+
+    def __init__(
+        self,
+        path: Path,
+        stamp: Optional[Tuple[int, int]],
+        config: dict,
+        errors: List[str],
+        flat: Optional[dict] = None
+    ):
+        self.path = path
+        self.stamp = stamp
+        self.config = config
+        self.flat = flat if flat is not None else _flatten(config)
+        self.errors = errors
+
+
 class StatusLineConfig:
     """Manages statusLine configuration."""
 
+    # Current snapshot and the config_path object it was taken for (class
+    # defaults so partially initialized instances work)
+    _snapshot: Optional[_ConfigSnapshot] = None
+    _snapshot_path: Optional[Path] = None
+
+    # Process-wide handle (see shared())
+    _shared: Optional['StatusLineConfig'] = None
+
     def __init__(self):
         """Initialize config manager."""
         # XDG-compliant config path
@@ -20,32 +83,47 @@ class StatusLineConfig:
         self._schema = self._load_schema()
         self._config = None
 
-    def load(self) -> dict:
-        """Load config with defaults.
+    @classmethod
+    def shared(cls) -> 'StatusLineConfig':
+        """Get the process-wide config handle for the default path.
+
+        Renderers and segments share it; call refresh() to pick up file
+        changes (one stat).
 
         Returns:
-            Configuration dict with all settings.
+            Shared StatusLineConfig instance
         """
-        if self._config is not None:
-            return self._config
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
 
-        if not self.config_path.exists():
-            self._config = self._get_defaults()
-            return self._config
+    @property
+    def stamp(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the config file the current values came from."""
+        return self._get_snapshot().stamp
 
-        try:
-            with open(self.config_path) as f:
-                user_config = json.load(f)
+    def refresh(self) -> bool:
+        """Reload the snapshot if the config file changed on disk.
 
-            # Merge with defaults (user config takes precedence)
-            defaults = self._get_defaults()
-            self._config = self._deep_merge(defaults, user_config)
-            return self._config
+        Returns:
+            True if the config was reloaded
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._snapshot_path is self.config_path:
+            if _file_stamp(self.config_path) == snapshot.stamp:
+                return False
+        self._snapshot = None
+        self._get_snapshot()
+        return True
 
-        except (json.JSONDecodeError, OSError) as e:
-            # If config file is invalid, return defaults
-            # Caller can check validate() to see the error
-            return self._get_defaults()
+    def load(self) -> dict:
+        """Load config with defaults.
+
+        Returns:
+            Configuration dict with all settings (a copy: the loaded config
+            is shared by every renderer in the process).
+        """
+        return copy.deepcopy(self._get_snapshot().config)
 
     def save(self, config: dict) -> None:
         """Save config to disk.
@@ -58,7 +136,8 @@ class StatusLineConfig:
         with open(self.config_path, 'w') as f:
             json.dump(config, f, indent=2)
 
-        self._config = config
+        self._snapshot = self._compile(config, _file_stamp(self.config_path), [])
+        self._snapshot_path = self.config_path
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value with dot notation.
@@ -74,17 +153,12 @@ class StatusLineConfig:
             >>> config.get("display.show_git")  # Returns bool
             True
         """
-        config = self.load()
-        keys = key.split('.')
-
-        value = config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        snapshot = self._snapshot
+        if snapshot is None or self._snapshot_path is not self.config_path:
+            snapshot = self._get_snapshot()
+        value = snapshot.flat.get(key, default)
+        # Section keys return nested dicts from the shared snapshot
+        return copy.deepcopy(value) if isinstance(value, dict) else value
 
     def set(self, key: str, value: Any) -> None:
         """Set config value with dot notation.
@@ -98,8 +172,6 @@ class StatusLineConfig:
         Raises:
             ValueError: If value is invalid for the key
         """
-        config = self.load()
-
         # Validate
         if not self._validate_value(key, value):
             schema_def = self._schema.get(key, {})
@@ -115,7 +187,8 @@ class StatusLineConfig:
 
             raise ValueError(error_msg)
 
-        # Set nested value
+        # Set nested value (load() returns a copy)
+        config = self.load()
         keys = key.split('.')
         target = config
         for k in keys[:-1]:
@@ -149,32 +222,9 @@ class StatusLineConfig:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        # Check if file exists and is valid JSON
-        if not self.config_path.exists():
-            return (True, [])  # No file is valid (will use defaults)
-
-        try:
-            with open(self.config_path) as f:
-                user_config = json.load(f)
-        except json.JSONDecodeError as e:
-            return (False, [f"Invalid JSON: {e.msg} at line {e.lineno}"])
-        except OSError as e:
-            return (False, [f"Cannot read config file: {e}"])
-
-        # Validate each setting against schema
-        config = self.load()
-        errors = []
-
-        for key, schema_def in self._schema.items():
-            value = self.get(key)
-
-            if not self._validate_value(key, value):
-                expected_type = schema_def['type']
-                actual_type = type(value).__name__
-                errors.append(
-                    f"{key}: expected {expected_type}, got {actual_type} ({value})"
-                )
-
+        # Errors are collected when the file is parsed (see _get_snapshot)
+        self.refresh()
+        errors = list(self._get_snapshot().errors)
         return (len(errors) == 0, errors)
 
     def get_schema(self) -> dict:
@@ -185,7 +235,7 @@ class StatusLineConfig:
             - type: str, bool, int, list
             - default: default value
             - description: human-readable description
-            - category: grouping (display, git, project, usage, theme, time)
+            - category: grouping (display, git, project, usage, theme, time, performance)
             - choices: valid choices (if applicable)
         """
         return self._schema
@@ -205,7 +255,6 @@ class StatusLineConfig:
             - description: description
             - category: category name
         """
-        config = self.load()
         schema = self.get_schema()
 
         settings = []
@@ -229,6 +278,17 @@ class StatusLineConfig:
     def _load_schema(self) -> dict:
         """Load configuration schema.
 
+        Returns:
+            Schema dict mapping keys to metadata (built once per process).
+        """
+        global _SCHEMA
+        if _SCHEMA is None:
+            _SCHEMA = self._build_schema()
+        return _SCHEMA
+
+    def _build_schema(self) -> dict:
+        """Build configuration schema.
+
         Returns:
             Schema dict mapping keys to metadata.
         """
@@ -301,6 +361,12 @@ class StatusLineConfig:
                 'description': 'Show weekly usage stats',
                 'category': 'display'
             },
+            'display.show_context_usage': {
+                'type': 'bool',
+                'default': False,
+                'description': 'Show context window usage',
+                'category': 'display'
+            },
             'display.max_directory_length': {
                 'type': 'int',
                 'default': 50,
@@ -376,6 +442,24 @@ class StatusLineConfig:
                 'description': 'Show untracked file count',
                 'category': 'git'
             },
+            'git.untracked_cap': {
+                'type': 'int',
+                'default': 99,
+                'description': 'Stop counting untracked files past this many, shown as "99+" (0 = no cap)',
+                'category': 'git'
+            },
+            'git.collapse_untracked_dirs': {
+                'type': 'bool',
+                'default': False,
+                'description': 'Count an untracked directory once instead of every file in it (git skips walking it)',
+                'category': 'git'
+            },
+            'git.untracked_cache': {
+                'type': 'bool',
+                'default': False,
+                'description': "Enable git's untracked cache (stored in the index) for faster scans",
+                'category': 'git'
+            },
             'git.show_stash_count': {
                 'type': 'bool',
                 'default': False,
@@ -449,9 +533,152 @@ class StatusLineConfig:
                 'choices': ['24h', '12h'],
                 'description': 'Time format',
                 'category': 'time'
+            },
+            'performance.git_cache_ttl': {
+                'type': 'int',
+                'default': 5,
+                'description': 'Max age of cached git status in seconds (0 = no cache)',
+                'category': 'performance'
+            },
+            'performance.render_cache_ttl': {
+                'type': 'int',
+                'default': 5,
+                'description': 'Seconds identical statusLine input reuses the last render (0 = off)',
+                'category': 'performance'
+            },
+            'performance.python_env_ttl': {
+                'type': 'int',
+                'default': 300,
+                'description': 'Seconds before Python env is re-detected in background (0 = inline)',
+                'category': 'performance'
+            },
+            'performance.node_version_ttl': {
+                'type': 'int',
+                'default': 300,
+                'description': 'Seconds before Node.js version is re-detected in background (0 = inline)',
+                'category': 'performance'
+            },
+            'performance.dependency_warnings_ttl': {
+                'type': 'int',
+                'default': 3600,
+                'description': 'Seconds before outdated deps are re-checked in background (0 = inline)',
+                'category': 'performance'
+            },
+            'performance.parallel_segments': {
+                'type': 'bool',
+                'default': True,
+                'description': 'Evaluate independent segments concurrently',
+                'category': 'performance'
+            },
+            'performance.render_budget_ms': {
+                'type': 'int',
+                'default': 500,
+                'description': 'Total render time budget in ms, enforced by the render daemon (0 = no budgets)',
+                'category': 'performance'
+            },
+            'performance.segment_budget_ms': {
+                'type': 'int',
+                'default': 200,
+                'description': 'Default per-segment time budget in ms (0 = total budget only)',
+                'category': 'performance'
+            },
+            'performance.git_budget_ms': {
+                'type': 'int',
+                'default': 300,
+                'description': 'Git segment time budget in ms',
+                'category': 'performance'
+            },
+            'performance.project_budget_ms': {
+                'type': 'int',
+                'default': 200,
+                'description': 'Project segment time budget in ms',
+                'category': 'performance'
+            },
+            'performance.usage_budget_ms': {
+                'type': 'int',
+                'default': 300,
+                'description': 'Usage segment time budget in ms',
+                'category': 'performance'
             }
         }
 
+    def _get_snapshot(self) -> _ConfigSnapshot:
+        """Get the parsed config for this instance's path.
+
+        Reuses the process-wide snapshot while the file's mtime/size are
+        unchanged; otherwise parses, merges with defaults and validates.
+
+        Returns:
+            Current snapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._snapshot_path is self.config_path:
+            return snapshot
+
+        path = self.config_path
+        stamp = _file_stamp(path)
+        snapshot = _SNAPSHOTS.get(path)
+        if snapshot is None or snapshot.stamp != stamp:
+            snapshot = self._parse(path, stamp)
+        self._snapshot = snapshot
+        self._snapshot_path = path
+        return snapshot
+
+    def _parse(self, path: Path, stamp: Optional[Tuple[int, int]]) -> _ConfigSnapshot:
+        """Parse the config file into a snapshot (and share it).
+
+        Args:
+            path: Config file path
+            stamp: File stamp taken before reading
+
+        Returns:
+            New snapshot (defaults if the file is missing or invalid)
+        """
+        if stamp is None:
+            return self._compile(self._get_defaults(), stamp, [])
+
+        try:
+            with open(path) as f:
+                user_config = json.load(f)
+        except json.JSONDecodeError as e:
+            # If config file is invalid, use defaults
+            # Caller can check validate() to see the error
+            return self._compile(self._get_defaults(), stamp, [f"Invalid JSON: {e.msg} at line {e.lineno}"])
+        except OSError as e:
+            return self._compile(self._get_defaults(), stamp, [f"Cannot read config file: {e}"])
+
+        if not isinstance(user_config, dict):
+            return self._compile(self._get_defaults(), stamp, ["Invalid JSON: expected an object"])
+
+        # Merge with defaults (user config takes precedence)
+        config = self._deep_merge(self._get_defaults(), user_config)
+        flat = _flatten(config)
+
+        # Validate each setting against schema
+        errors = []
+        for key, schema_def in self._schema.items():
+            value = flat.get(key)
+            if not self._validate_value(key, value):
+                expected_type = schema_def['type']
+                actual_type = type(value).__name__
+                errors.append(
+                    f"{key}: expected {expected_type}, got {actual_type} ({value})"
+                )
+
+        return self._compile(config, stamp, errors, flat)
+
+    def _compile(
+        self,
+        config: dict,
+        stamp: Optional[Tuple[int, int]],
+        errors: List[str],
+        flat: Optional[dict] = None
+    ) -> _ConfigSnapshot:
+        """Build a snapshot for this path and share it process-wide."""
+        snapshot = _ConfigSnapshot(self.config_path, stamp, config, errors, flat)
+        _SNAPSHOTS[self.config_path] = snapshot
+        return snapshot
+
     def _get_defaults(self) -> dict:
         """Generate default config from schema.
 
@@ -0,0 +1,431 @@
+"""Persistent statusLine render daemon.
+
+Keeps a StatusLineRenderer (config, theme and segment modules) warm in a
+long-lived process and serves render requests over a Unix socket, so a
+Claude Code refresh no longer pays interpreter + CLI startup on every call.
+
+Protocol (one request per connection):
+- Client sends a JSON object
+  ``{"input": <stdin JSON>, "columns": <int>, "env": {<name>: <value>}}``
+  and shuts down its write side. ``env`` holds the client's values of
+  FORWARDED_ENV (see client.py); they replace the daemon's own for the
+  duration of the render, so output matches an in-process render
+- Server replies with the rendered output (UTF-8, including the window
+  title escape sequence) and closes the connection
+
+Usage:
+    python -m aiterm.statusline.daemon          # Run in foreground
+    ait statusline daemon start                 # Start detached
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from aiterm.statusline.client import FORWARDED_ENV
+from aiterm.utils.cache import flush_stats
+
+# Exit after this many seconds without a request (0 = never)
+DEFAULT_IDLE_TIMEOUT = 3600
+
+# Maximum request size accepted from a client (Claude Code JSON is ~1KB)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def get_socket_path() -> Path:
+    """Get path of the daemon's Unix socket.
+
+    Uses AITERM_STATUSLINE_SOCKET if set, otherwise ~/.cache/aiterm/statusline.sock.
+
+    Returns:
+        Socket path (may not exist yet)
+    """
+    env_path = os.environ.get('AITERM_STATUSLINE_SOCKET')
+    if env_path:
+        return Path(env_path).expanduser()
+    return Path.home() / '.cache' / 'aiterm' / 'statusline.sock'
+
+
+def get_pid_path(socket_path: Optional[Path] = None) -> Path:
+    """Get path of the daemon's PID file (next to the socket).
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        PID file path
+    """
+    return (socket_path or get_socket_path()).with_suffix('.pid')
+
+
+class RenderDaemon:
+    """Unix socket server that renders statusLine requests in-process."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """Initialize daemon.
+
+        Args:
+            socket_path: Socket to listen on (defaults to get_socket_path())
+            idle_timeout: Seconds without requests before exiting (0 = never)
+        """
+        self.socket_path = socket_path or get_socket_path()
+        self.idle_timeout = idle_timeout
+        self.requests_served = 0
+        self._renderer = None
+        self._config_stamp = None
+        self._sock: Optional[socket.socket] = None
+        self._running = False
+
+    def _get_renderer(self):
+        """Get the warm renderer, rebuilding it when the config file changes.
+
+        Returns:
+            StatusLineRenderer instance
+        """
+        from aiterm.statusline.config import StatusLineConfig
+        from aiterm.statusline.renderer import StatusLineRenderer
+
+        config_path = StatusLineConfig().config_path
+        try:
+            stamp = config_path.stat().st_mtime_ns
+        except OSError:
+            stamp = None
+
+        if self._renderer is None or stamp != self._config_stamp:
+            self._renderer = StatusLineRenderer(StatusLineConfig.shared(), memoize=True, enforce_budgets=True)
+            self._config_stamp = stamp
+
+        return self._renderer
+
+    def render(
+        self,
+        json_input: str,
+        columns: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Render one request.
+
+        The window title is written to stdout by the renderer; it is
+        captured here so the client can emit it in the same order as an
+        in-process render would.
+
+        Args:
+            json_input: JSON string from Claude Code
+            columns: Client terminal width (None = daemon default)
+            env: Client values of FORWARDED_ENV (None = daemon's own)
+
+        Returns:
+            Full statusLine output (title sequence + 2 lines)
+        """
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured), _session_env(env):
+            try:
+                renderer = self._get_renderer()
+                renderer.terminal_width = columns
+                output = renderer.render(json_input)
+            except Exception as e:
+                output = f"╭─ ⚠️  StatusLine Error\n╰─ {str(e)[:50]}"
+
+        return captured.getvalue() + output
+
+    def handle_request(self, data: bytes) -> bytes:
+        """Decode a raw request and render it.
+
+        Args:
+            data: Raw request bytes from the client
+
+        Returns:
+            Raw response bytes
+        """
+        try:
+            request = json.loads(data.decode('utf-8'))
+            json_input = request['input']
+            columns = request.get('columns')
+            env = request.get('env')
+            if env is not None and not isinstance(env, dict):
+                raise TypeError('env')
+        except (ValueError, KeyError, TypeError):
+            return "╭─ ⚠️  Invalid daemon request\n╰─ ".encode('utf-8')
+
+        return self.render(json_input, columns, env).encode('utf-8')
+
+    def serve_forever(self) -> None:
+        """Listen on the socket and serve requests until stopped or idle."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Remove stale socket from a crashed daemon
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        self._sock.listen(16)
+        if self.idle_timeout:
+            self._sock.settimeout(self.idle_timeout)
+
+        # Warm up imports, config and theme before the first request
+        self._get_renderer()
+
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    break  # Idle timeout reached
+                except OSError:
+                    break
+
+                with conn:
+                    if not self._running:
+                        break  # Wake-up connection from shutdown()
+
+                    conn.settimeout(2)
+                    try:
+                        data = _recv_all(conn)
+                        if data:  # Empty = liveness probe (is_running)
+                            conn.sendall(self.handle_request(data))
+                            self.requests_served += 1
+                            flush_stats()
+                    except OSError:
+                        pass
+        finally:
+            self._cleanup()
+
+    def shutdown(self) -> None:
+        """Stop serving (safe to call from a signal handler or another thread)."""
+        self._running = False
+
+        # Wake up the blocking accept() so the loop notices
+        wake = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        wake.settimeout(0.5)
+        try:
+            wake.connect(str(self.socket_path))
+        except OSError:
+            pass
+        finally:
+            wake.close()
+
+    def _cleanup(self) -> None:
+        """Close the socket and remove socket/PID files."""
+        self._running = False
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        for path in (self.socket_path, get_pid_path(self.socket_path)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+@contextlib.contextmanager
+def _session_env(env: Optional[Dict[str, str]]) -> Iterator[None]:
+    """Apply a client's forwarded environment, restoring the daemon's after.
+
+    Forwarded variables the client does not set are removed for the render.
+    Requests are served one at a time, so swapping os.environ is safe here;
+    detached refresh workers started during the render inherit it.
+    """
+    if env is None:
+        yield
+        return
+
+    saved = {key: os.environ.get(key) for key in FORWARDED_ENV}
+    for key in FORWARDED_ENV:
+        value = env.get(key)
+        if isinstance(value, str):
+            os.environ[key] = value
+        else:
+            os.environ.pop(key, None)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    """Read from a connection until the peer shuts down its write side.
+
+    Args:
+        conn: Connected socket
+
+    Returns:
+        All bytes received (truncated at MAX_REQUEST_BYTES)
+    """
+    chunks = []
+    total = 0
+    while total < MAX_REQUEST_BYTES:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+    return b''.join(chunks)
+
+
+def is_running(socket_path: Optional[Path] = None) -> bool:
+    """Check whether a daemon is accepting connections.
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        True if a daemon answered the connection
+    """
+    path = socket_path or get_socket_path()
+    if not path.exists():
+        return False
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(0.5)
+    try:
+        sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def get_daemon_pid(socket_path: Optional[Path] = None) -> Optional[int]:
+    """Read the daemon PID from its PID file.
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        PID or None if no PID file
+    """
+    try:
+        return int(get_pid_path(socket_path).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def start_daemon(
+    socket_path: Optional[Path] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    wait: float = 3.0
+) -> bool:
+    """Start a detached daemon process.
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+        idle_timeout: Seconds without requests before the daemon exits
+        wait: Seconds to wait for the socket to become ready
+
+    Returns:
+        True if the daemon is accepting connections
+    """
+    path = socket_path or get_socket_path()
+    if is_running(path):
+        return True
+
+    subprocess.Popen(
+        [
+            sys.executable, '-m', 'aiterm.statusline.daemon',
+            '--socket', str(path),
+            '--idle-timeout', str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(path):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def stop_daemon(socket_path: Optional[Path] = None) -> bool:
+    """Stop a running daemon.
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        True if a daemon was signalled
+    """
+    path = socket_path or get_socket_path()
+    pid = get_daemon_pid(path)
+    if pid is None:
+        return False
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        # Stale PID file - clean up leftovers
+        for leftover in (path, get_pid_path(path)):
+            try:
+                leftover.unlink()
+            except OSError:
+                pass
+        return False
+
+    return True
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the daemon in the foreground.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m aiterm.statusline.daemon',
+        description='aiterm statusLine render daemon',
+    )
+    parser.add_argument('--socket', type=Path, default=None, help='Socket path')
+    parser.add_argument(
+        '--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+        help='Exit after N idle seconds (0 = never)',
+    )
+    args = parser.parse_args(argv)
+
+    daemon = RenderDaemon(args.socket, idle_timeout=args.idle_timeout)
+
+    def _handle_signal(signum, frame):
+        daemon.shutdown()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    pid_path = get_pid_path(daemon.socket_path)
+    pid_path.parent.mkdir(parents=True, exist_ok=True)
+    pid_path.write_text(str(os.getpid()))
+
+    daemon.serve_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Whole-render memoization for the statusLine.
+
+Claude Code often sends byte-identical JSON several times within a
+second. StatusLineRenderer.render computes a fingerprint of everything
+the output depends on and reuses the stored output when it matches:
+
+- the stdin payload (hashed)
+- the git snapshot stamp for the working directory (aiterm.git.cache)
+- the config file stamp and the theme
+- the terminal width
+- the time bucket (``performance.render_cache_ttl`` seconds) and the
+  minute, since the clock and session duration are shown per minute
+
+Inputs that are not part of the fingerprint (edits to tracked files,
+usage, agents) are picked up once the time bucket rolls over, just as
+the git snapshot cache expires after its TTL.
+
+Outputs are kept in ~/.cache/aiterm/renders.json, with the oldest entry
+dropped first.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from aiterm.utils.cache import atomic_write_json, get_cache_dir, read_json, record_lookup
+
+RENDER_CACHE_FILE = 'renders.json'
+
+# Rendered outputs kept (one per concurrent session is plenty)
+MAX_ENTRIES = 16
+
+DEFAULT_TTL = 5
+
+
+def get_git_stamp(cwd: str) -> Any:
+    """Get the git snapshot stamp for a directory (None outside a repo)."""
+    from aiterm.git.cache import get_stamp
+    from aiterm.git.repo import find_repo
+
+    if not cwd:
+        return None
+    repo = find_repo(cwd)
+    if repo is None or not repo.is_supported:
+        return None
+    return [str(repo.git_dir), get_stamp(repo, cwd)]
+
+
+def get_fingerprint(
+    json_input: str,
+    cwd: str,
+    config_stamp: Any,
+    theme_name: str,
+    width: int,
+    ttl: float,
+    now: Optional[float] = None
+) -> str:
+    """Build the render fingerprint.
+
+    Args:
+        json_input: Raw JSON from Claude Code
+        cwd: Working directory from the payload
+        config_stamp: Config file (mtime_ns, size), or None
+        theme_name: Active theme
+        width: Terminal width in columns
+        ttl: Time bucket length in seconds
+        now: Current time (defaults to time.time())
+
+    Returns:
+        Hex digest
+    """
+    now = time.time() if now is None else now
+    environment = json.dumps(
+        [get_git_stamp(cwd), config_stamp, theme_name, width, int(now // ttl), int(now // 60)],
+        separators=(',', ':'),
+    )
+    digest = hashlib.blake2b(json_input.encode('utf-8', errors='replace'), digest_size=16)
+    digest.update(b'\0')
+    digest.update(environment.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _get_path() -> Path:
+    """Get the render cache file."""
+    return get_cache_dir() / RENDER_CACHE_FILE
+
+
+def lookup(fingerprint: str) -> Optional[Tuple[str, str]]:
+    """Get a stored render.
+
+    Args:
+        fingerprint: Render fingerprint
+
+    Returns:
+        Tuple of (output, window title sequence), or None on a miss
+    """
+    entries = read_json(_get_path())
+    entry = entries.get(fingerprint) if isinstance(entries, dict) else None
+    if not isinstance(entry, dict) or not isinstance(entry.get('output'), str):
+        record_lookup('render', hit=False)
+        return None
+    record_lookup('render', hit=True)
+    return entry['output'], entry.get('title') or ''
+
+
+def store(fingerprint: str, output: str, title: str) -> None:
+    """Store a render.
+
+    Args:
+        fingerprint: Render fingerprint
+        output: Rendered statusLine
+        title: Window title escape sequence written with it
+    """
+    path = _get_path()
+    entries = read_json(path)
+    if not isinstance(entries, dict):
+        entries = {}
+
+    entries.pop(fingerprint, None)
+    entries[fingerprint] = {'output': output, 'title': title}
+    while len(entries) > MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+
+    atomic_write_json(path, entries)
+
+
+def clear() -> None:
+    """Drop all stored renders."""
+    try:
+        _get_path().unlink()
+    except OSError:
+        pass
+
@@ -0,0 +1,50 @@
+"""Background worker that refreshes one segment store entry.
+
+Started detached by SegmentStore when an entry is stale; runs the probe
+in its own process so the render that noticed never waits for it.
+
+Usage:
+    python -m aiterm.statusline.refresh <probe> '<json args>' [--store PATH]
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from aiterm.statusline.store import SegmentStore
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Worker entry point: run one probe and store the result.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m aiterm.statusline.refresh',
+        description='Refresh one statusLine segment probe',
+    )
+    parser.add_argument('probe', help='Registered probe name')
+    parser.add_argument('args', help='Probe arguments as a JSON list')
+    parser.add_argument('--store', type=Path, default=None, help='Store file')
+    parsed = parser.parse_args(argv)
+
+    try:
+        args = json.loads(parsed.args)
+    except ValueError:
+        return 2
+    if not isinstance(args, list):
+        return 2
+
+    SegmentStore(parsed.store).refresh(parsed.probe, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,11 +9,15 @@ This module provides the main Renderer class that:
 
 import json
 import sys
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from aiterm.statusline.budget import RenderBudget, SegmentTask
+from aiterm.statusline import memo, trace
 from aiterm.statusline.config import StatusLineConfig
 from aiterm.statusline.themes import Theme, get_theme
+from aiterm.statusline.width import display_width, truncate
 
 
 # Spacing presets for gap between left and right segments
@@ -23,19 +27,38 @@ SPACING_PRESETS = {
     'spacious': {'base_percent': 0.30, 'min_gap': 15, 'max_gap': 60}
 }
 
+# Narrowest shortened right side worth showing (columns, including the ellipsis)
+MIN_RIGHT_WIDTH = 8
+
 
 class StatusLineRenderer:
     """Main renderer for statusLine output."""
 
-    def __init__(self, config: Optional[StatusLineConfig] = None, theme: Optional[Theme] = None):
+    def __init__(
+        self,
+        config: Optional[StatusLineConfig] = None,
+        theme: Optional[Theme] = None,
+        memoize: bool = False,
+        enforce_budgets: bool = False
+    ):
         """Initialize renderer.
 
         Args:
-            config: StatusLineConfig instance (creates new if None)
+            config: StatusLineConfig instance (shared process-wide config if None)
             theme: Theme instance (loads from config if None)
+            memoize: Reuse the stored output for repeated identical input
+                (see aiterm.statusline.memo); enabled for Claude Code renders
+            enforce_budgets: Abandon segments that overrun their time budget
+                (see aiterm.statusline.budget); enabled in the render daemon
         """
-        self.config = config or StatusLineConfig()
+        self.config = config or StatusLineConfig.shared()
         self.theme = theme or get_theme(self.config.get('theme.name', 'purple-charcoal'))
+        # Explicit terminal width (set by the render daemon for its clients)
+        self.terminal_width: Optional[int] = None
+        # Time budget for the current render (replaced at the start of render())
+        self.budget = RenderBudget()
+        self.memoize = memoize
+        self.enforce_budgets = enforce_budgets
 
     def _get_separator(self) -> str:
         """Get separator pattern based on config.
@@ -43,19 +66,7 @@ class StatusLineRenderer:
         Returns:
             Formatted separator with spacing (e.g., " │ " or "  │  ")
         """
-        spacing_mode = self.config.get('display.separator_spacing', 'standard')
-
-        # Map spacing mode to number of spaces
-        spacing_map = {
-            'minimal': 1,
-            'standard': 2,
-            'relaxed': 3
-        }
-
-        spaces = spacing_map.get(spacing_mode, 2)  # Default to 2 (standard)
-        space_str = ' ' * spaces
-
-        return f"{space_str}\033[{self.theme.separator_fg}m│\033[0m{space_str}"
+        return self.theme.table.get_separator(self.config.get('display.separator_spacing', 'standard'))
 
     def render(self, json_input: Optional[str] = None) -> str:
         """Render statusLine from JSON input.
@@ -99,36 +110,79 @@ class StatusLineRenderer:
         # Extract context window data
         context_size = context_window.get('context_window_size', 0)
         current_usage = context_window.get('current_usage') or {}
-        input_tokens = current_usage.get('input_tokens', 0)
-        output_tokens = current_usage.get('output_tokens', 0)
-
-        # Build line 1 (directory + git)
-        line1 = self._build_line1(cwd, project_dir)
-
-        # Build line 2 (model + time + stats)
-        line2 = self._build_line2(
-            model_name=model_name,
-            session_id=session_id,
-            lines_added=lines_added,
-            lines_removed=lines_removed,
-            style_name=style_name,
-            transcript_path=transcript_path
+        context_tokens = sum(
+            current_usage.get(name) or 0
+            for name in ('input_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens')
         )
 
+        # Pick up config file edits (one stat; the parsed config is shared)
+        self.config.refresh()
+        tracing = trace.is_enabled()
+
+        # Same input and environment as a recent render: reuse its output
+        fingerprint = None
+        memo_ttl = self.config.get('performance.render_cache_ttl', memo.DEFAULT_TTL)
+        if self.memoize and memo_ttl > 0 and not tracing:
+            fingerprint = memo.get_fingerprint(
+                json_input, cwd, self.config.stamp, self.theme.name, self._get_terminal_width(), memo_ttl
+            )
+            cached = memo.lookup(fingerprint)
+            if cached is not None:
+                output, title = cached
+                self._write_title(title)
+                return output
+
+        # Start the render's time budget (and opt-in tracing, which counts
+        # subprocesses only while this render's segments are collected)
+        if tracing:
+            from aiterm.utils.tracing import install, uninstall
+            install()
+        started = time.perf_counter()
+        self.budget = RenderBudget.from_config(self.config, trace=tracing, enforce=self.enforce_budgets)
+
+        try:
+            # Start all independent segments so they run concurrently
+            line1_segments = self._start_line1(cwd, project_dir)
+            line2_segments = self._start_line2(session_id, transcript_path, context_size, context_tokens)
+
+            # Build line 1 (directory + git)
+            line1 = self._build_line1(cwd, project_dir, line1_segments)
+
+            # Build line 2 (model + time + stats)
+            line2 = self._build_line2(
+                model_name=model_name,
+                session_id=session_id,
+                lines_added=lines_added,
+                lines_removed=lines_removed,
+                style_name=style_name,
+                transcript_path=transcript_path,
+                segments=line2_segments
+            )
+        finally:
+            if tracing:
+                uninstall()
+
         # Set window title
-        self._set_window_title(project_dir, model_name)
+        title = self._get_window_title(project_dir, model_name)
+        self._write_title(title)
 
-        return f"{line1}\n{line2}"
+        if tracing:
+            trace.write_record(trace.build_record(self.budget, time.perf_counter() - started, cwd))
 
-    def _build_line1(self, cwd: str, project_dir: str) -> str:
-        """Build line 1 (directory + git + optional right-side worktree).
+        output = f"{line1}\n{line2}"
+        if fingerprint is not None:
+            memo.store(fingerprint, output, title)
+        return output
+
+    def _start_line1(self, cwd: str, project_dir: str) -> Tuple[Any, Dict[str, SegmentTask]]:
+        """Start line 1 segments (project + git) in the background.
 
         Args:
             cwd: Current working directory
             project_dir: Project root directory
 
         Returns:
-            Formatted line 1 with optional right-side segments
+            Tuple of (GitSegment instance, running tasks by segment name)
         """
         # Import here to avoid circular imports
         from aiterm.statusline.segments import (
@@ -136,13 +190,83 @@ class StatusLineRenderer:
             GitSegment
         )
 
-        # Get project segment
         project_segment = ProjectSegment(self.config, self.theme)
-        project_output = project_segment.render(cwd, project_dir)
-
-        # Get git segment
         git_segment = GitSegment(self.config, self.theme)
-        git_output = git_segment.render(cwd)
+
+        tasks = {
+            'project': self.budget.submit('project', project_segment.render, cwd, project_dir),
+            'git': self.budget.submit('git', git_segment.render, cwd),
+        }
+        return git_segment, tasks
+
+    def _start_line2(
+        self,
+        session_id: str,
+        transcript_path: Optional[str] = None,
+        context_size: int = 0,
+        context_tokens: int = 0
+    ) -> Dict[str, SegmentTask]:
+        """Start line 2 segments that may block (files, processes, network).
+
+        Args:
+            session_id: Session ID for duration tracking
+            transcript_path: Optional path to session transcript
+            context_size: Context window size (0 if not reported)
+            context_tokens: Tokens in the context window (0 if not reported)
+
+        Returns:
+            Running tasks by segment name
+        """
+        # Import here to avoid circular imports
+        from aiterm.statusline.segments import (
+            ContextSegment,
+            TimeSegment,
+            ThinkingSegment,
+            UsageSegment
+        )
+
+        thinking_segment = ThinkingSegment(self.config, self.theme)
+        time_segment = TimeSegment(self.config, self.theme)
+        context_segment = ContextSegment(self.config, self.theme)
+        usage_segment = UsageSegment(self.config, self.theme)
+
+        tasks = {
+            'thinking': self.budget.submit('thinking', thinking_segment.render),
+            'time': self.budget.submit('time', time_segment.render, session_id, transcript_path),
+            'context': self.budget.submit(
+                'context', context_segment.render, context_size, context_tokens, transcript_path
+            ),
+            'usage': self.budget.submit('usage', usage_segment.render),
+        }
+
+        if self.config.get('display.show_background_agents', True):
+            from aiterm.statusline.agents import AgentDetector
+            detector = AgentDetector()
+            tasks['agents'] = self.budget.submit('agents', detector.get_running_count, session_id)
+
+        return tasks
+
+    def _build_line1(
+        self,
+        cwd: str,
+        project_dir: str,
+        segments: Optional[Tuple[Any, Dict[str, SegmentTask]]] = None
+    ) -> str:
+        """Build line 1 (directory + git + optional right-side worktree).
+
+        Args:
+            cwd: Current working directory
+            project_dir: Project root directory
+            segments: Result of _start_line1 (started here if None)
+
+        Returns:
+            Formatted line 1 with optional right-side segments
+        """
+        git_segment, tasks = segments or self._start_line1(cwd, project_dir)
+
+        # Collect in display order (segments are already running)
+        project_output = self.budget.collect(tasks['project'])
+        git_output = self.budget.collect(tasks['git'])
 
         # Assemble left side
         line1_left = f"╭─{project_output}"
@@ -151,10 +275,10 @@ class StatusLineRenderer:
             line1_left += git_output
         else:
             # Close directory segment
-            line1_left += "\033[0m\033[38;5;4m▓▒░\033[0m"
+            line1_left += self.theme.table.dir_close
 
-        # Build right side (worktree context)
-        line1_right = self._build_right_segments(cwd, git_segment)
+        # Build right side (worktree context, reuses the git status read above)
+        line1_right = self.budget.run('worktree', self._build_right_segments, cwd, git_segment, key=cwd)
 
         if line1_right:
             # Calculate padding for alignment
@@ -169,7 +293,8 @@ class StatusLineRenderer:
         lines_added: int,
         lines_removed: int,
         style_name: str,
-        transcript_path: Optional[str] = None
+        transcript_path: Optional[str] = None,
+        segments: Optional[Dict[str, SegmentTask]] = None
     ) -> str:
         """Build line 2 (model + time + stats).
 
@@ -180,6 +305,7 @@ class StatusLineRenderer:
             lines_removed: Total lines removed
             style_name: Output style name
             transcript_path: Optional path to session transcript
+            segments: Result of _start_line2 (started here if None)
 
         Returns:
             Formatted line 2
@@ -187,23 +313,20 @@ class StatusLineRenderer:
         # Import here to avoid circular imports
         from aiterm.statusline.segments import (
             ModelSegment,
-            TimeSegment,
-            ThinkingSegment,
-            LinesSegment,
-            UsageSegment
+            LinesSegment
         )
 
+        tasks = segments or self._start_line2(session_id, transcript_path)
+
         # Model segment
         model_segment = ModelSegment(self.config, self.theme)
         model_output = model_segment.render(model_name)
 
         # Thinking mode indicator
-        thinking_segment = ThinkingSegment(self.config, self.theme)
-        thinking_output = thinking_segment.render()
+        thinking_output = self.budget.collect(tasks['thinking'])
 
         # Time segments
-        time_segment = TimeSegment(self.config, self.theme)
-        time_output = time_segment.render(session_id, transcript_path)
+        time_output = self.budget.collect(tasks['time'])
 
         # Lines changed
         lines_segment = LinesSegment(self.config, self.theme)
@@ -216,19 +339,21 @@ class StatusLineRenderer:
         line2 += thinking_output
 
         # Add background agents count
-        if self.config.get('display.show_background_agents', True):
-            from aiterm.statusline.agents import AgentDetector
-            detector = AgentDetector()
-            agent_count = detector.get_running_count(session_id)
-            if agent_count > 0:
+        if 'agents' in tasks:
+            agent_count = self.budget.collect(tasks['agents'])
+            if agent_count:
                 line2 += f"{self._get_separator()}\033[38;5;2m🤖{agent_count}\033[0m"
 
         # Add time
         line2 += time_output
 
+        # Add context window usage
+        context_output = self.budget.collect(tasks['context'])
+        if context_output:
+            line2 += f"{self._get_separator()}{context_output}"
+
         # Add usage tracking
-        usage_segment = UsageSegment(self.config, self.theme)
-        usage_output = usage_segment.render()
+        usage_output = self.budget.collect(tasks['usage'])
         if usage_output:
             line2 += f"{self._get_separator()}{usage_output}"
 
@@ -238,7 +363,7 @@ class StatusLineRenderer:
 
         # Add style if not default
         if style_name and style_name != 'default':
-            line2 += f"{self._get_separator()}\033[{self.theme.style_fg}m[{style_name}]\033[0m"
+            line2 += f"{self._get_separator()}{self.theme.table.sgr['style_fg']}[{style_name}]\033[0m"
 
         return line2
 
@@ -356,14 +481,10 @@ class StatusLineRenderer:
         Returns:
             Aligned line with proper spacing
         """
-        try:
-            import shutil
-            terminal_width = shutil.get_terminal_size((120, 24)).columns
-        except (OSError, ValueError):
-            terminal_width = 120  # Fallback
+        terminal_width = self._get_terminal_width()
 
-        left_width = self._strip_ansi_length(left)
-        right_width = self._strip_ansi_length(right)
+        left_width = display_width(left)
+        right_width = display_width(right)
 
         # Calculate desired gap using spacing system
         gap_size = self._calculate_gap(terminal_width)
@@ -382,22 +503,41 @@ class StatusLineRenderer:
             if available_padding > 0:
                 # Use available padding (no separator, simpler)
                 return f"{left}{' ' * available_padding}{right}"
-            else:
-                # Not enough room at all - fallback to left-only
-                return left
+
+            # Shorten the right side to fit after a one-column gap
+            room = terminal_width - left_width - 1
+            if room >= MIN_RIGHT_WIDTH:
+                right = truncate(right, room)
+                return f"{left}{' ' * (terminal_width - left_width - display_width(right))}{right}"
+
+            # Not enough room at all - fallback to left-only
+            return left
+
+    def _get_terminal_width(self) -> int:
+        """Get terminal width in columns.
+
+        Returns:
+            Explicit terminal_width if set, else detected width (120 fallback)
+        """
+        if self.terminal_width:
+            return self.terminal_width
+
+        try:
+            import shutil
+            return shutil.get_terminal_size((120, 24)).columns
+        except (OSError, ValueError):
+            return 120  # Fallback
 
     def _strip_ansi_length(self, text: str) -> int:
-        """Get visible character count (strip ANSI codes).
+        """Get visible width in terminal columns (ANSI codes excluded).
 
         Args:
             text: Text with ANSI escape codes
 
         Returns:
-            Length of visible characters only
+            Display width (emoji and wide characters count as two)
         """
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return len(ansi_escape.sub('', text))
+        return display_width(text)
 
     def _set_window_title(self, project_dir: str, model_name: str) -> None:
         """Set terminal window title.
@@ -406,6 +546,18 @@ class StatusLineRenderer:
             project_dir: Project directory path
             model_name: Model name
         """
+        self._write_title(self._get_window_title(project_dir, model_name))
+
+    def _get_window_title(self, project_dir: str, model_name: str) -> str:
+        """Build the window title escape sequence.
+
+        Args:
+            project_dir: Project directory path
+            model_name: Model name
+
+        Returns:
+            OSC 0 sequence setting the title
+        """
         # Import here to avoid circular imports
         from aiterm.statusline.segments import ProjectSegment
 
@@ -416,5 +568,10 @@ class StatusLineRenderer:
         # ANSI escape sequence for window title
         # Format: ESC ] 0 ; text BEL
         title = f"{project_icon} {project_name} ({model_name})"
-        sys.stdout.write(f"\033]0;{title}\007")
-        sys.stdout.flush()
+        return f"\033]0;{title}\007"
+
+    def _write_title(self, title: str) -> None:
+        """Write a window title sequence to stdout."""
+        if title:
+            sys.stdout.write(title)
+            sys.stdout.flush()
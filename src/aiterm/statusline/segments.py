@@ -10,6 +10,7 @@ Each segment class handles rendering a specific part of the statusLine:
 - UsageSegment: Session and weekly usage tracking
 """
 
+import hashlib
 import os
 import subprocess
 from pathlib import Path
@@ -17,9 +18,16 @@ from typing import Optional, Tuple
 import time
 import json
 
+from aiterm.claude.settings import read_settings
+from aiterm.context.index import get_index
+from aiterm.git.cache import DEFAULT_TTL, read_status_cached
+from aiterm.git.status import GitStatus
+from aiterm.statusline.analytics import DEFAULT_CONTEXT_WINDOW, get_resumed_stats
 from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.store import SegmentStore, register_probe
 from aiterm.statusline.themes import Theme, get_theme
-from aiterm.statusline.usage import UsageTracker, get_usage_color
+from aiterm.statusline.transcript import get_last_record, parse_timestamp
+from aiterm.statusline.usage import STALE_MARKER, UsageTracker, get_percent_color, get_usage_color
 
 
 def get_separator(config: StatusLineConfig, theme: Theme) -> str:
@@ -32,19 +40,7 @@ def get_separator(config: StatusLineConfig, theme: Theme) -> str:
     Returns:
         Formatted separator with spacing (e.g., " │ " or "  │  ")
     """
-    spacing_mode = config.get('display.separator_spacing', 'standard')
-
-    # Map spacing mode to number of spaces
-    spacing_map = {
-        'minimal': 1,
-        'standard': 2,
-        'relaxed': 3
-    }
-
-    spaces = spacing_map.get(spacing_mode, 2)  # Default to 2 (standard)
-    space_str = ' ' * spaces
-
-    return f"{space_str}\033[{theme.separator_fg}m│\033[0m{space_str}"
+    return theme.table.get_separator(config.get('display.separator_spacing', 'standard'))
 
 
 class ProjectSegment:
@@ -54,13 +50,14 @@ class ProjectSegment:
     PROJECT_TYPES = {
         'production': {'patterns': ['*/production/*', '*/prod/*'], 'icon': '🚨'},
         'ai-session': {'patterns': ['*/claude-sessions/*', '*/gemini-sessions/*'], 'icon': '🤖'},
-        'r-package': {'check': lambda p: (p / 'DESCRIPTION').exists() and 'Package:' in (p / 'DESCRIPTION').read_text(), 'icon': '📦'},
-        'python': {'check': lambda p: (p / 'pyproject.toml').exists() or (p / 'setup.py').exists(), 'icon': '🐍'},
-        'node': {'check': lambda p: (p / 'package.json').exists(), 'icon': '📦'},
-        'quarto': {'check': lambda p: (p / '_quarto.yml').exists() or (p / '_quarto.yaml').exists(), 'icon': '📊'},
+        # Checks take the directory's DirectoryIndex (one listing per directory)
+        'r-package': {'check': lambda idx: 'Package:' in (idx.read_text('DESCRIPTION') or ''), 'icon': '📦'},
+        'python': {'check': lambda idx: idx.has('pyproject.toml', 'setup.py'), 'icon': '🐍'},
+        'node': {'check': lambda idx: idx.has('package.json'), 'icon': '📦'},
+        'quarto': {'check': lambda idx: idx.has('_quarto.yml', '_quarto.yaml'), 'icon': '📊'},
         'mcp': {'patterns': ['*/mcp-server/*', '*mcp*'], 'icon': '🔌'},
-        'emacs': {'check': lambda p: any((p / f).exists() for f in ['init.el', 'Cask', '.dir-locals.el', 'early-init.el']), 'icon': '⚡'},
-        'dev-tools': {'check': lambda p: (p / '.git').exists() and ((p / 'commands').exists() or (p / 'scripts').exists()), 'icon': '🔧'},
+        'emacs': {'check': lambda idx: idx.has('init.el', 'Cask', '.dir-locals.el', 'early-init.el'), 'icon': '⚡'},
+        'dev-tools': {'check': lambda idx: idx.has('.git') and idx.has('commands', 'scripts'), 'icon': '🔧'},
     }
 
     def __init__(self, config: StatusLineConfig, theme: Optional[Theme] = None):
@@ -72,6 +69,7 @@ class ProjectSegment:
         """
         self.config = config
         self.theme = theme or get_theme(config.get('theme.name', 'purple-charcoal'))
+        self.store = SegmentStore()
 
     def render(self, cwd: str, project_dir: str) -> str:
         """Render project segment.
@@ -90,10 +88,17 @@ class ProjectSegment:
         r_version = self._get_r_version(project_dir)
 
         # Get project-specific context (Phase 4)
-        python_env = self._get_python_env(project_dir)
-        node_version = self._get_node_version(project_dir)
+        # Slow probes serve the last known value and refresh in the background.
+        # The store is shared by every session, so the environment a probe
+        # reads is part of its key (the worker inherits this process's PATH).
+        python_env = self._get_stored(
+            'python_env', 'project.detect_python_env', project_dir, os.environ.get('CONDA_DEFAULT_ENV', '')
+        )
+        node_version = self._get_stored('node_version', 'project.detect_node_version', project_dir, _path_digest())
         r_health = self._get_r_package_health(project_dir)
-        dep_warnings = self._get_dependency_warnings(project_dir, project_type)
+        dep_warnings = self._get_stored(
+            'dependency_warnings', 'project.show_dependency_warnings', project_dir, project_type
+        )
 
         # Build content
         content = f"{project_icon} {dir_display}"
@@ -117,14 +122,25 @@ class ProjectSegment:
         if dep_warnings:
             content += f" \033[38;5;208m{dep_warnings}\033[38;5;250m"
 
-        # Get colors from theme
-        dir_bg = self.theme.dir_bg
-        dir_fg = self.theme.dir_fg
-
         # Build segment with powerline edges
-        segment = f"\033[{dir_bg};{dir_fg}m ░▒▓ {content} "
+        return f"{self.theme.table.dir_open}{content} "
+
+    def _get_stored(self, probe: str, enabled_key: str, *args: str) -> Optional[str]:
+        """Get a slow probe's result from the segment store.
 
-        return segment
+        Args:
+            probe: Registered probe name
+            enabled_key: Config key that enables the probe
+            *args: Probe arguments
+
+        Returns:
+            Last known result or None (disabled, or not computed yet)
+        """
+        if not self.config.get(enabled_key, False):
+            return None
+
+        ttl = self.config.get(f'performance.{probe}_ttl', 300)
+        return self.store.get(probe, list(args), ttl)
 
     def _get_project_icon(self, project_dir: str) -> str:
         """Get icon for project type.
@@ -157,10 +173,11 @@ class ProjectSegment:
                             return config['icon']
 
         # Check file-based detection
+        index = get_index(project_dir)
         for project_type, config in self.PROJECT_TYPES.items():
             if 'check' in config:
                 try:
-                    if config['check'](path):
+                    if config['check'](index):
                         return config['icon']
                 except Exception:
                     # Ignore errors in check functions
@@ -177,23 +194,18 @@ class ProjectSegment:
         Returns:
             Project type string (python/node/r-package/default)
         """
-        path = Path(project_dir)
+        index = get_index(project_dir)
 
         # Check for R package
-        if (path / 'DESCRIPTION').exists():
-            try:
-                content = (path / 'DESCRIPTION').read_text()
-                if 'Package:' in content:
-                    return 'r-package'
-            except Exception:
-                pass
+        if 'Package:' in (index.read_text('DESCRIPTION') or ''):
+            return 'r-package'
 
         # Check for Python project
-        if (path / 'pyproject.toml').exists() or (path / 'setup.py').exists():
+        if index.has('pyproject.toml', 'setup.py'):
             return 'python'
 
         # Check for Node.js project
-        if (path / 'package.json').exists():
+        if index.has('package.json'):
             return 'node'
 
         return 'default'
@@ -247,27 +259,15 @@ class ProjectSegment:
         Returns:
             Version string like "v1.2.3" or None
         """
-        desc_file = Path(project_dir) / 'DESCRIPTION'
-
-        if not desc_file.exists():
-            return None
-
-        try:
-            content = desc_file.read_text()
-            for line in content.split('\n'):
-                if line.startswith('Version:'):
-                    version = line.replace('Version:', '').strip()
-                    return f"v{version}"
-        except Exception:
-            pass
-
-        return None
+        version = get_index(project_dir).read_field('DESCRIPTION', 'Version:', ':', 1)
+        return f"v{version}" if version is not None else None
 
-    def _get_python_env(self, project_dir: str) -> Optional[str]:
+    def _get_python_env(self, project_dir: str, conda_env: Optional[str] = None) -> Optional[str]:
         """Detect Python environment (venv/conda/pyenv).
 
         Args:
             project_dir: Project directory
+            conda_env: Active conda environment (defaults to CONDA_DEFAULT_ENV)
 
         Returns:
             Environment string like "venv: py3.11" or "conda: stats-env" or None
@@ -306,7 +306,8 @@ class ProjectSegment:
                 return "venv"
 
         # Check for conda environment
-        conda_env = os.environ.get('CONDA_DEFAULT_ENV')
+        if conda_env is None:
+            conda_env = os.environ.get('CONDA_DEFAULT_ENV')
         if conda_env and conda_env != 'base':
             return f"conda: {conda_env}"
 
@@ -374,22 +375,21 @@ class ProjectSegment:
             return None
 
         project_path = Path(project_dir)
+        index = get_index(project_dir)
 
         # Only check if this is an R package
-        desc_file = project_path / 'DESCRIPTION'
-        if not desc_file.exists():
+        if not index.has('DESCRIPTION'):
             return None
 
         # Lightweight checks (not full R CMD check)
         warnings = []
 
         # Check if tests exist
-        tests_dir = project_path / 'tests'
-        if not tests_dir.exists():
+        if not index.has('tests'):
             warnings.append("no tests")
 
         # Check for R CMD check results
-        check_results = list(project_path.glob('*.Rcheck'))
+        check_results = [project_path / name for name in index.with_suffix('.Rcheck')]
         if check_results:
             # Check most recent
             latest_check = max(check_results, key=lambda p: p.stat().st_mtime)
@@ -515,6 +515,7 @@ class GitSegment:
         """
         self.config = config
         self.theme = theme or get_theme(config.get('theme.name', 'purple-charcoal'))
+        self._status: dict = {}
 
     def render(self, cwd: str) -> str:
         """Render git segment.
@@ -535,9 +536,9 @@ class GitSegment:
 
         branch, has_changes, ahead, behind, untracked = git_info
 
-        # Determine background color from theme
-        vcs_bg = self.theme.vcs_clean_bg if not has_changes and untracked == 0 else self.theme.vcs_modified_bg
-        vcs_fg = self.theme.vcs_fg
+        # Pick the opening edge (background color) from the theme
+        table = self.theme.table
+        vcs_open = table.vcs_clean_open if not has_changes and untracked == 0 else table.vcs_modified_open
 
         # Build git string
         git_str = f" {branch}"
@@ -553,6 +554,8 @@ class GitSegment:
 
         if self.config.get('git.show_untracked_count', True) and untracked > 0:
             git_str += f" ?{untracked}"
+            if self._get_status(cwd).untracked_capped:
+                git_str += "+"
 
         # Get enhanced git info
         if self.config.get('git.show_stash_count', False):
@@ -571,99 +574,52 @@ class GitSegment:
             if worktree_count > 1:  # More than just main
                 git_str += f" 🌳{worktree_count}"
 
-        # Build segment with powerline separator
-        sep_left = ""
-        segment = f"\033[38;5;54;{vcs_bg}m{sep_left}\033[{vcs_bg};{vcs_fg}m{git_str} \033[0m\033[38;5;60m▓▒░\033[0m"
+        # Build segment with powerline edges
+        return f"{vcs_open}{git_str}{table.vcs_close}"
 
-        return segment
+    def _get_status(self, cwd: str) -> Optional[GitStatus]:
+        """Get the git status snapshot for a directory.
 
-    def _get_git_info(self, cwd: str) -> Optional[Tuple[str, bool, int, int, int]]:
-        """Get git repository information.
+        Runs at most one git process per render, and none while the
+        on-disk snapshot cache is fresh.
 
         Args:
             cwd: Current working directory
 
         Returns:
-            Tuple of (branch, has_changes, ahead, behind, untracked_count) or None
+            GitStatus or None if not in git repo
         """
-        try:
-            # Check if in git repo
-            subprocess.run(
-                ['git', '-C', cwd, 'rev-parse', '--git-dir'],
-                capture_output=True,
-                check=True
+        if cwd not in self._status:
+            ttl = self.config.get('performance.git_cache_ttl', DEFAULT_TTL)
+            self._status[cwd] = read_status_cached(
+                cwd,
+                ttl,
+                untracked_cap=self.config.get('git.untracked_cap', 99),
+                untracked_cache=self.config.get('git.untracked_cache', False),
+                collapse_untracked_dirs=self.config.get('git.collapse_untracked_dirs', False),
             )
+        return self._status[cwd]
 
-            # Get branch name
-            result = subprocess.run(
-                ['git', '-C', cwd, 'branch', '--show-current'],
-                capture_output=True,
-                text=True
-            )
-            branch = result.stdout.strip()
-
-            if not branch:
-                # Try tag or detached
-                result = subprocess.run(
-                    ['git', '-C', cwd, 'describe', '--tags', '--exact-match'],
-                    capture_output=True,
-                    text=True
-                )
-                branch = result.stdout.strip() or "detached"
-
-            # Truncate long branch names with smart truncation
-            max_len = self.config.get('git.truncate_branch_length', 32)
-            if len(branch) > max_len:
-                branch = self._truncate_branch(branch, max_len)
-
-            # Check for changes
-            has_changes = False
-            result = subprocess.run(
-                ['git', '-C', cwd, 'diff', '--quiet'],
-                capture_output=True
-            )
-            if result.returncode != 0:
-                has_changes = True
-
-            result = subprocess.run(
-                ['git', '-C', cwd, 'diff', '--cached', '--quiet'],
-                capture_output=True
-            )
-            if result.returncode != 0:
-                has_changes = True
-
-            # Get untracked count
-            result = subprocess.run(
-                ['git', '-C', cwd, 'ls-files', '--others', '--exclude-standard'],
-                capture_output=True,
-                text=True
-            )
-            untracked = len([l for l in result.stdout.strip().split('\n') if l])
-
-            # Get ahead/behind
-            ahead = 0
-            behind = 0
+    def _get_git_info(self, cwd: str) -> Optional[Tuple[str, bool, int, int, int]]:
+        """Get git repository information.
 
-            result = subprocess.run(
-                ['git', '-C', cwd, 'rev-list', '--count', '@{u}..HEAD'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                ahead = int(result.stdout.strip() or 0)
+        Args:
+            cwd: Current working directory
 
-            result = subprocess.run(
-                ['git', '-C', cwd, 'rev-list', '--count', 'HEAD..@{u}'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                behind = int(result.stdout.strip() or 0)
+        Returns:
+            Tuple of (branch, has_changes, ahead, behind, untracked_count) or None
+        """
+        status = self._get_status(cwd)
+        if status is None:
+            return None
 
-            return (branch, has_changes, ahead, behind, untracked)
+        # Truncate long branch names with smart truncation
+        branch = status.display_branch
+        max_len = self.config.get('git.truncate_branch_length', 32)
+        if len(branch) > max_len:
+            branch = self._truncate_branch(branch, max_len)
 
-        except Exception:
-            return None
+        return (branch, status.has_changes, status.ahead, status.behind, status.untracked)
 
     def _get_stash_count(self, cwd: str) -> int:
         """Get number of stashed changes.
@@ -674,18 +630,8 @@ class GitSegment:
         Returns:
             Number of stash entries
         """
-        try:
-            result = subprocess.run(
-                ['git', '-C', cwd, 'stash', 'list'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                lines = [l for l in result.stdout.strip().split('\n') if l]
-                return len(lines)
-        except Exception:
-            pass
-        return 0
+        status = self._get_status(cwd)
+        return status.stash if status else 0
 
     def _get_remote_tracking(self, cwd: str) -> Optional[str]:
         """Get remote tracking branch.
@@ -696,24 +642,17 @@ class GitSegment:
         Returns:
             Remote tracking branch name (e.g., "origin/main") or None
         """
-        try:
-            # Get upstream branch
-            result = subprocess.run(
-                ['git', '-C', cwd, 'rev-parse', '--abbrev-ref', '--symbolic-full-name', '@{u}'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                remote = result.stdout.strip()
-                # Shorten if too long
-                if len(remote) > 20:
-                    parts = remote.split('/')
-                    if len(parts) >= 2:
-                        return f"{parts[0]}/…"
-                return remote
-        except Exception:
-            pass
-        return None
+        status = self._get_status(cwd)
+        if status is None or not status.upstream:
+            return None
+
+        remote = status.upstream
+        # Shorten if too long
+        if len(remote) > 20:
+            parts = remote.split('/')
+            if len(parts) >= 2:
+                return f"{parts[0]}/…"
+        return remote
 
     def _get_recent_activity(self, cwd: str) -> bool:
         """Check if there are commits in the last 24 hours.
@@ -747,20 +686,8 @@ class GitSegment:
         Returns:
             Total number of worktrees (including main)
         """
-        try:
-            result = subprocess.run(
-                ['git', '-C', cwd, 'worktree', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-            if result.returncode == 0:
-                # Count lines (each line = 1 worktree)
-                lines = [l for l in result.stdout.strip().split('\n') if l]
-                return len(lines)
-        except Exception:
-            pass
-        return 0
+        status = self._get_status(cwd)
+        return status.worktree_count if status else 0
 
     def _is_worktree(self, cwd: str) -> bool:
         """Check if current directory is in a worktree (not main working directory).
@@ -771,21 +698,8 @@ class GitSegment:
         Returns:
             True if in a worktree, False if in main working directory
         """
-        try:
-            # Get git directory
-            result = subprocess.run(
-                ['git', '-C', cwd, 'rev-parse', '--git-dir'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                git_dir = result.stdout.strip()
-                # Worktrees have .git/worktrees/<name> as git-dir
-                # Main working directory has .git as git-dir
-                return '/worktrees/' in git_dir
-        except Exception:
-            pass
-        return False
+        status = self._get_status(cwd)
+        return status.is_worktree if status else False
 
     def _get_worktree_name(self, cwd: str) -> Optional[str]:
         """Get name of current worktree (or None if main).
@@ -796,24 +710,8 @@ class GitSegment:
         Returns:
             Worktree name if in a worktree, None if in main working directory
         """
-        try:
-            result = subprocess.run(
-                ['git', '-C', cwd, 'rev-parse', '--git-dir'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-            if result.returncode == 0:
-                git_dir = result.stdout.strip()
-                # Worktrees: .git/worktrees/<name>
-                if '/worktrees/' in git_dir:
-                    # Extract name from path
-                    from pathlib import Path
-                    return Path(git_dir).name
-                return None  # Main working directory
-        except Exception:
-            pass
-        return None
+        status = self._get_status(cwd)
+        return status.worktree_name if status else None
 
     def _truncate_branch(self, branch: str, max_len: int) -> str:
         """Truncate branch name while preserving start and end.
@@ -869,16 +767,17 @@ class ModelSegment:
         model_short = model_name.replace('Claude ', '')
 
         # Get color from theme based on model type
+        sgr = self.theme.table.sgr
         if 'Sonnet' in model_name:
-            color = self.theme.model_sonnet
+            color = sgr['model_sonnet']
         elif 'Opus' in model_name:
-            color = self.theme.model_opus
+            color = sgr['model_opus']
         elif 'Haiku' in model_name:
-            color = self.theme.model_haiku
+            color = sgr['model_haiku']
         else:
-            color = self.theme.model_opus  # Default
+            color = sgr['model_opus']  # Default
 
-        return f"\033[{color}m{model_short}\033[0m"
+        return f"{color}{model_short}\033[0m"
 
 
 class TimeSegment:
@@ -909,7 +808,7 @@ class TimeSegment:
         # Current time
         if self.config.get('display.show_current_time', True):
             current_time = time.strftime("%H:%M")
-            output += f"{get_separator(self.config, self.theme)}\033[{self.theme.time_fg}m{current_time}\033[0m"
+            output += f"{get_separator(self.config, self.theme)}{self.theme.table.sgr['time_fg']}{current_time}\033[0m"
 
             # Add time-of-day indicator
             time_of_day = self._get_time_of_day_indicator()
@@ -919,7 +818,7 @@ class TimeSegment:
         # Session duration
         if self.config.get('display.show_session_duration', True):
             duration = self._get_session_duration(session_id)
-            output += f"{get_separator(self.config, self.theme)}\033[{self.theme.duration_fg}m⏱ {duration}\033[0m"
+            output += f"{get_separator(self.config, self.theme)}{self.theme.table.sgr['duration_fg']}⏱ {duration}\033[0m"
 
             # Add productivity indicator
             productivity = self._get_productivity_indicator(transcript_path)
@@ -972,25 +871,13 @@ class TimeSegment:
         if not self.config.get('time.show_productivity_indicator', False):
             return None
 
-        if not transcript_path or not Path(transcript_path).exists():
+        if not transcript_path:
             return None
 
         try:
-            # Read transcript to get last message timestamp
-            with open(transcript_path, 'r') as f:
-                content = f.read()
-
-            # Parse JSON transcript
-            import json
-            data = json.loads(content)
-
-            # Get last message timestamp
-            messages = data.get('messages', [])
-            if not messages:
-                return None
-
-            last_msg = messages[-1]
-            last_time = last_msg.get('timestamp', 0)
+            # Only the trailing record is parsed (reads resume from the last offset)
+            record = get_last_record(transcript_path)
+            last_time = parse_timestamp(record) if record else None
 
             # Return None if timestamp is missing or invalid
             if not last_time:
@@ -1054,23 +941,9 @@ class ThinkingSegment:
         if not self.config.get('display.show_thinking_indicator', True):
             return ""
 
-        # Read Claude Code settings
-        settings_file = Path.home() / '.claude' / 'settings.json'
-
-        if not settings_file.exists():
-            return ""
-
-        try:
-            with open(settings_file) as f:
-                settings = json.load(f)
-
-            thinking_enabled = settings.get('alwaysThinkingEnabled', False)
-
-            if thinking_enabled:
-                return f"{get_separator(self.config, self.theme)}\033[{self.theme.thinking_fg}m🧠\033[0m"
-
-        except Exception:
-            pass
+        # Parsed once per change of Claude Code's settings file
+        if read_settings().get('alwaysThinkingEnabled', False) is True:
+            return f"{get_separator(self.config, self.theme)}{self.theme.table.sgr['thinking_fg']}🧠\033[0m"
 
         return ""
 
@@ -1105,14 +978,58 @@ class LinesSegment:
             return ""
 
         # Format display
-        output = f"\033[{self.theme.lines_added_fg}m+{lines_added}\033[0m"
+        output = f"{self.theme.table.sgr['lines_added_fg']}+{lines_added}\033[0m"
 
         if lines_removed > 0:
-            output += f"\033[{self.theme.lines_removed_fg}m/-{lines_removed}\033[0m"
+            output += f"{self.theme.table.sgr['lines_removed_fg']}/-{lines_removed}\033[0m"
 
         return output
 
 
+class ContextSegment:
+    """Renders how full the context window is."""
+
+    def __init__(self, config: StatusLineConfig, theme: Optional[Theme] = None):
+        """Initialize segment.
+
+        Args:
+            config: StatusLineConfig instance
+            theme: Theme object (loads from config if None)
+        """
+        self.config = config
+        self.theme = theme or get_theme(config.get('theme.name', 'purple-charcoal'))
+
+    def render(
+        self,
+        context_size: int = 0,
+        used_tokens: int = 0,
+        transcript_path: Optional[str] = None
+    ) -> str:
+        """Render context window usage.
+
+        Args:
+            context_size: Context window size reported by Claude Code
+            used_tokens: Tokens in context reported by Claude Code (0 if unknown)
+            transcript_path: Transcript to derive usage from when not reported
+
+        Returns:
+            Formatted usage (e.g. "◔ 42%") or empty
+        """
+        if not self.config.get('display.show_context_usage', False):
+            return ""
+
+        # The transcript fallback only resumes from a checkpoint (never a full parse)
+        if not used_tokens and transcript_path:
+            stats = get_resumed_stats(transcript_path)
+            used_tokens = stats.context_tokens if stats is not None else 0
+        if not used_tokens:
+            return ""
+
+        percent = min(100, used_tokens * 100 // (context_size or DEFAULT_CONTEXT_WINDOW))
+        color = get_percent_color(percent, self.config.get('usage.warning_threshold', 80))
+        return f"\033[{color}m◔ {percent}%\033[0m"
+
+
 class UsageSegment:
     """Renders usage tracking (session and weekly).
 
@@ -1166,6 +1083,35 @@ class UsageSegment:
         if not parts:
             return ""
 
-        # Combine and add separator
+        # Combine and add separator (marking data the refresher hasn't updated)
         usage_str = " ".join(parts)
+        if self.tracker.is_stale:
+            usage_str += f" {STALE_MARKER}"
         return f"{get_separator(self.config, self.theme)}\033[38;5;2m📊{usage_str}\033[0m"
+
+
+def _path_digest() -> str:
+    """Short digest of PATH (keys probes whose result depends on it)."""
+    return hashlib.blake2b(os.environ.get('PATH', '').encode('utf-8', errors='replace'), digest_size=8).hexdigest()
+
+
+def _probe_project(method: str, *args: str):
+    """Run a ProjectSegment probe method with the current config."""
+    return getattr(ProjectSegment(StatusLineConfig()), method)(*args)
+
+
+register_probe(
+    'python_env',
+    lambda project_dir, conda_env='': _probe_project('_get_python_env', project_dir, conda_env)
+)
+# The PATH digest only separates store entries; node runs with the worker's inherited PATH
+register_probe(
+    'node_version',
+    lambda project_dir, path_digest='': _probe_project('_get_node_version', project_dir)
+)
+register_probe(
+    'dependency_warnings',
+    lambda project_dir, project_type: _probe_project(
+        '_get_dependency_warnings', project_dir, project_type
+    )
+)
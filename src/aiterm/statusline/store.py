@@ -0,0 +1,198 @@
+"""Stale-while-revalidate store for slow statusLine segment probes.
+
+Some segments shell out to slow tools (``pip list --outdated``,
+``npm outdated``, ``node --version``). Rendering never waits for them:
+``SegmentStore.get`` returns the last stored value immediately and, when
+it is older than the segment's TTL, starts a detached worker process that
+re-runs the probe and stores the result for the next render.
+
+Probes are registered by name (see ``register_probe``) so the worker can
+run them in a fresh interpreter:
+
+    python -m aiterm.statusline.refresh <probe> '<json args>' [--store PATH]
+
+Entries live in ~/.cache/aiterm/segments.json:
+
+    {"python_env:[\"/repo\",\"\"]": {"value": "venv: py3.11", "time": 1700000000.0}}
+
+Writes re-read the file under ``segments.lock``, so a render marking an
+entry as pending never overwrites a worker's result. The least recently
+written entries are dropped beyond MAX_ENTRIES.
+"""
+
+import importlib
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from aiterm.utils.cache import atomic_write_json, file_lock, get_cache_dir, read_json, record_lookup
+
+STORE_FILE = 'segments.json'
+
+# Keep results for this many probe calls
+MAX_ENTRIES = 64
+
+# Seconds to wait for the store lock
+LOCK_TIMEOUT = 1.0
+
+# Don't start another refresh for an entry while one started this recently
+REFRESH_GRACE = 30
+
+# Modules that register probes (imported by the worker)
+PROBE_MODULES = ['aiterm.statusline.segments']
+
+_PROBES: Dict[str, Callable[..., Any]] = {}
+
+
+def register_probe(name: str, func: Callable[..., Any]) -> None:
+    """Register a probe the background worker can run.
+
+    Args:
+        name: Probe name (also the config TTL key: performance.<name>_ttl)
+        func: Callable taking the probe args, returning a JSON-serializable value
+    """
+    _PROBES[name] = func
+
+
+def get_probe(name: str) -> Optional[Callable[..., Any]]:
+    """Look up a registered probe, importing the probe modules if needed.
+
+    Args:
+        name: Probe name
+
+    Returns:
+        Probe callable or None if unknown
+    """
+    if name not in _PROBES:
+        for module in PROBE_MODULES:
+            importlib.import_module(module)
+    return _PROBES.get(name)
+
+
+def _make_key(probe: str, args: List[Any]) -> str:
+    """Build the store key for a probe call."""
+    return f"{probe}:{json.dumps(args, separators=(',', ':'))}"
+
+
+class SegmentStore:
+    """Last-known probe results with background refresh."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize store.
+
+        Args:
+            path: Store file (defaults to ~/.cache/aiterm/segments.json)
+        """
+        self.path = path or get_cache_dir() / STORE_FILE
+        self.lock_path = self.path.with_suffix('.lock')
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all entries."""
+        entries = read_json(self.path)
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]], key: str, entry: Dict[str, Any]) -> None:
+        """Write one entry as the newest and drop the oldest beyond MAX_ENTRIES."""
+        entries.pop(key, None)
+        entries[key] = entry
+        while len(entries) > MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        atomic_write_json(self.path, entries)
+
+    def get(self, probe: str, args: List[Any], ttl: float) -> Any:
+        """Get the last stored value, refreshing it in the background if stale.
+
+        Args:
+            probe: Registered probe name
+            args: JSON-serializable probe arguments
+            ttl: Seconds a stored value stays fresh (0 = run probe inline)
+
+        Returns:
+            Stored value, or None if nothing has been stored yet
+        """
+        if ttl <= 0:
+            return self.refresh(probe, args)
+
+        key = _make_key(probe, args)
+        entries = self._load()
+        entry = entries.get(key) or {}
+        now = time.time()
+
+        fresh = 'time' in entry and now - entry['time'] < ttl
+        record_lookup('segments', hit=fresh)
+
+        if not fresh and now - entry.get('pending', 0) >= REFRESH_GRACE and self._claim(key, now):
+            _spawn_worker(probe, args, self.path)
+
+        return entry.get('value')
+
+    def _claim(self, key: str, now: float) -> bool:
+        """Mark an entry as being refreshed.
+
+        Returns:
+            True if this caller should start the refresh (no other process
+            stored a result or claimed it in the meantime)
+        """
+        with file_lock(self.lock_path, LOCK_TIMEOUT) as locked:
+            if not locked:
+                return False
+            entries = self._load()
+            entry = dict(entries.get(key) or {})
+            if now - entry.get('pending', 0) < REFRESH_GRACE or entry.get('time', 0) > now:
+                return False
+            entry['pending'] = now
+            self._save(entries, key, entry)
+        return True
+
+    def put(self, probe: str, args: List[Any], value: Any) -> None:
+        """Store a probe result.
+
+        Args:
+            probe: Probe name
+            args: Probe arguments
+            value: JSON-serializable result
+        """
+        with file_lock(self.lock_path, LOCK_TIMEOUT):
+            self._save(self._load(), _make_key(probe, args), {'value': value, 'time': time.time()})
+
+    def refresh(self, probe: str, args: List[Any]) -> Any:
+        """Run a probe now and store its result.
+
+        Args:
+            probe: Registered probe name
+            args: Probe arguments
+
+        Returns:
+            Probe result (None if the probe is unknown or fails)
+        """
+        func = get_probe(probe)
+        if func is None:
+            return None
+
+        try:
+            value = func(*args)
+        except Exception:
+            value = None
+
+        self.put(probe, args, value)
+        return value
+
+
+def _spawn_worker(probe: str, args: List[Any], path: Path) -> None:
+    """Start a detached worker that refreshes one entry."""
+    try:
+        subprocess.Popen(
+            [
+                sys.executable, '-m', 'aiterm.statusline.refresh',
+                probe, json.dumps(args), '--store', str(path),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
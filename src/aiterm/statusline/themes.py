@@ -5,11 +5,51 @@ This module defines color themes for the statusLine, including:
 - cool-blues
 - forest-greens
 
-Each theme specifies ANSI color codes for different segments.
+Each theme specifies ANSI color codes for different segments. Segments
+render from the theme's compiled ThemeTable, which holds every escape
+sequence, separator and powerline edge prebuilt once per process.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, fields
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+RESET = "\033[0m"
+
+# Spaces either side of the separator for each display.separator_spacing mode
+SEPARATOR_SPACING = {
+    'minimal': 1,
+    'standard': 2,
+    'relaxed': 3,
+}
+
+
+@dataclass(frozen=True)
+class ThemeTable:
+    """Prebuilt escape sequences for one theme.
+
+    Attributes:
+        sgr: Theme color key -> full escape sequence (e.g. '\\033[48;5;54m')
+        separators: Spacing mode -> separator with spacing (e.g. '  │  ')
+        dir_open: Directory segment opening edge (colors + ' ░▒▓ ')
+        dir_close: Closes the directory segment when no git segment follows
+        vcs_clean_open: Git segment opening edge for a clean tree
+        vcs_modified_open: Git segment opening edge for a modified tree
+        vcs_close: Git segment closing edge
+    """
+
+    sgr: Mapping[str, str]
+    separators: Mapping[str, str]
+    dir_open: str
+    dir_close: str
+    vcs_clean_open: str
+    vcs_modified_open: str
+    vcs_close: str
+
+    def get_separator(self, spacing_mode: str) -> str:
+        """Get the separator for a spacing mode (unknown modes use 'standard')."""
+        return self.separators.get(spacing_mode, self.separators['standard'])
 
 
 @dataclass
@@ -83,6 +123,44 @@ class Theme:
         """
         return getattr(self, key, '')
 
+    @cached_property
+    def table(self) -> ThemeTable:
+        """Get the compiled escape table (built once per theme, freed with it)."""
+        return compile_theme(self)
+
+
+def compile_theme(theme: Theme) -> ThemeTable:
+    """Prebuild a theme's escape sequences, separators and edges.
+
+    Args:
+        theme: Theme to compile
+
+    Returns:
+        Immutable ThemeTable
+    """
+    sgr = {
+        f.name: f"\033[{getattr(theme, f.name)}m"
+        for f in fields(theme) if f.name != 'name'
+    }
+    separator = f"{sgr['separator_fg']}│{RESET}"
+    separators = {
+        mode: ' ' * spaces + separator + ' ' * spaces
+        for mode, spaces in SEPARATOR_SPACING.items()
+    }
+
+    def vcs_open(bg: str) -> str:
+        return f"\033[38;5;54;{bg}m\033[{bg};{theme.vcs_fg}m"
+
+    return ThemeTable(
+        sgr=MappingProxyType(sgr),
+        separators=MappingProxyType(separators),
+        dir_open=f"\033[{theme.dir_bg};{theme.dir_fg}m ░▒▓ ",
+        dir_close=f"{RESET}\033[38;5;4m▓▒░{RESET}",
+        vcs_clean_open=vcs_open(theme.vcs_clean_bg),
+        vcs_modified_open=vcs_open(theme.vcs_modified_bg),
+        vcs_close=f" {RESET}\033[38;5;60m▓▒░{RESET}",
+    )
+
 
 # =============================================================================
 # Theme Definitions
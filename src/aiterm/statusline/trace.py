@@ -0,0 +1,166 @@
+"""Opt-in render tracing for finding slow statusLine segments.
+
+Set ``AITERM_TRACE=1`` (for the render daemon: in the environment it is
+started from) and every render appends one JSONL record to
+~/.cache/aiterm/trace.jsonl (``AITERM_TRACE_FILE`` overrides the path):
+
+    {"t": 1700000000.0, "cwd": "/repo", "ms": 12.4,
+     "segments": {"git": {"ms": 8.1, "subprocs": 1, "bytes": 912,
+                          "cache": {"git_status": "miss"}, "overrun": false}}}
+
+``bytes`` counts disk cache reads and captured subprocess output. The
+file rotates to trace.jsonl.1 when it grows past MAX_TRACE_BYTES.
+``ait statusline trace`` summarises it.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiterm.utils.cache import get_cache_dir
+
+TRACE_FILE = 'trace.jsonl'
+
+# Rotate the trace file past this size (one backup is kept)
+MAX_TRACE_BYTES = 1024 * 1024
+
+
+def is_enabled() -> bool:
+    """Check whether tracing is switched on (AITERM_TRACE set and not 0)."""
+    return os.environ.get('AITERM_TRACE', '') not in ('', '0')
+
+
+def get_trace_path() -> Path:
+    """Get the trace file path (AITERM_TRACE_FILE or ~/.cache/aiterm/trace.jsonl)."""
+    env_path = os.environ.get('AITERM_TRACE_FILE')
+    if env_path:
+        return Path(env_path).expanduser()
+    return get_cache_dir() / TRACE_FILE
+
+
+def build_record(budget, total: float, cwd: str) -> Dict[str, Any]:
+    """Build a trace record for one render.
+
+    Args:
+        budget: The render's RenderBudget (created with trace=True)
+        total: Render wall time in seconds
+        cwd: Current working directory of the render
+
+    Returns:
+        Trace record dict
+    """
+    segments = {}
+    for name, task in budget.tasks.items():
+        entry: Dict[str, Any] = {'ms': round(budget.timings.get(name, 0.0) * 1000, 2)}
+        if task.span is not None:
+            entry.update(task.span.to_dict())
+        entry['overrun'] = not task.started_run or not task.done.is_set()
+        segments[name] = entry
+
+    return {'t': round(time.time(), 3), 'cwd': cwd, 'ms': round(total * 1000, 2), 'segments': segments}
+
+
+def write_record(record: Dict[str, Any], path: Optional[Path] = None) -> None:
+    """Append a record to the trace file, rotating it when too large.
+
+    Args:
+        record: Trace record
+        path: Trace file (defaults to get_trace_path())
+    """
+    path = path or get_trace_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > MAX_TRACE_BYTES:
+            os.replace(path, path.with_name(path.name + '.1'))
+        with open(path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    except OSError:
+        pass  # Tracing must never break a render
+
+
+def read_records(path: Optional[Path] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Read trace records, oldest first (including the rotated backup).
+
+    Args:
+        path: Trace file (defaults to get_trace_path())
+        limit: Keep only the most recent records
+
+    Returns:
+        Trace records (corrupt lines are skipped)
+    """
+    path = path or get_trace_path()
+    records = []
+    for candidate in (path.with_name(path.name + '.1'), path):
+        try:
+            lines = candidate.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+
+    if limit:
+        records = records[-limit:]
+    return records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Get a percentile by linear interpolation.
+
+    Args:
+        values: Samples (need not be sorted)
+        pct: Percentile (0-100)
+
+    Returns:
+        Percentile value (0.0 for no samples)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_records(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Summarise trace records per segment (and "total" for whole renders).
+
+    Args:
+        records: Trace records
+
+    Returns:
+        Dict mapping name to {"n", "p50", "p95", "max", "subprocs",
+        "kb", "hit_rate", "overruns"}; averages are per render, hit_rate
+        is None when the segment made no cache lookups
+    """
+    samples: Dict[str, List[Dict[str, Any]]] = {'total': []}
+    for record in records:
+        samples['total'].append({'ms': record.get('ms', 0.0)})
+        for name, entry in (record.get('segments') or {}).items():
+            samples.setdefault(name, []).append(entry)
+
+    summary = {}
+    for name, entries in samples.items():
+        if not entries:
+            continue
+        times = [entry.get('ms', 0.0) for entry in entries]
+        lookups = [result for entry in entries for result in (entry.get('cache') or {}).values()]
+        summary[name] = {
+            'n': len(entries),
+            'p50': percentile(times, 50),
+            'p95': percentile(times, 95),
+            'max': max(times),
+            'subprocs': sum(entry.get('subprocs', 0) for entry in entries) / len(entries),
+            'kb': sum(entry.get('bytes', 0) for entry in entries) / len(entries) / 1024,
+            'hit_rate': lookups.count('hit') / len(lookups) if lookups else None,
+            'overruns': sum(1 for entry in entries if entry.get('overrun')),
+        }
+    return summary
@@ -0,0 +1,262 @@
+"""Incremental reader for Claude Code session transcripts.
+
+Transcripts are JSONL files that grow to many megabytes over a long
+session, and statusLine segments only need the newest records (the last
+message time, recent usage). Reading and parsing the whole file on every
+render made those segments O(session length).
+
+- ``tail_records`` seeks back from the end of the file and parses only
+  the trailing records.
+- ``TranscriptReader`` remembers its byte offset: each ``poll`` reads just
+  the bytes appended since the previous one. Readers are shared per path
+  (``get_reader``), so the render daemon follows a transcript across
+  renders.
+
+A final line without a newline may still be being written: it is parsed
+when it is valid JSON but never consumed, so it is read again (complete)
+by the next poll.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bytes read per step when seeking back from the end of a transcript
+BLOCK_SIZE = 16 * 1024
+
+# Give up looking for record boundaries this far from the end
+MAX_TAIL_BYTES = 1024 * 1024
+
+# Readers kept per process (oldest dropped first)
+MAX_READERS = 32
+
+
+def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """Parse one JSONL line (None for blank, corrupt or non-object lines)."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def tail_records(path: str, count: int = 1) -> List[Dict[str, Any]]:
+    """Parse the last records of a transcript without reading all of it.
+
+    Args:
+        path: Transcript path
+        count: Number of records wanted
+
+    Returns:
+        Up to ``count`` records, oldest first (corrupt lines are skipped)
+    """
+    try:
+        with open(path, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            data = b''
+            records: List[Dict[str, Any]] = []
+            while position > 0 and end - position < MAX_TAIL_BYTES:
+                step = min(BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+
+                # The first line may be cut off unless we reached the start
+                lines = data.split(b'\n')
+                complete = lines if position == 0 else lines[1:]
+                records = [r for r in map(_parse_line, complete) if r is not None]
+                if len(records) >= count:
+                    break
+    except OSError:
+        return []
+
+    return records[-count:]
+
+
+def parse_timestamp(record: Dict[str, Any]) -> Optional[float]:
+    """Get a record's time as epoch seconds.
+
+    Accepts numeric timestamps and ISO 8601 strings (as written by Claude
+    Code), and the older ``{"messages": [...]}`` layout, where the last
+    message carries the timestamp.
+
+    Args:
+        record: Transcript record
+
+    Returns:
+        Epoch seconds, or None if missing or invalid
+    """
+    value = record.get('timestamp')
+    if value is None and isinstance(record.get('messages'), list) and record['messages']:
+        last = record['messages'][-1]
+        value = last.get('timestamp') if isinstance(last, dict) else None
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) if value else None
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+class TranscriptReader:
+    """Follows one transcript, reading only bytes appended since the last poll.
+
+    Attributes:
+        path: Transcript path
+        offset: Byte offset just past the last consumed (complete) line
+        last_record: Most recent record seen, or None
+    """
+
+    def __init__(self, path: str, from_start: bool = False):
+        """Initialize reader.
+
+        Args:
+            path: Transcript path
+            from_start: Return every record on the first poll (otherwise the
+                first poll starts at the end of the file)
+        """
+        self.path = path
+        self.from_start = from_start
+        self.offset = 0
+        self.last_record: Optional[Dict[str, Any]] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        # Incremented whenever the position is forgotten (file replaced,
+        # truncated or removed), so callers can drop derived state
+        self.resets = 0
+
+    @property
+    def identity(self) -> Optional[Tuple[int, int]]:
+        """(st_dev, st_ino) of the file being followed, or None."""
+        return self._identity
+
+    def restore(self, offset: int, identity: Tuple[int, int]) -> None:
+        """Resume from a checkpointed position.
+
+        The next poll continues from ``offset`` if the file still has the
+        same identity and is at least that long, and resets otherwise.
+
+        Args:
+            offset: Byte offset from a previous reader
+            identity: That reader's identity
+        """
+        with self._lock:
+            self.offset = offset
+            self._identity = identity
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Read records appended since the previous poll.
+
+        A replaced or truncated file is read again from the start (or, for
+        readers that do not start from the beginning, from its end).
+
+        Returns:
+            New records, oldest first
+        """
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                self._reset(None)
+                return []
+
+            identity = (st.st_dev, st.st_ino)
+            if identity != self._identity or st.st_size < self.offset:
+                self._reset(identity)
+                if not self.from_start:
+                    return self._start_at_end(st.st_size)
+
+            if st.st_size == self.offset:
+                return []
+            return self._read_from_offset()
+
+    def _reset(self, identity: Optional[Tuple[int, int]]) -> None:
+        """Forget the position in the previous file."""
+        self._identity = identity
+        self.offset = 0
+        self.last_record = None
+        self.resets += 1
+
+    def _start_at_end(self, size: int) -> List[Dict[str, Any]]:
+        """Position at the last complete line and remember the newest record."""
+        tail = tail_records(self.path, 1)
+        self.last_record = tail[-1] if tail else None
+        try:
+            with open(self.path, 'rb') as f:
+                start = max(0, size - BLOCK_SIZE)
+                f.seek(start)
+                chunk = f.read(size - start)
+        except OSError:
+            return []
+        newline = chunk.rfind(b'\n')
+        self.offset = start + newline + 1 if newline >= 0 else start
+        return []
+
+    def _read_from_offset(self) -> List[Dict[str, Any]]:
+        """Parse the lines after the current offset."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return []
+
+        lines = data.split(b'\n')
+        partial = lines.pop()  # Empty when the data ends with a newline
+        records = [r for r in map(_parse_line, lines) if r is not None]
+        self.offset += len(data) - len(partial)
+
+        # An unterminated final line is used when it is already valid JSON
+        last = _parse_line(partial)
+        if last is not None:
+            self.last_record = last
+        elif records:
+            self.last_record = records[-1]
+        return records
+
+
+_READERS: Dict[Tuple[str, bool], TranscriptReader] = {}
+_READERS_LOCK = threading.Lock()
+
+
+def get_reader(path: str, from_start: bool = False) -> TranscriptReader:
+    """Get the shared reader for a transcript.
+
+    Args:
+        path: Transcript path
+        from_start: Whether the reader returns every record (see TranscriptReader)
+
+    Returns:
+        TranscriptReader (created on first use)
+    """
+    key = (path, from_start)
+    with _READERS_LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            reader = _READERS[key] = TranscriptReader(path, from_start)
+            while len(_READERS) > MAX_READERS:
+                del _READERS[next(iter(_READERS))]
+        return reader
+
+
+def get_last_record(path: str) -> Optional[Dict[str, Any]]:
+    """Get the newest record of a transcript (incrementally).
+
+    Args:
+        path: Transcript path
+
+    Returns:
+        Newest record, or None if the transcript is missing or has none
+    """
+    reader = get_reader(path)
+    reader.poll()
+    return reader.last_record
@@ -7,16 +7,40 @@ Future integration points:
 - Option A: Parse `claude --usage` command output
 - Option B: Read from Claude Code internal files/database
 - Option C: Use usage fields from JSON input (if added by Claude Code)
+
+Every Claude Code session renders its own statusLine, so usage fetches
+are shared: the last result (even a failure) is kept in
+~/.cache/aiterm/usage.json for USAGE_TTL seconds and misses are
+coalesced behind a lock file, giving one API request per TTL window
+however many sessions are open. The credential is resolved lazily and
+reused in-process for CREDENTIAL_TTL seconds.
+
+Rendering never waits for the network: UsageTracker only reads the cache
+and, when it is stale, starts a detached refresher that fetches and
+writes it for the next render:
+
+    python -m aiterm.statusline.usage
+
+The refresher is only started when a credential resolves; otherwise the
+miss is cached like a failed fetch. get_session_usage and get_weekly_usage
+still return None before reading the cache (Claude Code does not expose
+usage limits), so renders do not reach the refresher yet.
 """
 
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import os
 import subprocess
-import urllib.request
+import sys
+import threading
+import time
 import json
 from pathlib import Path
 
+from aiterm.claude.settings import read_settings
+from aiterm.utils.cache import atomic_write_json, file_lock, get_cache_dir, read_json, record_lookup
+
 
 @dataclass
 class UsageData:
@@ -67,6 +91,208 @@ class UsageData:
             return f"{days}d{hours}h" if hours > 0 else f"{days}d"
 
 
+# Seconds a usage fetch (successful or not) is shared by all processes
+USAGE_TTL = 60
+
+# Seconds a resolved credential is reused within one process
+CREDENTIAL_TTL = 300
+
+# Seconds to wait for another process's fetch (just over the HTTP timeout)
+LOCK_TIMEOUT = 3.0
+
+# Usage older than this is shown with STALE_MARKER
+STALE_AFTER = 300
+
+# Don't start another refresher while one started this recently
+REFRESH_GRACE = 30
+
+STALE_MARKER = '⌛'
+
+USAGE_CACHE_FILE = 'usage.json'
+USAGE_LOCK_FILE = 'usage.lock'
+USAGE_PENDING_FILE = 'usage.pending'
+
+# (resolved at, key) for the process-wide credential lookup
+_CREDENTIAL: Optional[Tuple[float, Optional[str], Optional[str]]] = None
+_CREDENTIAL_LOCK = threading.Lock()
+
+
+def _resolve_api_key() -> Optional[str]:
+    """Look up the Anthropic API key or OAuth token.
+
+    Checks in order:
+    1. macOS Keychain (Claude Code OAuth token)
+    2. aiterm config (anthropic.api_key)
+    3. Environment variable (ANTHROPIC_API_KEY)
+    4. Claude Code settings (apiKey) - usually not present
+
+    Returns:
+        API key/token or None if not found
+    """
+    # Try to get OAuth token from macOS Keychain (Claude Code)
+    if sys.platform == 'darwin':
+        try:
+            result = subprocess.run(
+                ['security', 'find-generic-password', '-s', 'Claude Code-credentials', '-w'],
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+            if result.returncode == 0:
+                creds = json.loads(result.stdout.strip())
+                token = creds.get('claudeAiOauth', {}).get('accessToken')
+                if token:
+                    return token
+        except Exception:
+            pass
+
+    # Check aiterm config
+    try:
+        config_file = Path.home() / '.config' / 'aiterm' / 'statusline.json'
+        if config_file.exists():
+            with open(config_file) as f:
+                config = json.load(f)
+            api_key = config.get('anthropic', {}).get('api_key')
+            if api_key:
+                return api_key
+    except Exception:
+        pass
+
+    # Check environment variable
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if api_key:
+        return api_key
+
+    # Check Claude Code settings (unlikely to exist)
+    api_key = read_settings().get('apiKey')
+    return api_key if isinstance(api_key, str) and api_key else None
+
+
+def get_api_key() -> Optional[str]:
+    """Get the API key or OAuth token, resolved at most once per CREDENTIAL_TTL.
+
+    The Keychain lookup is a subprocess, so the result (including "not
+    found") is kept in memory. It is never written to disk. A change of
+    ANTHROPIC_API_KEY (e.g. a daemon request from another session)
+    resolves it again.
+
+    Returns:
+        API key/token or None if not found
+    """
+    global _CREDENTIAL
+    with _CREDENTIAL_LOCK:
+        now = time.monotonic()
+        env_key = os.environ.get('ANTHROPIC_API_KEY')
+        if _CREDENTIAL is None or now - _CREDENTIAL[0] >= CREDENTIAL_TTL or _CREDENTIAL[1] != env_key:
+            _CREDENTIAL = (now, env_key, _resolve_api_key())
+        return _CREDENTIAL[2]
+
+
+def clear_api_key() -> None:
+    """Forget the cached credential (the next lookup resolves it again)."""
+    global _CREDENTIAL
+    with _CREDENTIAL_LOCK:
+        _CREDENTIAL = None
+
+
+def fetch_usage_cached(
+    fetch: Callable[[], Optional[dict]],
+    cache_file: Optional[Path] = None,
+    ttl: float = USAGE_TTL
+) -> Optional[dict]:
+    """Get usage data, fetching it at most once per TTL across all processes.
+
+    Every concurrent Claude Code session renders its own statusLine. The
+    result of the last fetch, including a failed one, is shared through
+    the cache file. On a miss, processes queue on a lock file: the first
+    one fetches and the others read its result instead of sending their
+    own request.
+
+    Args:
+        fetch: Performs the request (None on failure)
+        cache_file: Shared cache file (defaults to ~/.cache/aiterm/usage.json)
+        ttl: Seconds a fetch result is reused
+
+    Returns:
+        Usage dict or None if unavailable
+    """
+    cache_file = cache_file or get_cache_dir() / USAGE_CACHE_FILE
+
+    def fresh_entry() -> Optional[dict]:
+        entry = read_json(cache_file)
+        if isinstance(entry, dict) and 0 <= time.time() - entry.get('t', 0) < ttl:
+            return entry
+        return None
+
+    entry = fresh_entry()
+    if entry is not None:
+        record_lookup('usage_fetch', hit=True)
+        return entry.get('data')
+
+    with file_lock(cache_file.with_name(USAGE_LOCK_FILE), LOCK_TIMEOUT) as locked:
+        # Another process may have fetched while we waited for the lock
+        entry = fresh_entry()
+        if entry is not None:
+            record_lookup('usage_fetch', hit=True)
+            return entry.get('data')
+        if not locked:
+            # The fetching process is stuck: don't pile on more requests
+            return None
+
+        record_lookup('usage_fetch', hit=False)
+        data = fetch()
+        atomic_write_json(cache_file, {'t': time.time(), 'data': data})
+        return data
+
+
+def read_usage_cache(cache_file: Optional[Path] = None) -> Tuple[Optional[dict], Optional[float]]:
+    """Read the shared usage cache without fetching.
+
+    Args:
+        cache_file: Shared cache file (defaults to ~/.cache/aiterm/usage.json)
+
+    Returns:
+        Tuple of (usage dict or None, seconds since it was fetched or None)
+    """
+    entry = read_json(cache_file or get_cache_dir() / USAGE_CACHE_FILE)
+    if not isinstance(entry, dict) or not isinstance(entry.get('t'), (int, float)):
+        return None, None
+    return entry.get('data'), max(0.0, time.time() - entry['t'])
+
+
+def _claim_refresh(pending_file: Path) -> bool:
+    """Claim the next refresh unless one started within REFRESH_GRACE.
+
+    The claim is the pending file's mtime, kept apart from the cache so a
+    render never overwrites data the refresher has just written.
+    """
+    try:
+        if time.time() - pending_file.stat().st_mtime < REFRESH_GRACE:
+            return False
+    except OSError:
+        pass
+    try:
+        pending_file.parent.mkdir(parents=True, exist_ok=True)
+        pending_file.touch()
+    except OSError:
+        return False
+    return True
+
+
+def _spawn_refresher() -> None:
+    """Start a detached process that fetches usage into the cache."""
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'aiterm.statusline.usage'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
 class UsageTracker:
     """Tracks Claude Code usage limits.
 
@@ -77,120 +303,94 @@ class UsageTracker:
 
     def __init__(self):
         """Initialize usage tracker."""
-        self._api_key = self._get_api_key()
-        self._cache_file = Path.home() / '.cache' / 'aiterm' / 'usage.json'
-        self._cache_ttl = 60  # Cache for 60 seconds
+        self._cache_file = get_cache_dir() / USAGE_CACHE_FILE
+        self._cache_ttl = USAGE_TTL
+        # Seconds since the data last returned by _fetch_api_usage was fetched
+        self.data_age: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the last data read is older than STALE_AFTER."""
+        return self.data_age is not None and self.data_age >= STALE_AFTER
+
+    @property
+    def _api_key(self) -> Optional[str]:
+        """API key/token (resolved lazily, shared per process)."""
+        return get_api_key()
 
     def _get_api_key(self) -> Optional[str]:
         """Get Anthropic API key or OAuth token.
 
-        Checks in order:
-        1. macOS Keychain (Claude Code OAuth token)
-        2. aiterm config (anthropic.api_key)
-        3. Environment variable (ANTHROPIC_API_KEY)
-        4. Claude Code settings (apiKey) - usually not present
-
         Returns:
-            API key/token or None if not found
+            API key/token or None if not found (see get_api_key)
         """
-        import os
-        import subprocess
-        import sys
-
-        # Try to get OAuth token from macOS Keychain (Claude Code)
-        if sys.platform == 'darwin':
-            try:
-                result = subprocess.run(
-                    ['security', 'find-generic-password', '-s', 'Claude Code-credentials', '-w'],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0:
-                    creds = json.loads(result.stdout.strip())
-                    token = creds.get('claudeAiOauth', {}).get('accessToken')
-                    if token:
-                        return token
-            except Exception:
-                pass
-
-        # Check aiterm config
-        try:
-            config_file = Path.home() / '.config' / 'aiterm' / 'statusline.json'
-            if config_file.exists():
-                with open(config_file) as f:
-                    config = json.load(f)
-                api_key = config.get('anthropic', {}).get('api_key')
-                if api_key:
-                    return api_key
-        except Exception:
-            pass
+        return get_api_key()
 
-        # Check environment variable
-        api_key = os.environ.get('ANTHROPIC_API_KEY')
-        if api_key:
-            return api_key
+    def _fetch_api_usage(self) -> Optional[dict]:
+        """Get cached usage data without waiting for the network.
 
-        # Check Claude Code settings (unlikely to exist)
-        try:
-            settings_file = Path.home() / '.claude' / 'settings.json'
-            if settings_file.exists():
-                with open(settings_file) as f:
-                    settings = json.load(f)
-                return settings.get('apiKey')
-        except Exception:
-            pass
+        Starts a background refresh when the cache is older than its TTL
+        and a credential is available, and returns what is cached
+        meanwhile (see data_age).
 
-        return None
+        Returns:
+            Usage dict or None if nothing has been fetched yet
+        """
+        data, age = read_usage_cache(self._cache_file)
+        self.data_age = age
+        fresh = age is not None and age < self._cache_ttl
+        record_lookup('usage', hit=fresh)
+        if not fresh and _claim_refresh(self._cache_file.with_name(USAGE_PENDING_FILE)):
+            if self._api_key:
+                _spawn_refresher()
+            else:
+                # Nothing to fetch with: share the miss instead of forking every TTL
+                atomic_write_json(self._cache_file, {'t': time.time(), 'data': None})
+        return data
 
-    def _fetch_api_usage(self) -> Optional[dict]:
-        """Fetch usage data from Anthropic API.
+    def refresh(self) -> Optional[dict]:
+        """Fetch usage data now (cached and coalesced across processes).
 
         Returns:
             Usage dict or None if fetch fails
         """
-        if not self._api_key:
+        return fetch_usage_cached(self._request_usage, self._cache_file, self._cache_ttl)
+
+    def _request_usage(self) -> Optional[dict]:
+        """Request usage data from the API.
+
+        Returns:
+            Usage dict or None without credentials or on failure
+        """
+        api_key = self._get_api_key()
+        if not api_key:
             return None
 
-        # Check cache first
-        if self._cache_file.exists():
-            try:
-                cache_age = datetime.now().timestamp() - self._cache_file.stat().st_mtime
-                if cache_age < self._cache_ttl:
-                    with open(self._cache_file) as f:
-                        return json.load(f)
-            except Exception:
-                pass
-
-        # Fetch from API
+        # Only the refresher needs HTTP (urllib.request pulls in ssl/email)
+        import urllib.request
+
         try:
             # Determine if using OAuth token or API key
-            if self._api_key and self._api_key.startswith('sk-ant-oat'):
+            if api_key.startswith('sk-ant-oat'):
                 # OAuth token - use Bearer auth
                 headers = {
-                    'Authorization': f'Bearer {self._api_key}'
+                    'Authorization': f'Bearer {api_key}'
                 }
             else:
                 # API key - use x-api-key header
                 headers = {
-                    'x-api-key': self._api_key,
+                    'x-api-key': api_key,
                     'anthropic-version': '2023-06-01'
                 }
 
             req = urllib.request.Request(
-                self.API_USAGE_URL,
+                os.environ.get('AITERM_USAGE_URL', self.API_USAGE_URL),
                 headers=headers
             )
 
             with urllib.request.urlopen(req, timeout=2) as response:
                 data = json.loads(response.read())
-
-            # Cache the result
-            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._cache_file, 'w') as f:
-                json.dump(data, f)
-
-            return data
+            return data if isinstance(data, dict) else None
 
         except Exception:
             return None
@@ -366,8 +566,19 @@ def get_usage_color(usage: UsageData, warning_threshold: int = 80) -> str:
     Returns:
         ANSI color code
     """
-    percent = usage.percent_used()
+    return get_percent_color(usage.percent_used(), warning_threshold)
+
 
+def get_percent_color(percent: float, warning_threshold: int = 80) -> str:
+    """Get color code for a percentage of a limit.
+
+    Args:
+        percent: Percentage used
+        warning_threshold: Percentage threshold for warning (default: 80)
+
+    Returns:
+        ANSI color code
+    """
     if percent < 50:
         return "38;5;2"  # Green
     elif percent < warning_threshold:
@@ -376,3 +587,13 @@ def get_usage_color(usage: UsageData, warning_threshold: int = 80) -> str:
         return "38;5;208"  # Orange
     else:
         return "38;5;1"  # Red
+
+
+def main() -> int:
+    """Refresher entry point: fetch usage into the shared cache."""
+    UsageTracker().refresh()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
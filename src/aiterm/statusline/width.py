@@ -0,0 +1,157 @@
+"""Terminal display width of statusLine strings.
+
+Segment strings mix ANSI escape sequences with emoji icons (🐍 📦 🌳)
+and box-drawing characters. Code point counts are wrong for the emoji,
+which occupy two terminal columns, so right-side alignment drifted. This
+module measures columns instead:
+
+- CSI, OSC and two-byte escape sequences have zero width
+- East Asian wide/fullwidth characters and emoji are two columns
+- Combining marks, zero-width joiners and variation selectors are zero
+  columns (VS16 widens the preceding character to emoji presentation)
+
+Widths are memoized per string; a render measures the same segment
+strings over and over in the daemon.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Tuple
+
+# CSI (colors, cursor), OSC (window title) and two-byte escape sequences
+ANSI_ESCAPE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])')
+
+RESET = "\033[0m"
+
+# Zero width space/non-joiner/joiner, word joiner, text presentation selector
+_ZERO_WIDTH = {'\u200b', '\u200c', '\u200d', '\u2060', '\ufe0e'}
+_ZWJ = '\u200d'
+_VS16 = '\ufe0f'  # Emoji presentation selector
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Get the terminal column width of one character.
+
+    Args:
+        char: Single character
+
+    Returns:
+        0, 1 or 2
+    """
+    code = ord(char)
+    if code < 0x7f:
+        return 1 if code >= 0x20 else 0
+    if char in _ZERO_WIDTH or char == _VS16 or unicodedata.combining(char):
+        return 0
+    category = unicodedata.category(char)
+    if category in ('Mn', 'Me', 'Cf', 'Cc'):
+        return 0
+    if unicodedata.east_asian_width(char) in ('W', 'F'):
+        return 2
+    # Emoji blocks not marked wide by older Unicode databases
+    if 0x1f300 <= code <= 0x1faff:
+        return 2
+    return 1
+
+
+def _text_width(text: str) -> int:
+    """Get the width of text without escape sequences."""
+    if text.isascii():
+        return len(text)
+
+    width = 0
+    previous = 0
+    after_joiner = False
+    for char in text:
+        if char == _VS16:
+            # Emoji presentation widens a narrow base character
+            if previous == 1:
+                width += 1
+                previous = 2
+            continue
+        if after_joiner:
+            # Characters joined by ZWJ render as one glyph
+            after_joiner = False
+            previous = 0
+            continue
+        if char == _ZWJ:
+            after_joiner = True
+            continue
+        previous = char_width(char)
+        width += previous
+    return width
+
+
+@lru_cache(maxsize=1024)
+def display_width(text: str) -> int:
+    """Get the number of terminal columns a string occupies.
+
+    Args:
+        text: Text, possibly with ANSI escape sequences
+
+    Returns:
+        Visible width in columns
+    """
+    if '\x1b' not in text:
+        return _text_width(text)
+    return sum(_text_width(chunk) for chunk in ANSI_ESCAPE.split(text))
+
+
+def truncate(text: str, width: int, ellipsis: str = '…') -> str:
+    """Shorten a string to fit a column width, keeping escape sequences.
+
+    Args:
+        text: Text, possibly with ANSI escape sequences
+        width: Maximum width in columns
+        ellipsis: Marker appended when text is cut (counts towards width)
+
+    Returns:
+        The text unchanged if it fits, otherwise its visible prefix plus
+        ellipsis (and a reset when the text contained escape sequences)
+    """
+    if display_width(text) <= width:
+        return text
+
+    budget = width - display_width(ellipsis)
+    if budget < 0:
+        return ''
+
+    parts: List[str] = []
+    used = 0
+    position = 0
+    has_escapes = False
+    for match in ANSI_ESCAPE.finditer(text):
+        used, done = _take(text[position:match.start()], budget, used, parts)
+        if done:
+            break
+        parts.append(match.group())
+        has_escapes = True
+        position = match.end()
+    else:
+        _take(text[position:], budget, used, parts)
+
+    result = ''.join(parts) + ellipsis
+    return result + RESET if has_escapes else result
+
+
+def _take(chunk: str, budget: int, used: int, parts: List[str]) -> Tuple[int, bool]:
+    """Append as much of a plain chunk as fits in the remaining budget.
+
+    Returns:
+        (columns used so far, whether the budget is exhausted)
+    """
+    chunk_width = _text_width(chunk)
+    if used + chunk_width <= budget:
+        parts.append(chunk)
+        return used + chunk_width, False
+
+    # Grow the prefix so selectors and joined glyphs are measured together
+    end = 0
+    for index in range(1, len(chunk) + 1):
+        if used + _text_width(chunk[:index]) > budget:
+            break
+        end = index
+    parts.append(chunk[:end])
+    return used + _text_width(chunk[:end]), True
@@ -81,11 +81,9 @@ def apply_context(context: ContextInfo) -> bool:
         TerminalType.WEZTERM,
         TerminalType.APPLE_TERMINAL,
     ):
-        import sys
+        from aiterm.terminal.state import emit
 
-        title = context.title
-        sys.stdout.write(f"\033]2;{title}\007")
-        sys.stdout.flush()
+        emit({"title": f"\033]2;{context.title}\007"})
         return True
 
     return False
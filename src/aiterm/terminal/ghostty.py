@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Optional
 
 from aiterm.context.detector import ContextInfo
+from aiterm.terminal.state import emit
 
 
 @dataclass
@@ -412,7 +413,9 @@ def apply_context(context: ContextInfo) -> None:
         title_parts.append(f"({context.branch})")
 
     title = " ".join(title_parts) if title_parts else context.title
-    set_title(title)
+    if is_ghostty():
+        # Skips the write when the title is already applied (aiterm.terminal.state)
+        emit({"title": f"\033]2;{title}\007"})
 
 
 def show_config() -> str:
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from aiterm.context.detector import ContextInfo
+from aiterm.terminal.state import emit
 
 
 @dataclass
@@ -36,6 +37,22 @@ def _write_escape(sequence: str) -> None:
     sys.stdout.flush()
 
 
+def _profile_sequence(profile: str) -> str:
+    """Build the profile switch escape sequence."""
+    return f"\033]1337;SetProfile={profile}\007"
+
+
+def _title_sequence(title: str) -> str:
+    """Build the window title escape sequence (OSC 2)."""
+    return f"\033]2;{title}\007"
+
+
+def _user_var_sequence(name: str, value: str) -> str:
+    """Build a user variable escape sequence (value is base64 encoded)."""
+    encoded = base64.b64encode(value.encode()).decode()
+    return f"\033]1337;SetUserVar={name}={encoded}\007"
+
+
 def switch_profile(profile: str) -> bool:
     """Switch iTerm2 profile.
 
@@ -52,7 +69,7 @@ def switch_profile(profile: str) -> bool:
         return False
 
     _state.current_profile = profile
-    _write_escape(f"\033]1337;SetProfile={profile}\007")
+    _write_escape(_profile_sequence(profile))
     return True
 
 
@@ -72,7 +89,7 @@ def set_title(title: str) -> bool:
         return False
 
     _state.current_title = title
-    _write_escape(f"\033]2;{title}\007")  # OSC 2 - Window title
+    _write_escape(_title_sequence(title))
     return True
 
 
@@ -86,8 +103,7 @@ def set_user_var(name: str, value: str) -> None:
     if not is_iterm2():
         return
 
-    encoded = base64.b64encode(value.encode()).decode()
-    _write_escape(f"\033]1337;SetUserVar={name}={encoded}\007")
+    _write_escape(_user_var_sequence(name, value))
 
 
 def set_status_vars(icon: str, name: str, branch: str, profile: str) -> None:
@@ -108,17 +124,32 @@ def set_status_vars(icon: str, name: str, branch: str, profile: str) -> None:
 def apply_context(context: ContextInfo) -> None:
     """Apply a context to iTerm2 (profile, title, and status bar).
 
+    Only sequences that differ from the terminal's last applied state are
+    written; profile switches during a burst of calls are coalesced (see
+    aiterm.terminal.state).
+
     Args:
         context: The context info to apply.
     """
-    switch_profile(context.profile)
-    set_title(context.title)
-    set_status_vars(
-        context.icon,
-        context.name,
-        context.branch or "",
-        context.profile,
-    )
+    if not is_iterm2():
+        return
+
+    sequences = {}
+    if _state.current_profile != context.profile:
+        sequences["profile"] = _profile_sequence(context.profile)
+    if _state.current_title != context.title:
+        sequences["title"] = _title_sequence(context.title)
+    for name, value in (
+        ("ctxIcon", context.icon),
+        ("ctxName", context.name),
+        ("ctxBranch", context.branch or ""),
+        ("ctxProfile", context.profile),
+    ):
+        sequences[f"var:{name}"] = _user_var_sequence(name, value)
+
+    _state.current_profile = context.profile
+    _state.current_title = context.title
+    emit(sequences, deferrable=("profile",))
 
 
 # Session management (for focus mode)
@@ -0,0 +1,223 @@
+"""Last-applied terminal state, per TTY.
+
+Context switching runs in a fresh process on every ``cd``, so the
+in-process dedupe in aiterm.terminal.iterm2 never sees the previous
+switch: every call re-sent the profile switch, title and user vars.
+Terminal escape sequences are now grouped into named slots
+(``profile``, ``title``, ``var:ctxName`` ...) and the last sequence
+applied to each slot is kept in ~/.cache/aiterm/terminal/<tty>-<sid>.json.
+``emit`` writes only the slots whose sequence changed.
+
+Bursts of ``cd`` (scripts, ``cd -`` toggling, pushd/popd) made the
+profile flicker. The first change after a quiet period is applied at
+once, so a single ``cd`` switches without delay. When a call arrives
+within DEBOUNCE seconds of the previous one, changes to deferrable slots
+(the profile) are held as pending and a detached flusher applies the
+latest pending value once the burst has been quiet for DEBOUNCE seconds.
+A burst therefore costs at most one switch beyond its first change:
+from a settled terminal, A -> B -> A switches to B and back to A once,
+and any further bouncing inside the window switches nothing more.
+
+``emit`` and the flusher update the state file under ``<key>.lock``, so
+a pending profile is never lost between them.
+
+The flusher inherits stdout, which is the terminal for shell hooks:
+
+    python -m aiterm.terminal.state <tty key> <pending time>
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from aiterm.utils.cache import atomic_write_json, file_lock, get_cache_dir, read_json
+
+STATE_DIR = 'terminal'
+
+# Seconds between calls that count as one burst
+DEBOUNCE = 0.3
+
+# Seconds to wait for a terminal's state lock
+LOCK_TIMEOUT = 1.0
+
+
+def get_terminal_key() -> Optional[str]:
+    """Identify the terminal session that stdout is attached to.
+
+    TTY names are reused by new tabs, so the key also holds the session
+    id (the shell's, for commands run from it).
+
+    Returns:
+        File-name-safe key (e.g. "dev_ttys003-4242"), or None when stdout
+        is not a TTY
+    """
+    try:
+        name = os.ttyname(sys.stdout.fileno())
+        sid = os.getsid(0)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return re.sub(r'[^A-Za-z0-9._-]', '_', f"{name.lstrip('/')}-{sid}")
+
+
+def get_state_path(key: str) -> Path:
+    """Get the state file for a terminal key."""
+    return get_cache_dir() / STATE_DIR / f"{key}.json"
+
+
+def _lock(key: str):
+    """Lock a terminal's state file for a read-modify-write."""
+    return file_lock(get_state_path(key).with_suffix('.lock'), LOCK_TIMEOUT)
+
+
+def load_state(key: str) -> Dict[str, Any]:
+    """Load a terminal's state: {"applied": {}, "pending": {}, "t": 0.0}."""
+    state = read_json(get_state_path(key))
+    if not isinstance(state, dict):
+        state = {}
+    state.setdefault('applied', {})
+    state.setdefault('pending', {})
+    state.setdefault('t', 0.0)
+    return state
+
+
+def _write(sequences: Iterable[str]) -> None:
+    """Write escape sequences to stdout."""
+    output = ''.join(sequences)
+    if output:
+        sys.stdout.write(output)
+        sys.stdout.flush()
+
+
+def emit(sequences: Dict[str, str], deferrable: Iterable[str] = (), key: Optional[str] = None) -> List[str]:
+    """Write the escape sequences that differ from the terminal's last state.
+
+    Args:
+        sequences: Slot name -> escape sequence, in output order
+        deferrable: Slots held back (and coalesced) during a burst
+        key: Terminal key (defaults to get_terminal_key()); without one
+            every sequence is written
+
+    Returns:
+        Slots written now
+    """
+    key = key or get_terminal_key()
+    if key is None:
+        _write(sequences.values())
+        return list(sequences)
+
+    with _lock(key):
+        state = load_state(key)
+        applied, pending = state['applied'], state['pending']
+        now = time.time()
+        in_burst = now - state['t'] < DEBOUNCE
+
+        written = []
+        deferred = False
+        for slot, sequence in sequences.items():
+            if slot in deferrable:
+                if applied.get(slot) == sequence:
+                    pending.pop(slot, None)  # Burst came back to the applied value
+                    continue
+                if in_burst or slot in pending:
+                    pending[slot] = sequence
+                    deferred = True
+                    continue
+            elif applied.get(slot) == sequence:
+                continue
+            applied[slot] = sequence
+            written.append(slot)
+
+        _write(sequences[slot] for slot in written)
+        state['t'] = now
+        if pending:
+            state['pending_t'] = now
+        atomic_write_json(get_state_path(key), state)
+
+    if deferred:
+        _spawn_flusher(key, now)
+    return written
+
+
+def flush(key: str, pending_t: float, wait: bool = True) -> List[str]:
+    """Apply a terminal's pending sequences once the burst is over.
+
+    Args:
+        key: Terminal key
+        pending_t: Time of the call that started this flusher
+        wait: Sleep until the debounce window has passed
+
+    Returns:
+        Slots written (empty if a newer call took over)
+    """
+    if wait:
+        time.sleep(max(0.0, pending_t + DEBOUNCE - time.time()))
+
+    with _lock(key):
+        state = load_state(key)
+        if state.get('pending_t') != pending_t or not state['pending']:
+            return []  # Superseded by a newer call (its flusher applies it)
+
+        pending = state['pending']
+        _write(pending.values())
+        state['applied'].update(pending)
+        state['pending'] = {}
+        state['t'] = time.time()
+        atomic_write_json(get_state_path(key), state)
+    return list(pending)
+
+
+def clear_state(key: Optional[str] = None) -> None:
+    """Forget a terminal's applied state (the next emit writes everything).
+
+    Args:
+        key: Terminal key (defaults to get_terminal_key())
+    """
+    key = key or get_terminal_key()
+    if key is not None:
+        path = get_state_path(key)
+        for stale in (path, path.with_suffix('.lock')):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _spawn_flusher(key: str, pending_t: float) -> None:
+    """Start a detached flusher that writes to this process's stdout."""
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'aiterm.terminal.state', key, repr(pending_t)],
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Flusher entry point.
+
+    Args:
+        argv: [key, pending time] (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        return 2
+    try:
+        pending_t = float(argv[1])
+    except ValueError:
+        return 2
+    flush(argv[0], pending_t)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Disk cache helpers for statusLine state in ~/.cache/aiterm.
+
+Small JSON files shared between statusLine invocations (and the render
+daemon). Writes are atomic (temp file + rename) so a concurrent reader
+never sees a partial file, and hit/miss counters are kept per cache name
+in ``stats.json`` so hit rates can be checked with
+``ait statusline cache stats``.
+
+Counters are collected in memory and merged into ``stats.json`` under a
+lock by ``flush_stats``: once at process exit, and after each request in
+the render daemon. A cache hit therefore costs no disk write, and
+concurrent processes do not overwrite each other's counts.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from aiterm.utils.tracing import note_cache, note_read
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, file_lock lets every caller proceed
+    fcntl = None  # type: ignore[assignment]
+
+STATS_FILE = 'stats.json'
+STATS_LOCK_FILE = 'stats.lock'
+
+# Seconds to wait for the stats lock (unflushed counts are kept for later)
+STATS_LOCK_TIMEOUT = 0.5
+
+# Counts not yet merged into stats.json: {name: {"hits": n, "misses": n}}
+_PENDING: Dict[str, Dict[str, int]] = {}
+_PENDING_LOCK = threading.Lock()
+_FLUSH_REGISTERED = False
+
+
+def get_cache_dir() -> Path:
+    """Get the runtime cache directory.
+
+    Uses AITERM_CACHE_DIR if set, otherwise ~/.cache/aiterm.
+
+    Returns:
+        Cache directory path (may not exist yet)
+    """
+    env_path = os.environ.get('AITERM_CACHE_DIR')
+    if env_path:
+        return Path(env_path).expanduser()
+    return Path.home() / '.cache' / 'aiterm'
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """Read a JSON cache file.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        Parsed JSON, or None if missing or corrupt
+    """
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    note_read(len(content))
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def atomic_write_json(path: Path, data: Any) -> bool:
+    """Write a JSON cache file atomically.
+
+    Args:
+        path: Cache file path
+        data: JSON-serializable data
+
+    Returns:
+        True if written, False on error (caches are best-effort)
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float) -> Iterator[bool]:
+    """Hold an exclusive advisory lock on a lock file.
+
+    Used to make one process (of many concurrent statusLine renders) do a
+    slow refresh while the others wait for its result.
+
+    Args:
+        path: Lock file path (created if missing)
+        timeout: Seconds to wait for the lock
+
+    Yields:
+        True if the caller may go ahead: the lock is held, or locking is
+        unavailable (no fcntl, or the lock file cannot be opened) and the
+        caller proceeds without it. False if another process held the
+        lock for the whole timeout.
+    """
+    if fcntl is None:
+        yield True
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        yield True
+        return
+
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    yield False
+                    return
+                time.sleep(0.02)
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def record_lookup(name: str, hit: bool) -> None:
+    """Count a cache hit or miss (in memory until flush_stats).
+
+    Args:
+        name: Cache name (e.g. "git_status")
+        hit: True for a hit, False for a miss
+    """
+    global _FLUSH_REGISTERED
+    note_cache(name, hit)
+    field = 'hits' if hit else 'misses'
+    with _PENDING_LOCK:
+        counters = _PENDING.setdefault(name, {'hits': 0, 'misses': 0})
+        counters[field] += 1
+        if not _FLUSH_REGISTERED:
+            atexit.register(flush_stats)
+            _FLUSH_REGISTERED = True
+
+
+def flush_stats() -> None:
+    """Merge in-memory counters into stats.json."""
+    with _PENDING_LOCK:
+        if not _PENDING:
+            return
+        pending = {name: dict(counters) for name, counters in _PENDING.items()}
+        _PENDING.clear()
+
+    cache_dir = get_cache_dir()
+    written = False
+    with file_lock(cache_dir / STATS_LOCK_FILE, STATS_LOCK_TIMEOUT) as locked:
+        if locked:
+            path = cache_dir / STATS_FILE
+            stats = read_json(path)
+            if not isinstance(stats, dict):
+                stats = {}
+            for name, counters in pending.items():
+                merged = stats.setdefault(name, {'hits': 0, 'misses': 0})
+                for field, count in counters.items():
+                    merged[field] = merged.get(field, 0) + count
+            written = atomic_write_json(path, stats)
+
+    if not written:
+        # Keep the counts for the next flush
+        with _PENDING_LOCK:
+            for name, counters in pending.items():
+                merged = _PENDING.setdefault(name, {'hits': 0, 'misses': 0})
+                for field, count in counters.items():
+                    merged[field] += count
+
+
+def get_stats() -> Dict[str, Dict[str, int]]:
+    """Get hit/miss counters for all caches (including this process's).
+
+    Returns:
+        Dict mapping cache name to {"hits": n, "misses": n}
+    """
+    flush_stats()
+    stats = read_json(get_cache_dir() / STATS_FILE)
+    return stats if isinstance(stats, dict) else {}
+
+
+def clear_cache() -> int:
+    """Remove all JSON cache files (including counters).
+
+    Returns:
+        Number of files removed
+    """
+    with _PENDING_LOCK:
+        _PENDING.clear()
+    removed = 0
+    try:
+        paths = list(get_cache_dir().glob('*.json'))
+    except OSError:
+        return 0
+
+    for path in paths:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,101 @@
+"""Per-thread work counters for statusLine tracing.
+
+A span collects what one segment did while it ran in the current thread:
+subprocesses started, bytes read (disk caches and subprocess output) and
+cache hits/misses. Counting is free when no span is active, and the
+subprocess hook is only installed once tracing is first switched on.
+
+    span = start_span()
+    ...  # segment work
+    end_span()
+    span.subprocesses, span.bytes_read, span.caches
+"""
+
+import subprocess
+import threading
+from typing import Dict, Optional
+
+_local = threading.local()
+
+_ORIGINAL_POPEN = subprocess.Popen
+
+
+class Span:
+    """Counters for work done in one thread."""
+
+    __slots__ = ('subprocesses', 'bytes_read', 'caches')
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.subprocesses = 0
+        self.bytes_read = 0
+        self.caches: Dict[str, str] = {}
+
+    def to_dict(self) -> dict:
+        """Compact form for trace records."""
+        return {'subprocs': self.subprocesses, 'bytes': self.bytes_read, 'cache': dict(self.caches)}
+
+
+def start_span() -> Span:
+    """Start counting work done in the current thread.
+
+    Returns:
+        The new span (replaces any active span)
+    """
+    span = Span()
+    _local.span = span
+    return span
+
+
+def end_span() -> None:
+    """Stop counting in the current thread."""
+    _local.span = None
+
+
+def current_span() -> Optional[Span]:
+    """Get the current thread's active span, if any."""
+    return getattr(_local, 'span', None)
+
+
+def note_subprocess() -> None:
+    """Count a subprocess started in the current span."""
+    span = current_span()
+    if span is not None:
+        span.subprocesses += 1
+
+
+def note_read(size: int) -> None:
+    """Count bytes read in the current span."""
+    span = current_span()
+    if span is not None:
+        span.bytes_read += size
+
+
+def note_cache(name: str, hit: bool) -> None:
+    """Record a cache lookup in the current span (last result per cache wins)."""
+    span = current_span()
+    if span is not None:
+        span.caches[name] = 'hit' if hit else 'miss'
+
+
+class _TracedPopen(_ORIGINAL_POPEN):
+    """Popen that reports process starts and captured output to the span."""
+
+    def __init__(self, *args, **kwargs):
+        note_subprocess()
+        super().__init__(*args, **kwargs)
+
+    def communicate(self, *args, **kwargs):
+        stdout, stderr = super().communicate(*args, **kwargs)
+        note_read(len(stdout or b'') + len(stderr or b''))
+        return stdout, stderr
+
+
+def install() -> None:
+    """Route subprocess.Popen (and so subprocess.run) through the counters."""
+    subprocess.Popen = _TracedPopen
+
+
+def uninstall() -> None:
+    """Restore the original subprocess.Popen."""
+    subprocess.Popen = _ORIGINAL_POPEN
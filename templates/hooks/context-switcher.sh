@@ -20,14 +20,9 @@ CWD="${CLAUDE_CWD:-$PWD}"
 
 # Detect and apply context
 if [ -d "$CWD" ]; then
-    # Run aiterm switch silently
-    aiterm switch "$CWD" 2>/dev/null
-
-    # Show brief notification
-    CONTEXT=$(aiterm detect "$CWD" 2>/dev/null | grep "Type" | awk '{print $2, $3}')
-    if [ -n "$CONTEXT" ]; then
-        echo "🎨 Context: $CONTEXT"
-    fi
+    # Apply context (served from the context cache when unchanged); --print
+    # puts the context type on the first line for the brief notification
+    aiterm switch "$CWD" --cached --print 2>/dev/null | sed '1s/^/🎨 Context: /'
 fi
 
 exit 0
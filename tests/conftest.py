@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from aiterm.utils import cache as cache_module
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Isolate aiterm's on-disk caches (~/.cache/aiterm) and unflushed counters."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv('AITERM_CACHE_DIR', str(path))
+    monkeypatch.setattr(cache_module, '_PENDING', {})
+    return path
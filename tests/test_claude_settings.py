@@ -12,8 +12,10 @@ from aiterm.claude.settings import (
     get_preset,
     list_presets,
     load_settings,
+    read_settings,
     save_settings,
 )
+from aiterm.claude import settings as settings_module
 
 
 class TestClaudeSettings:
@@ -42,6 +44,53 @@ class TestClaudeSettings:
         assert settings.deny_list == []
 
 
+class TestReadSettings:
+    """Tests for the shared, change-validated settings reader."""
+
+    def test_parsed_once_per_change(self, tmp_path: Path, monkeypatch) -> None:
+        """Should reparse only when the file changes."""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"alwaysThinkingEnabled": True}))
+        parses = []
+        real_loads = json.loads
+        monkeypatch.setattr(settings_module.json, "loads", lambda s: parses.append(s) or real_loads(s))
+
+        assert read_settings(settings_file)["alwaysThinkingEnabled"] is True
+        assert read_settings(settings_file) is read_settings(settings_file)
+        assert len(parses) == 1
+
+        settings_file.write_text(json.dumps({"alwaysThinkingEnabled": False, "apiKey": "k"}))
+        assert read_settings(settings_file)["apiKey"] == "k"
+        assert len(parses) == 2
+
+    def test_read_only(self, tmp_path: Path) -> None:
+        """Should hand out views that cannot be modified."""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"mcpServers": {"fs": {"args": ["-y"]}}}))
+
+        view = read_settings(settings_file)
+        with pytest.raises(TypeError):
+            view["apiKey"] = "k"
+        with pytest.raises(TypeError):
+            view["mcpServers"]["fs"]["command"] = "npx"
+        assert view["mcpServers"]["fs"]["args"] == ("-y",)
+
+    @pytest.mark.parametrize("content", [None, "{invalid", "[1, 2]"])
+    def test_missing_or_invalid(self, tmp_path: Path, content) -> None:
+        """Should return an empty view for missing or invalid files."""
+        settings_file = tmp_path / "settings.json"
+        if content is not None:
+            settings_file.write_text(content)
+        assert dict(read_settings(settings_file)) == {}
+
+    def test_defaults_to_home(self, tmp_path: Path, monkeypatch) -> None:
+        """Should read ~/.claude/settings.json by default."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "settings.json").write_text(json.dumps({"outputStyle": "terse"}))
+        assert read_settings()["outputStyle"] == "terse"
+
+
 class TestLoadSettings:
     """Tests for load_settings function."""
 
@@ -0,0 +1,106 @@
+"""Tests for lazy command group loading in the ait CLI.
+
+Tests cover:
+- Manifest matches the command modules
+- Groups load on invocation, help lists them without importing
+- Import-time regression cap for `ait --version`
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from aiterm.cli.lazy import LAZY_GROUPS, LazyTyperGroup, load_group
+from aiterm.cli.main import app
+
+runner = CliRunner()
+
+# Extra time aiterm may add on top of importing typer and rich
+MAX_IMPORT_OVERHEAD = 0.2
+
+
+def _run_python(code: str) -> str:
+    """Run code in a fresh interpreter and return stdout."""
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+class TestManifest:
+    """Test the static manifest against the real modules."""
+
+    @pytest.mark.parametrize('name', sorted(LAZY_GROUPS))
+    def test_manifest_matches_module(self, name):
+        """Each entry points at a module with a Typer app and the same help."""
+        spec = LAZY_GROUPS[name]
+        module = importlib.import_module(spec.module)
+        assert module.app.info.help == spec.help
+
+    def test_load_group_names_and_hides(self):
+        """Loaded groups use the manifest name and hidden flag."""
+        group = load_group('recipes')
+        assert group.name == 'recipes'
+        assert group.hidden
+
+
+class TestLazyLoading:
+    """Test invoking and listing lazy groups."""
+
+    def test_help_lists_lazy_groups(self):
+        """Root help lists manifest groups but not hidden aliases."""
+        result = runner.invoke(app, ['--help'])
+        assert result.exit_code == 0
+        assert 'statusline' in result.output
+        assert 'recipes' not in result.output
+
+    def test_invoke_lazy_group(self):
+        """Invoking a group loads its real commands."""
+        result = runner.invoke(app, ['statusline', '--help'])
+        assert result.exit_code == 0
+        assert 'render' in result.output
+
+    def test_hidden_alias_invokes(self):
+        """Hidden aliases still work."""
+        result = runner.invoke(app, ['recipes', '--help'])
+        assert result.exit_code == 0
+
+    def test_unknown_command(self):
+        """Unknown commands fail as before."""
+        result = runner.invoke(app, ['no-such-command'])
+        assert result.exit_code != 0
+
+    def test_root_group_class(self):
+        """The root command uses the lazy group."""
+        import typer
+        assert isinstance(typer.main.get_command(app), LazyTyperGroup)
+
+
+class TestStartup:
+    """Regression tests for CLI startup cost."""
+
+    def test_version_imports_no_command_modules(self):
+        """`ait --version` and `ait --help` import none of the command group modules."""
+        output = _run_python(
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from aiterm.cli.main import app\n"
+            "CliRunner().invoke(app, ['--version'])\n"
+            "CliRunner().invoke(app, ['--help'])\n"
+            "from aiterm.cli.lazy import LAZY_GROUPS\n"
+            "print(' '.join(sorted({g.module for g in LAZY_GROUPS.values()} & set(sys.modules))))\n"
+        )
+        assert output.strip() == ""
+
+    def test_import_time_cap(self):
+        """Importing the CLI adds little on top of typer and rich."""
+        output = _run_python(
+            "import time\n"
+            "import typer, rich.console, rich.panel, rich.table\n"
+            "start = time.perf_counter()\n"
+            "import aiterm.cli.main\n"
+            "print(time.perf_counter() - start)\n"
+        )
+        assert float(output) < MAX_IMPORT_OVERHEAD
@@ -0,0 +1,162 @@
+"""Tests for the persistent context cache and `ait switch --cached`.
+
+Tests cover:
+- Cache hits, and misses when markers, git state or age change
+- Entry bounds and malformed entries
+- Fast-path argument matching and a typer-free `ait switch --cached`
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from aiterm.cli.entry import _parse_fast_switch, fast_switch
+from aiterm.cli.main import app
+from aiterm.context import cache
+from aiterm.context.detector import ContextType
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A Python project directory."""
+    path = tmp_path / "proj"
+    path.mkdir()
+    (path / "pyproject.toml").write_text('name = "demo"\n')
+    return path.resolve()
+
+
+def _bump_mtime(path):
+    """Move a path's mtime forward (same-tick writes keep their mtime)."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestContextCache:
+    """Test cache hits and invalidation."""
+
+    def test_miss_then_hit(self, project, monkeypatch):
+        """The second lookup is served without detection."""
+        first = cache.detect_context_cached(project)
+        assert first.type == ContextType.PYTHON
+        assert first.name == "demo"
+
+        def fail(path):
+            raise AssertionError("detect_context should not run on a hit")
+
+        monkeypatch.setattr(cache, 'detect_context', fail)
+        assert cache.detect_context_cached(project) == first
+
+    def test_marker_edit_invalidates(self, project):
+        """Editing a marker file in place is a miss."""
+        cache.detect_context_cached(project)
+        (project / "pyproject.toml").write_text('name = "renamed"\n')
+        _bump_mtime(project / "pyproject.toml")
+
+        assert cache.get_cached_context(project) is None
+        assert cache.detect_context_cached(project).name == "renamed"
+
+    def test_new_marker_invalidates(self, project):
+        """Adding a file to the directory is a miss."""
+        cache.detect_context_cached(project)
+        (project / "DESCRIPTION").write_text("Package: rpkg\n")
+        _bump_mtime(project)
+
+        assert cache.detect_context_cached(project).type == ContextType.R_PACKAGE
+
+    def test_git_head_invalidates(self, project):
+        """Switching branches (HEAD changes) is a miss."""
+        git_dir = project / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        cache.store_context(project, cache.detect_context(project))
+        assert cache.get_cached_context(project) is not None
+
+        (git_dir / "HEAD").write_text("ref: refs/heads/feature\n")
+        _bump_mtime(git_dir / "HEAD")
+        assert cache.get_cached_context(project) is None
+
+    def test_expired_entry(self, project, monkeypatch):
+        """Entries older than MAX_AGE are misses."""
+        cache.detect_context_cached(project)
+        monkeypatch.setattr(cache, 'MAX_AGE', -1)
+        assert cache.get_cached_context(project) is None
+
+    def test_malformed_entry(self, project, cache_dir):
+        """Corrupt entries are treated as misses."""
+        cache_dir.mkdir()
+        stamp = cache.get_stamp(project)
+        (cache_dir / cache.CONTEXT_CACHE_FILE).write_text(json.dumps({
+            str(project): {'t': 9e12, 'stamp': stamp, 'context': {'type': 'nope'}},
+        }))
+        assert cache.get_cached_context(project) is None
+
+    def test_entries_bounded(self, tmp_path, monkeypatch):
+        """Only the most recent MAX_ENTRIES directories are kept."""
+        monkeypatch.setattr(cache, 'MAX_ENTRIES', 2)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            cache.detect_context_cached(tmp_path / name)
+
+        entries = json.loads(cache.get_cache_path().read_text())
+        assert [os.path.basename(key) for key in entries] == ["b", "c"]
+
+
+class TestFastSwitch:
+    """Test the typer-free `ait switch --cached` path."""
+
+    @pytest.mark.parametrize('args,expected', [
+        (['switch', '--cached'], []),
+        (['switch', '/tmp', '--cached', '-q'], ['/tmp']),
+        (['switch'], None),
+        (['switch', '--cached', '--help'], None),
+        (['detect', '--cached'], None),
+        (['switch', 'a', 'b', '--cached'], None),
+        (['switch', '/tmp', '--cached', '--print'], ['/tmp']),
+    ])
+    def test_parse(self, args, expected):
+        """Only `switch [PATH] --cached [--quiet] [--print]` takes the fast path."""
+        assert _parse_fast_switch(args) == expected
+
+    def test_no_typer_or_rich(self, project, cache_dir):
+        """The fast path emits escape sequences without importing typer or rich."""
+        env = dict(os.environ, TERM_PROGRAM='iTerm.app', AITERM_CACHE_DIR=str(cache_dir))
+        code = (
+            "import sys\n"
+            f"sys.argv = ['ait', 'switch', {str(project)!r}, '--cached']\n"
+            "from aiterm.cli.entry import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('|' + ' '.join(sorted({'typer', 'rich'} & set(sys.modules))))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert "\033]1337;SetProfile=Python-Dev\007" in result.stdout
+        assert result.stdout.endswith("|\n")
+
+    def test_print_type(self, project, capsys):
+        """--print puts the context type on the first line."""
+        assert fast_switch(str(project), print_type=True) == 0
+        assert capsys.readouterr().out.split('\n')[0] == "🐍 python"
+
+    def test_cli_print_type(self, project):
+        """`ait switch --cached --print` through the Typer app prints only the type."""
+        result = runner.invoke(app, ["switch", str(project), "--cached", "--print"])
+        assert result.exit_code == 0
+        assert result.output.split('\n')[0] == "🐍 python"
+        assert "Context Detection" not in result.output
+
+    def test_cli_cached_is_quiet(self, project):
+        """`ait switch --cached` through the Typer app prints no table."""
+        result = runner.invoke(app, ["switch", str(project), "--cached"])
+        assert result.exit_code == 0
+        assert "Context Detection" not in result.output
+        assert cache.get_cached_context(project) is not None
@@ -0,0 +1,94 @@
+"""Tests for the directory fingerprint index.
+
+Tests cover:
+- Marker queries answered from one listing
+- Reuse while the directory is unchanged, rescans when it changes
+- File contents cached by the file's own stamp
+- Project names from marker files
+"""
+
+import os
+
+import pytest
+
+from aiterm.context import index as index_module
+from aiterm.context.index import DirectoryIndex, clear_indexes, get_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes(monkeypatch):
+    """Start from an empty cache; treat every listing as settled."""
+    clear_indexes()
+    monkeypatch.setattr(index_module, 'RACY_NS', -10**18)
+    yield
+    clear_indexes()
+
+
+class TestDirectoryIndex:
+    """Test marker queries."""
+
+    def test_markers(self, tmp_path):
+        """Files and directories are answered from the listing."""
+        (tmp_path / "DESCRIPTION").write_text("Package: pkg\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "pkg.Rcheck").mkdir()
+
+        index = DirectoryIndex(tmp_path)
+
+        assert index.has("DESCRIPTION", "missing")
+        assert not index.has("missing")
+        assert index.has_dir("tests")
+        assert not index.has_dir("DESCRIPTION")
+        assert index.has_file("DESCRIPTION")
+        assert index.with_suffix(".Rcheck") == ["pkg.Rcheck"]
+
+    def test_missing_directory(self, tmp_path):
+        """A missing directory gives an empty index."""
+        index = DirectoryIndex(tmp_path / "nope")
+        assert index.entries == {}
+        assert index.mtime_ns is None
+
+    @pytest.mark.parametrize('filename,content,expected', [
+        ("DESCRIPTION", "Package: rpkg\nVersion: 1.0\n", "rpkg"),
+        ("pyproject.toml", '[project]\nname = "pyproj"\n', "pyproj"),
+        ("package.json", '{"name": "nodeapp"}', "nodeapp"),
+        ("_quarto.yml", 'title: "Doc"\n', "Doc"),
+        ("package.json", '[1, 2]', None),
+    ])
+    def test_project_name(self, tmp_path, filename, content, expected):
+        """Names come from the first marker file, else the directory name."""
+        (tmp_path / filename).write_text(content)
+        assert DirectoryIndex(tmp_path).project_name == (expected or tmp_path.name)
+
+
+class TestIndexCache:
+    """Test per-process reuse and invalidation."""
+
+    def test_reused_while_unchanged(self, tmp_path):
+        """The same index is returned while the directory mtime is unchanged."""
+        assert get_index(tmp_path) is get_index(str(tmp_path))
+
+    def test_rescan_on_new_entry(self, tmp_path):
+        """Adding an entry bumps the directory mtime and forces a rescan."""
+        first = get_index(tmp_path)
+        (tmp_path / "package.json").write_text("{}")
+        os.utime(tmp_path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+
+        second = get_index(tmp_path)
+        assert second is not first
+        assert second.has("package.json")
+
+    def test_recent_directories_rescanned(self, tmp_path, monkeypatch):
+        """Directories modified within the racy window are always rescanned."""
+        monkeypatch.setattr(index_module, 'RACY_NS', 10**18)
+        assert get_index(tmp_path) is not get_index(tmp_path)
+
+    def test_file_edit_seen(self, tmp_path):
+        """Editing a file in place is seen without a directory change."""
+        desc = tmp_path / "DESCRIPTION"
+        desc.write_text("Package: old\n")
+        index = get_index(tmp_path)
+        assert index.project_name == "old"
+
+        desc.write_text("Package: renamed\n")
+        assert get_index(tmp_path).project_name == "renamed"
@@ -112,14 +112,16 @@ class TestGetWorktrees:
 
     def test_get_worktrees_empty(self):
         """Test with no worktrees."""
-        with patch("aiterm.cli.feature._run_git") as mock_git:
+        with patch("aiterm.cli.feature._read_worktrees", return_value=None), \
+             patch("aiterm.cli.feature._run_git") as mock_git:
             mock_git.return_value = None
             result = _get_worktrees()
             assert result == []
 
     def test_get_worktrees_with_worktrees(self):
         """Test parsing worktree list."""
-        with patch("aiterm.cli.feature._run_git") as mock_git:
+        with patch("aiterm.cli.feature._read_worktrees", return_value=None), \
+             patch("aiterm.cli.feature._run_git") as mock_git:
             mock_git.return_value = (
                 "worktree /path/to/main\n"
                 "HEAD abc12345\n"
@@ -139,6 +141,27 @@ class TestGetWorktrees:
             feature_wt = [w for w in result if w.branch == "feature/test"][0]
             assert feature_wt.path == Path("/path/to/feature")
 
+    def test_get_worktrees_reads_git_dir(self, tmp_path, monkeypatch):
+        """Worktrees are read from .git without running git worktree list."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        git = ["git", "-c", "user.name=T", "-c", "user.email=t@example.com", "-C", str(repo)]
+        subprocess.run(git + ["init", "-q", "-b", "main"], check=True)
+        subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], check=True)
+        subprocess.run(
+            git + ["worktree", "add", "-q", "-b", "feature/x", str(tmp_path / "wt")], check=True
+        )
+        monkeypatch.chdir(repo)
+
+        with patch("aiterm.cli.feature._run_git") as mock_git:
+            result = _get_worktrees()
+            mock_git.assert_not_called()
+
+        assert [w.branch for w in result] == ["main", "feature/x"]
+        assert result[0].path == repo.resolve()
+        assert result[1].path == (tmp_path / "wt").resolve()
+        assert len(result[1].commit) == 8
+
 
 class TestFeatureBranchDataclass:
     """Tests for FeatureBranch dataclass."""
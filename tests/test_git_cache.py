@@ -0,0 +1,168 @@
+"""Tests for the shared git status snapshot cache.
+
+Tests cover:
+- Atomic JSON cache helpers and hit/miss counters
+- Cache hits skip git entirely
+- Invalidation on index, HEAD and ref changes
+- TTL expiry and disabling
+"""
+
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aiterm.git.cache import read_status_cached
+from aiterm.utils.cache import (
+    STATS_FILE,
+    atomic_write_json,
+    clear_cache,
+    flush_stats,
+    get_cache_dir,
+    get_stats,
+    read_json,
+    record_lookup,
+)
+
+
+def _git(cwd, *args):
+    """Run git with a fixed identity."""
+    subprocess.run(
+        ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+         '-c', 'init.defaultBranch=main', '-C', str(cwd), *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repository with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, 'init', '-q')
+    (path / "README.md").write_text("hello\n")
+    _git(path, 'add', 'README.md')
+    _git(path, 'commit', '-q', '-m', 'init')
+    return path
+
+
+def _count_git_calls(repo, ttl=60):
+    """Read cached status and count git processes started."""
+    with patch('aiterm.git.status.subprocess.Popen', wraps=subprocess.Popen) as mock_run:
+        status = read_status_cached(str(repo), ttl)
+    return status, mock_run.call_count
+
+
+class TestCacheHelpers:
+    """Test JSON cache helpers."""
+
+    def test_cache_dir_env(self, cache_dir):
+        """AITERM_CACHE_DIR overrides the default location."""
+        assert get_cache_dir() == cache_dir
+
+    def test_atomic_write_round_trip(self, cache_dir):
+        """Written JSON reads back and leaves no temp files."""
+        path = cache_dir / "x.json"
+        assert atomic_write_json(path, {"a": 1})
+        assert read_json(path) == {"a": 1}
+        assert [p.name for p in cache_dir.iterdir()] == ["x.json"]
+
+    def test_read_corrupt(self, cache_dir):
+        """Corrupt cache files read as None."""
+        cache_dir.mkdir()
+        (cache_dir / "bad.json").write_text("{ nope")
+        assert read_json(cache_dir / "bad.json") is None
+
+    def test_counters_and_clear(self):
+        """Hits and misses are counted per cache and cleared."""
+        record_lookup("demo", hit=False)
+        record_lookup("demo", hit=True)
+        record_lookup("demo", hit=True)
+        assert get_stats() == {"demo": {"hits": 2, "misses": 1}}
+
+        assert clear_cache() == 1
+        assert get_stats() == {}
+
+    def test_lookups_do_not_write(self, cache_dir):
+        """Counters reach stats.json only when flushed."""
+        record_lookup("demo", hit=True)
+        assert not (cache_dir / STATS_FILE).exists()
+
+        flush_stats()
+        assert read_json(cache_dir / STATS_FILE) == {"demo": {"hits": 1, "misses": 0}}
+
+    def test_concurrent_flushes_keep_counts(self, cache_dir):
+        """Processes flushing at the same time do not lose counts."""
+        script = (
+            "from aiterm.utils.cache import record_lookup\n"
+            "for _ in range(50):\n"
+            "    record_lookup('demo', hit=True)\n"
+        )
+        processes = [subprocess.Popen([sys.executable, '-c', script]) for _ in range(4)]
+        assert [p.wait() for p in processes] == [0] * 4
+
+        assert get_stats() == {"demo": {"hits": 200, "misses": 0}}
+
+
+class TestGitStatusCache:
+    """Test the git snapshot cache."""
+
+    def test_hit_skips_git(self, repo):
+        """Second read with unchanged repo runs no git process."""
+        first, calls = _count_git_calls(repo)
+        assert calls == 1
+
+        second, calls = _count_git_calls(repo)
+        assert calls == 0
+        assert second == first
+        assert get_stats()["git_status"] == {"hits": 1, "misses": 1}
+
+    def test_index_change_invalidates(self, repo):
+        """Staging a file invalidates the snapshot."""
+        read_status_cached(str(repo), 60)
+        (repo / "README.md").write_text("changed\n")
+        _git(repo, 'add', 'README.md')
+
+        status, calls = _count_git_calls(repo)
+        assert calls == 1
+        assert status.staged == 1
+
+    def test_head_change_invalidates(self, repo):
+        """Switching branches invalidates the snapshot."""
+        read_status_cached(str(repo), 60)
+        _git(repo, 'checkout', '-q', '-b', 'feature')
+
+        status, calls = _count_git_calls(repo)
+        assert calls == 1
+        assert status.branch == "feature"
+
+    def test_commit_invalidates(self, repo):
+        """Committing on the current branch invalidates the snapshot."""
+        first = read_status_cached(str(repo), 60)
+        _git(repo, 'commit', '-q', '--allow-empty', '-m', 'second')
+
+        status, calls = _count_git_calls(repo)
+        assert calls == 1
+        assert status.oid != first.oid
+
+    def test_ttl_expiry(self, repo):
+        """Snapshots older than the TTL are refreshed."""
+        read_status_cached(str(repo), 0.05)
+        time.sleep(0.1)
+
+        _, calls = _count_git_calls(repo, ttl=0.05)
+        assert calls == 1
+
+    def test_ttl_zero_disables(self, repo, cache_dir):
+        """TTL 0 always runs git and writes nothing."""
+        _, calls = _count_git_calls(repo, ttl=0)
+        assert calls == 1
+        assert not (cache_dir / "git-status.json").exists()
+
+    def test_not_a_repo(self, tmp_path):
+        """Non-repo directories are not cached."""
+        assert read_status_cached(str(tmp_path), 60) is None
+        assert get_stats() == {}
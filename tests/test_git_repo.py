@@ -0,0 +1,244 @@
+"""Tests for the zero-fork git metadata reader.
+
+Tests cover:
+- Repository discovery (main, subdirectory, linked worktree)
+- HEAD, loose and packed refs
+- Tags for detached HEAD (lightweight, annotated, packed, packed tag object)
+- Stash count and upstream config
+- Worktree listing
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from aiterm.context.detector import get_git_info
+from aiterm.git.repo import GitRepo, find_repo
+from aiterm.git.status import read_status
+
+
+def _git(cwd, *args):
+    """Run git with a fixed identity and return stdout."""
+    return subprocess.run(
+        ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+         '-c', 'init.defaultBranch=main', '-C', str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repository with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, 'init', '-q')
+    (path / "README.md").write_text("hello\n")
+    _git(path, 'add', 'README.md')
+    _git(path, 'commit', '-q', '-m', 'init')
+    return path
+
+
+class TestFindRepo:
+    """Test repository discovery."""
+
+    def test_not_a_repo(self, tmp_path):
+        """Directories outside a repo return None."""
+        assert find_repo(tmp_path) is None
+
+    def test_main_worktree(self, repo):
+        """Main worktree uses .git as git and common dir."""
+        found = find_repo(repo)
+        assert found.git_dir == (repo / ".git").resolve()
+        assert found.common_dir == found.git_dir
+        assert not found.is_worktree
+        assert found.is_supported
+
+    def test_subdirectory(self, repo):
+        """Repository is found from a nested directory."""
+        (repo / "a" / "b").mkdir(parents=True)
+        assert find_repo(repo / "a" / "b").git_dir == (repo / ".git").resolve()
+
+    def test_linked_worktree(self, repo, tmp_path):
+        """Linked worktree resolves its common dir."""
+        _git(repo, 'worktree', 'add', '-q', '-b', 'feat', str(tmp_path / "wt"))
+
+        found = find_repo(tmp_path / "wt")
+        assert found.is_worktree
+        assert found.worktree_name == "wt"
+        assert found.common_dir == (repo / ".git").resolve()
+
+
+class TestRefs:
+    """Test HEAD and ref resolution."""
+
+    def test_branch_and_head(self, repo):
+        """Branch and HEAD match git."""
+        found = find_repo(repo)
+        assert found.branch() == "main"
+        assert found.head_oid() == _git(repo, 'rev-parse', 'HEAD')
+
+    def test_packed_refs(self, repo):
+        """Refs are resolved after git pack-refs."""
+        _git(repo, 'pack-refs', '--all')
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+        assert find_repo(repo).head_oid() == _git(repo, 'rev-parse', 'HEAD')
+
+    def test_unborn_branch(self, tmp_path):
+        """Fresh repo has a branch but no commit."""
+        _git(tmp_path, 'init', '-q')
+        found = find_repo(tmp_path)
+        assert found.branch() == "main"
+        assert found.head_oid() is None
+
+    def test_detached(self, repo):
+        """Detached HEAD has no branch."""
+        _git(repo, 'checkout', '-q', '--detach')
+        found = find_repo(repo)
+        assert found.branch() is None
+        assert found.head_oid() == _git(repo, 'rev-parse', 'HEAD')
+
+
+class TestTags:
+    """Test tag lookup for detached HEAD."""
+
+    def test_lightweight_tag(self, repo):
+        """Lightweight tag is found."""
+        _git(repo, 'tag', 'v1.0')
+        found = find_repo(repo)
+        assert found.tag_for(found.head_oid()) == "v1.0"
+
+    def test_annotated_tag(self, repo):
+        """Annotated tag is peeled from its loose tag object."""
+        _git(repo, 'tag', '-a', 'v2.0', '-m', 'release')
+        found = find_repo(repo)
+        assert found.tag_for(found.head_oid()) == "v2.0"
+
+    def test_packed_annotated_tag(self, repo):
+        """Packed annotated tag uses the peeled line."""
+        _git(repo, 'tag', '-a', 'v3.0', '-m', 'release')
+        _git(repo, 'gc', '-q')
+        found = find_repo(repo)
+        assert found.tag_for(found.head_oid()) == "v3.0"
+
+    def test_annotated_tag_object_in_pack(self, repo):
+        """Loose tag ref to a packed tag object cannot be peeled without git."""
+        _git(repo, 'tag', '-a', 'v4.0', '-m', 'release')
+        _git(repo, 'repack', '-q', '-ad')
+        _git(repo, 'prune')
+        found = find_repo(repo)
+        assert (repo / '.git' / 'refs' / 'tags' / 'v4.0').exists()
+        with pytest.raises(LookupError):
+            found.tag_for(found.head_oid())
+
+    def test_status_falls_back_for_packed_tag_object(self, repo):
+        """read_status asks git when the tag object is packed."""
+        _git(repo, 'tag', '-a', 'v4.0', '-m', 'release')
+        _git(repo, 'repack', '-q', '-ad')
+        _git(repo, 'prune')
+        _git(repo, 'checkout', '-q', 'v4.0')
+        assert read_status(str(repo)).tag == "v4.0"
+
+    def test_no_tag(self, repo):
+        """Untagged commit has no tag."""
+        found = find_repo(repo)
+        assert found.tag_for(found.head_oid()) is None
+
+
+class TestStashAndConfig:
+    """Test stash reflog and upstream config."""
+
+    def test_stash_count(self, repo):
+        """Stash entries are counted from the reflog."""
+        found = find_repo(repo)
+        assert found.stash_count() == 0
+
+        for i in range(2):
+            (repo / "README.md").write_text(f"change {i}\n")
+            _git(repo, 'stash', '-q')
+        assert found.stash_count() == 2
+
+    def test_upstream(self, repo):
+        """Upstream comes from branch.<name>.remote/merge."""
+        _git(repo, 'config', 'branch.main.remote', 'origin')
+        _git(repo, 'config', 'branch.main.merge', 'refs/heads/main')
+        assert find_repo(repo).upstream() == "origin/main"
+
+    def test_no_upstream(self, repo):
+        """Branch without upstream config returns None."""
+        assert find_repo(repo).upstream() is None
+
+
+class TestWorktrees:
+    """Test worktree listing."""
+
+    def test_matches_git_worktree_list(self, repo, tmp_path):
+        """Worktree entries match git worktree list --porcelain."""
+        _git(repo, 'worktree', 'add', '-q', '-b', 'feat', str(tmp_path / "wt"))
+        _git(repo, 'worktree', 'add', '-q', '--detach', str(tmp_path / "wt2"))
+
+        entries = find_repo(tmp_path / "wt").worktrees()
+        porcelain = _git(repo, 'worktree', 'list', '--porcelain')
+
+        expected = [
+            dict(line.split(' ', 1) for line in block.splitlines() if ' ' in line)
+            for block in porcelain.split('\n\n')
+        ]
+        assert [str(e['path']) for e in entries] == [e['worktree'] for e in expected]
+        assert [e['head'] for e in entries] == [e['HEAD'] for e in expected]
+        assert [e['branch'] for e in entries] == [e.get('branch', '') for e in expected]
+        assert find_repo(repo).worktree_count() == 3
+
+    def test_separate_git_dir(self, tmp_path):
+        """The main path is the working tree, not the git dir's parent."""
+        work = tmp_path / "work"
+        work.mkdir()
+        (tmp_path / "store").mkdir()
+        _git(work, 'init', '-q', '--separate-git-dir', str(tmp_path / "store" / "repo.git"))
+        (work / "README.md").write_text("hello\n")
+        _git(work, 'add', 'README.md')
+        _git(work, 'commit', '-q', '-m', 'init')
+        _git(work, 'worktree', 'add', '-q', '-b', 'feat', str(tmp_path / "wt"))
+
+        assert find_repo(work).worktrees()[0]['path'] == work.resolve()
+
+        # From a linked worktree the main path is whatever git reports
+        porcelain = _git(tmp_path / "wt", 'worktree', 'list', '--porcelain')
+        expected = porcelain.partition('\n')[0][len('worktree '):]
+        assert str(find_repo(tmp_path / "wt").worktrees()[0]['path']) == expected
+
+    def test_submodule(self, repo, tmp_path):
+        """A submodule's main path comes from core.worktree."""
+        _git(repo, '-c', 'protocol.file.allow=always', 'submodule', 'add', '-q', str(repo), 'sub')
+
+        sub = find_repo(repo / "sub")
+        assert sub.git_dir == (repo / ".git" / "modules" / "sub").resolve()
+        assert sub.worktrees()[0]['path'] == (repo / "sub").resolve()
+        assert GitRepo(sub.git_dir).worktrees()[0]['path'] == (repo / "sub").resolve()
+
+
+class TestDetectorGitInfo:
+    """Test context detector uses the reader."""
+
+    def test_branch_without_git_branch_calls(self, repo):
+        """Branch comes from .git; only the dirty check runs git."""
+        with patch('aiterm.context.detector.subprocess.run', wraps=subprocess.run) as mock_run:
+            branch, is_dirty = get_git_info(repo)
+
+        assert branch == "main"
+        assert is_dirty is False
+        assert mock_run.call_count == 1
+
+    def test_not_a_repo(self, tmp_path):
+        """Non-repo returns no branch without running git."""
+        with patch('aiterm.context.detector.subprocess.run') as mock_run:
+            assert get_git_info(tmp_path) == (None, False)
+            mock_run.assert_not_called()
+
+    def test_unsupported_repo_falls_back(self, repo):
+        """Repositories the reader cannot handle fall back to git."""
+        with patch.object(GitRepo, 'is_supported', False):
+            branch, _ = get_git_info(repo)
+        assert branch == "main"
@@ -0,0 +1,263 @@
+"""Tests for the single-pass git status engine.
+
+Tests cover:
+- Porcelain v2 parsing
+- Snapshot from real repositories
+- Worktree detection from the git directory
+- Capped untracked counting
+- GitSegment reads everything from one snapshot
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from aiterm.git.status import GitStatus, parse_porcelain_v2, read_status
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.segments import GitSegment
+
+
+def _git(cwd, *args):
+    """Run git with a fixed identity."""
+    subprocess.run(
+        ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+         '-c', 'init.defaultBranch=main', '-C', str(cwd), *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repository with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, 'init', '-q')
+    (path / "README.md").write_text("hello\n")
+    _git(path, 'add', 'README.md')
+    _git(path, 'commit', '-q', '-m', 'init')
+    return path
+
+
+class TestParsePorcelainV2:
+    """Test porcelain v2 parsing."""
+
+    def test_branch_headers(self):
+        """Branch, upstream and ahead/behind are parsed."""
+        status = parse_porcelain_v2(
+            "# branch.oid 1234abcd\n"
+            "# branch.head feature/x\n"
+            "# branch.upstream origin/feature/x\n"
+            "# branch.ab +3 -2\n"
+            "# stash 4\n"
+        )
+        assert status.oid == "1234abcd"
+        assert status.branch == "feature/x"
+        assert status.upstream == "origin/feature/x"
+        assert status.ahead == 3
+        assert status.behind == 2
+        assert status.stash == 4
+
+    def test_detached_and_initial(self):
+        """Detached HEAD and unborn branch are represented as None."""
+        status = parse_porcelain_v2("# branch.oid (initial)\n# branch.head (detached)\n")
+        assert status.oid is None
+        assert status.is_detached
+        assert status.display_branch == "detached"
+
+    def test_entry_counts(self):
+        """Staged, unstaged, conflicted and untracked entries are counted."""
+        status = parse_porcelain_v2(
+            "1 M. N... 100644 100644 100644 a b staged.py\n"
+            "1 .M N... 100644 100644 100644 a b unstaged.py\n"
+            "1 MM N... 100644 100644 100644 a b both.py\n"
+            "2 R. N... 100644 100644 100644 a b R100 new.py\told.py\n"
+            "u UU N... 100644 100644 100644 100644 a b c conflict.py\n"
+            "? new file.txt\n"
+            "? other.txt\n"
+            "! ignored.log\n"
+        )
+        assert status.staged == 3
+        assert status.unstaged == 2
+        assert status.conflicted == 1
+        assert status.untracked == 2
+        assert status.has_changes
+
+    def test_clean(self):
+        """Only untracked files do not count as changes."""
+        status = parse_porcelain_v2("# branch.head main\n? new.txt\n")
+        assert not status.has_changes
+        assert status.untracked == 1
+
+    def test_untracked_cap(self):
+        """Counting stops once the cap is passed."""
+        output = "# branch.head main\n1 .M N... 100644 100644 100644 a b f.txt\n" + "? x\n" * 5
+        status = parse_porcelain_v2(output, untracked_cap=3)
+        assert status.unstaged == 1
+        assert status.untracked == 3
+        assert status.untracked_capped
+
+        exact = parse_porcelain_v2(output, untracked_cap=5)
+        assert exact.untracked == 5
+        assert not exact.untracked_capped
+
+    def test_worktree_name(self):
+        """Linked worktree name comes from the git dir."""
+        status = GitStatus(git_dir="/repo/.git/worktrees/feature-auth")
+        assert status.is_worktree
+        assert status.worktree_name == "feature-auth"
+        assert GitStatus(git_dir="/repo/.git").worktree_name is None
+
+
+class TestReadStatus:
+    """Test snapshots of real repositories."""
+
+    def test_not_a_repo(self, tmp_path):
+        """Non-repo directories return None."""
+        assert read_status(str(tmp_path)) is None
+
+    def test_clean_repo(self, repo):
+        """Clean repo reports branch and no changes."""
+        status = read_status(str(repo))
+        assert status.branch == "main"
+        assert not status.has_changes
+        assert status.untracked == 0
+        assert status.worktree_count == 1
+
+    def test_changes_and_untracked(self, repo):
+        """Modified, staged and untracked files are detected."""
+        (repo / "README.md").write_text("changed\n")
+        (repo / "staged.txt").write_text("x\n")
+        _git(repo, 'add', 'staged.txt')
+        (repo / "sub").mkdir()
+        (repo / "sub" / "a.txt").write_text("a\n")
+        (repo / "sub" / "b.txt").write_text("b\n")
+
+        status = read_status(str(repo))
+        assert status.staged == 1
+        assert status.unstaged == 1
+        assert status.untracked == 2
+
+    def test_untracked_cap_stops_git(self, repo):
+        """A capped read keeps the branch and change counts."""
+        (repo / "README.md").write_text("changed\n")
+        for i in range(50):
+            (repo / f"{i}.csv").write_text("x\n")
+
+        status = read_status(str(repo), untracked_cap=10)
+        assert status.branch == "main"
+        assert status.unstaged == 1
+        assert status.untracked == 10
+        assert status.untracked_capped
+
+        assert read_status(str(repo)).untracked == 50
+
+    def test_capped_read_counts_files(self, repo):
+        """A cap does not change what the untracked count means."""
+        (repo / "data").mkdir()
+        for name in ("a", "b", "c"):
+            (repo / "data" / name).write_text("x\n")
+        (repo / "top").write_text("x\n")
+
+        assert read_status(str(repo), untracked_cap=99).untracked == 4
+        assert read_status(str(repo)).untracked == 4
+
+    def test_collapse_untracked_dirs(self, repo):
+        """Opting in counts an untracked directory once."""
+        (repo / "data" / "raw").mkdir(parents=True)
+        for i in range(50):
+            (repo / "data" / "raw" / f"{i}.csv").write_text("x\n")
+        (repo / "new.txt").write_text("x\n")
+
+        status = read_status(str(repo), untracked_cap=10, collapse_untracked_dirs=True)
+        assert status.untracked == 2
+        assert not status.untracked_capped
+
+        assert read_status(str(repo), untracked_cap=10).untracked_capped
+
+    def test_untracked_cache(self, repo):
+        """The untracked cache can be enabled per call."""
+        (repo / "new.txt").write_text("x\n")
+        assert read_status(str(repo), untracked_cache=True).untracked == 1
+
+    def test_stash_count(self, repo):
+        """Stash entries are counted."""
+        (repo / "README.md").write_text("stashed\n")
+        _git(repo, 'stash', '-q')
+
+        assert read_status(str(repo)).stash == 1
+
+    def test_detached_tag(self, repo):
+        """Detached HEAD on a tag shows the tag."""
+        _git(repo, 'tag', 'v1.0.0')
+        _git(repo, 'checkout', '-q', 'v1.0.0')
+
+        status = read_status(str(repo))
+        assert status.is_detached
+        assert status.display_branch == "v1.0.0"
+
+    def test_linked_worktree(self, repo, tmp_path):
+        """Linked worktrees are detected and counted."""
+        _git(repo, 'worktree', 'add', '-q', '-b', 'feat', str(tmp_path / "wt-feat"))
+
+        status = read_status(str(tmp_path / "wt-feat"))
+        assert status.branch == "feat"
+        assert status.worktree_name == "wt-feat"
+        assert status.worktree_count == 2
+
+        assert read_status(str(repo)).worktree_name is None
+
+    def test_subdirectory(self, repo):
+        """Status is read from a subdirectory."""
+        (repo / "src" / "pkg").mkdir(parents=True)
+        status = read_status(str(repo / "src" / "pkg"))
+        assert status.branch == "main"
+        assert status.git_dir == str((repo / ".git").resolve())
+
+
+class TestGitSegmentSnapshot:
+    """Test GitSegment reads from a single snapshot."""
+
+    def test_single_git_process(self, repo):
+        """All git lookups share one git status call."""
+        segment = GitSegment(StatusLineConfig())
+
+        with patch('aiterm.git.status.subprocess.Popen', wraps=subprocess.Popen) as mock_run:
+            segment._get_git_info(str(repo))
+            segment._get_stash_count(str(repo))
+            segment._get_remote_tracking(str(repo))
+            segment._get_worktree_count(str(repo))
+            segment._get_worktree_name(str(repo))
+
+        assert mock_run.call_count == 1
+
+    def test_git_info_tuple(self, repo):
+        """Legacy tuple interface is preserved."""
+        (repo / "README.md").write_text("changed\n")
+        (repo / "new.txt").write_text("new\n")
+
+        segment = GitSegment(StatusLineConfig())
+        assert segment._get_git_info(str(repo)) == ("main", True, 0, 0, 1)
+
+    @pytest.mark.parametrize('cap,shown,hidden', [(3, "?3+", "?5"), (0, "?5", "?5+")])
+    def test_capped_untracked_display(self, repo, monkeypatch, cap, shown, hidden):
+        """A capped count is shown with a plus sign."""
+        for i in range(5):
+            (repo / f"{i}.txt").write_text("x\n")
+
+        config = StatusLineConfig()
+        real_get = config.get
+        monkeypatch.setattr(
+            config, 'get',
+            lambda key, default=None: cap if key == 'git.untracked_cap' else real_get(key, default)
+        )
+        output = GitSegment(config).render(str(repo))
+        assert shown in output
+        assert hidden not in output
+
+    def test_not_a_repo(self, tmp_path):
+        """Non-repo directories give empty git info."""
+        segment = GitSegment(StatusLineConfig())
+        assert segment._get_git_info(str(tmp_path)) is None
+        assert segment._get_worktree_count(str(tmp_path)) == 0
@@ -8,10 +8,22 @@ Tests the background agent detection functionality including:
 """
 
 import os
+import subprocess
+import sys
+import time
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from aiterm.statusline.agents import AgentDetector, format_agent_display
+from aiterm.statusline.agents import (
+    AGENTS_DIR,
+    LOCK_FILE,
+    PRUNE_AGE,
+    AgentDetector,
+    AgentRegistry,
+    format_agent_display,
+)
+from aiterm.statusline.agents import main as agents_main
 
 
 class TestAgentDetector:
@@ -157,3 +169,117 @@ class TestFormatAgentDisplay:
         """Should handle large agent counts."""
         assert format_agent_display(99, compact=True) == "🤖99"
         assert format_agent_display(99, compact=False) == "99 agents"
+
+
+class TestAgentRegistry:
+    """Test the per-session agent registry."""
+
+    def test_events(self):
+        """Agents recorded by hook events are counted until stopped."""
+        registry = AgentRegistry("s1", locations=[])
+        registry.start("a1")
+        registry.start("a2", pid=os.getpid())
+        assert registry.running_count() == 2
+
+        registry.stop("a1")
+        assert registry.running_count() == 1
+
+    def test_dead_event_pid_pruned(self):
+        """Event agents whose process exited are dropped from the state."""
+        registry = AgentRegistry("s1", locations=[])
+        registry.start("a1", pid=999999)
+        assert registry.running_count() == 0
+        assert registry._load()['events'] == {}
+
+    def test_unchanged_directory_not_rescanned(self, tmp_path):
+        """Tracking directories are listed again only when they change."""
+        location = tmp_path / "agents"
+        location.mkdir()
+        (location / "agent-1.pid").write_text(str(os.getpid()))
+        old = location.stat().st_mtime_ns - 10 * 10**9
+        os.utime(location, ns=(old, old))
+
+        registry = AgentRegistry("s1", locations=[location])
+        assert registry.running_count() == 1
+
+        with patch('aiterm.statusline.agents.os.scandir', side_effect=AssertionError("rescanned")):
+            assert registry.running_count() == 1
+
+        (location / "agent-2").touch()
+        assert registry.running_count() == 2
+
+    def test_no_subprocess_for_liveness(self, tmp_path):
+        """PID checks use signals, not `kill` subprocesses."""
+        location = tmp_path / "agents"
+        location.mkdir()
+        (location / "agent-1.pid").write_text(str(os.getpid()))
+        (location / "agent-2.pid").write_text("999999")
+
+        with patch('subprocess.run', side_effect=AssertionError("subprocess")):
+            assert AgentRegistry("s1", locations=[location]).running_count() == 1
+
+    def test_removed_directory_forgotten(self, tmp_path):
+        """Agents in a removed tracking directory stop counting."""
+        location = tmp_path / "agents"
+        location.mkdir()
+        (location / "agent-1").touch()
+        registry = AgentRegistry("s1", locations=[location])
+        assert registry.running_count() == 1
+
+        (location / "agent-1").unlink()
+        location.rmdir()
+        assert registry.running_count() == 0
+
+    def test_first_location_with_files_counts(self, tmp_path):
+        """Like a full scan, only the first directory with agent files counts."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        for location in (first, second):
+            location.mkdir()
+        (first / "agent-1").touch()
+        (second / "agent-2").touch()
+        (second / "agent-3").touch()
+
+        assert AgentRegistry("s1", locations=[first, second]).running_count() == 1
+        assert AgentRegistry("s2", locations=[tmp_path / "missing", second]).running_count() == 2
+
+    def test_one_shared_lock(self, cache_dir):
+        """Renders for many sessions leave one lock file, not one per session."""
+        for n in range(5):
+            AgentRegistry(f"s{n}", locations=[]).running_count()
+        assert sorted(p.name for p in (cache_dir / AGENTS_DIR).iterdir()) == [LOCK_FILE]
+
+    def test_stale_sessions_pruned(self, cache_dir):
+        """Writing a new session's state removes sessions untouched for PRUNE_AGE."""
+        AgentRegistry("old", locations=[]).start("a1")
+        old_state = cache_dir / AGENTS_DIR / "old.json"
+        stale = time.time() - PRUNE_AGE - 60
+        os.utime(old_state, (stale, stale))
+        AgentRegistry("recent", locations=[]).start("a1")
+        AgentRegistry("new", locations=[]).start("a1")
+
+        names = {p.name for p in (cache_dir / AGENTS_DIR).iterdir()}
+        assert names == {LOCK_FILE, "recent.json", "new.json"}
+
+    def test_hook_entry_point(self):
+        """The module entry point records start and stop events."""
+        assert agents_main(["start", "s1", "a1"]) == 0
+        assert AgentRegistry("s1", locations=[]).running_count() == 1
+        assert agents_main(["stop", "s1", "a1"]) == 0
+        assert AgentRegistry("s1", locations=[]).running_count() == 0
+
+    def test_concurrent_hooks_keep_every_agent(self):
+        """Hooks starting agents at the same time are all recorded."""
+        script = (
+            "import sys\n"
+            "from aiterm.statusline.agents import AgentRegistry\n"
+            "registry = AgentRegistry('s1', locations=[])\n"
+            "for i in range(10):\n"
+            "    registry.start(f'{sys.argv[1]}-{i}')\n"
+        )
+        processes = [
+            subprocess.Popen([sys.executable, '-c', script, f"hook{n}"], env=os.environ.copy())
+            for n in range(4)
+        ]
+        assert [p.wait() for p in processes] == [0] * 4
+
+        assert AgentRegistry("s1", locations=[]).running_count() == 40
@@ -0,0 +1,248 @@
+"""Tests for transcript token and cost analytics.
+
+Tests cover:
+- Token, tool, prompt and cost aggregation (split messages counted once)
+- Checkpointed offsets: new analyzers parse only appended lines
+- Resets when a transcript is replaced
+- The context usage segment (opt-in, checkpoint built off the render path)
+  and `ait sessions stats`
+"""
+
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from aiterm.cli.main import app
+from aiterm.statusline import analytics
+from aiterm.statusline.analytics import SessionStats, TranscriptAnalyzer, get_model_prices
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.segments import ContextSegment
+
+runner = CliRunner()
+
+
+def _assistant(message_id, input_tokens=100, output_tokens=50, cache_read=0, tools=(), sidechain=False):
+    """Build an assistant record."""
+    content = [{'type': 'tool_use', 'name': name, 'input': {}} for name in tools]
+    return {
+        'type': 'assistant',
+        'isSidechain': sidechain,
+        'timestamp': '2026-01-01T00:00:00Z',
+        'message': {
+            'id': message_id,
+            'model': 'claude-sonnet-4-5',
+            'content': content,
+            'usage': {
+                'input_tokens': input_tokens,
+                'output_tokens': output_tokens,
+                'cache_creation_input_tokens': 0,
+                'cache_read_input_tokens': cache_read,
+            },
+        },
+    }
+
+
+def _prompt(text='hi'):
+    """Build a user prompt record."""
+    return {'type': 'user', 'message': {'role': 'user', 'content': text}}
+
+
+def _tool_result():
+    """Build a user record carrying a tool result."""
+    return {'type': 'user', 'message': {'content': [{'type': 'tool_result', 'content': 'ok'}]}}
+
+
+def _append(path, records):
+    """Append records as JSONL."""
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+class TestSessionStats:
+    """Test folding records into totals."""
+
+    def test_aggregates_tokens_tools_and_prompts(self):
+        """Usage, tool calls and prompts are summed."""
+        stats = SessionStats()
+        for record in [
+            _prompt(),
+            _assistant('m1', tools=['Bash']),
+            _tool_result(),
+            _assistant('m2', input_tokens=10, cache_read=1000, tools=['Read', 'Bash']),
+        ]:
+            stats.add(record)
+
+        assert stats.prompts == 1
+        assert stats.messages == 2
+        assert stats.input_tokens == 110
+        assert stats.output_tokens == 100
+        assert stats.cache_read_tokens == 1000
+        assert stats.tool_calls == {'Bash': 2, 'Read': 1}
+        assert stats.models == {'claude-sonnet-4-5': 2}
+        assert stats.context_tokens == 1010
+        assert stats.cost_usd == pytest.approx((110 * 3 + 100 * 15 + 1000 * 0.3) / 1_000_000)
+
+    def test_split_message_counted_once(self):
+        """Records repeating a message's usage do not double count."""
+        stats = SessionStats()
+        stats.add(_assistant('m1', output_tokens=5))
+        stats.add(_assistant('m1', output_tokens=40, tools=['Edit']))
+
+        assert stats.messages == 1
+        assert stats.output_tokens == 40
+        assert stats.input_tokens == 100
+        assert stats.tool_calls == {'Edit': 1}
+
+    def test_sidechain_keeps_main_context(self):
+        """Subagent messages do not replace the main context size."""
+        stats = SessionStats()
+        stats.add(_assistant('m1', input_tokens=5000))
+        stats.add(_assistant('s1', input_tokens=10, sidechain=True))
+        assert stats.context_tokens == 5000
+        assert stats.input_tokens == 5010
+
+    def test_round_trip(self):
+        """Stats survive serialization."""
+        stats = SessionStats()
+        stats.add(_assistant('m1', tools=['Bash']))
+        assert SessionStats.from_dict(json.loads(json.dumps(stats.to_dict()))) == stats
+
+    @pytest.mark.parametrize('model,input_price', [
+        ('claude-opus-4-5-20251101', 5.0),
+        ('claude-opus-4-1', 15.0),
+        ('claude-3-5-haiku', 0.80),
+        ('claude-haiku-4-5', 1.0),
+    ])
+    def test_model_prices(self, model, input_price):
+        """More specific model generations win over their family."""
+        assert get_model_prices(model)[0] == input_price
+
+    def test_unknown_model_costs_nothing(self):
+        """Unknown models are counted but not priced."""
+        assert get_model_prices('gpt-4') is None
+
+
+class TestTranscriptAnalyzer:
+    """Test incremental, checkpointed analysis."""
+
+    def test_resumes_from_checkpoint(self, tmp_path, monkeypatch):
+        """A new analyzer parses only lines appended after the checkpoint."""
+        path = tmp_path / "session.jsonl"
+        _append(path, [_prompt(), _assistant('m1')])
+        first = TranscriptAnalyzer(str(path))
+        assert first.update().messages == 1
+
+        _append(path, [_assistant('m2')])
+        parsed = []
+        real_add = SessionStats.add
+        monkeypatch.setattr(SessionStats, 'add', lambda self, r: parsed.append(r) or real_add(self, r))
+
+        second = TranscriptAnalyzer(str(path))
+        stats = second.update()
+        assert stats.messages == 2
+        assert stats.prompts == 1
+        assert [r['message']['id'] for r in parsed] == ['m2']
+        assert second.offset == os.path.getsize(path)
+
+    def test_no_new_lines_skips_checkpoint(self, tmp_path):
+        """Updates without new lines leave the checkpoint alone."""
+        path = tmp_path / "session.jsonl"
+        _append(path, [_assistant('m1')])
+        analyzer = TranscriptAnalyzer(str(path))
+        analyzer.update()
+
+        checkpoint = analytics.get_checkpoint_path(str(path))
+        before = checkpoint.stat().st_mtime_ns
+        os.utime(checkpoint, ns=(before - 10**9, before - 10**9))
+        analyzer.update()
+        assert checkpoint.stat().st_mtime_ns == before - 10**9
+
+    def test_replaced_transcript_resets(self, tmp_path):
+        """A rewritten transcript is analyzed from scratch."""
+        path = tmp_path / "session.jsonl"
+        _append(path, [_assistant('m1'), _assistant('m2')])
+        TranscriptAnalyzer(str(path)).update()
+
+        replacement = tmp_path / "new.jsonl"
+        _append(replacement, [_assistant('m3')])
+        os.replace(replacement, path)
+
+        assert TranscriptAnalyzer(str(path)).update().messages == 1
+
+    def test_corrupt_checkpoint_ignored(self, tmp_path):
+        """A malformed checkpoint falls back to a full parse."""
+        path = tmp_path / "session.jsonl"
+        _append(path, [_assistant('m1')])
+        checkpoint = analytics.get_checkpoint_path(str(path))
+        checkpoint.parent.mkdir(parents=True)
+        checkpoint.write_text(json.dumps({'version': 1, 'path': str(path), 'offset': 'x'}))
+
+        assert TranscriptAnalyzer(str(path)).update().messages == 1
+
+
+class TestContextSegment:
+    """Test the context usage segment."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Config with context usage enabled (temp path)."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('display.show_context_usage', True)
+        return config
+
+    @pytest.fixture
+    def builds(self, monkeypatch):
+        """Record checkpoint builder spawns."""
+        spawned = []
+        monkeypatch.setattr(analytics, '_spawn_builder', spawned.append)
+        monkeypatch.setattr(analytics, '_ANALYZERS', {})
+        return spawned
+
+    def test_off_by_default(self, tmp_path):
+        """The segment is opt-in."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        assert ContextSegment(config).render(200_000, 50_000) == ""
+
+    def test_reported_usage(self, config):
+        """Claude Code's reported usage is preferred."""
+        output = ContextSegment(config).render(200_000, 50_000)
+        assert '◔ 25%' in output
+
+    def test_transcript_fallback(self, config, tmp_path, builds):
+        """Usage comes from the transcript once its checkpoint is built off the render path."""
+        path = tmp_path / "session.jsonl"
+        _append(path, [_assistant('m1', input_tokens=20_000, cache_read=80_000)])
+
+        assert ContextSegment(config).render(0, 0, str(path)) == ""
+        assert ContextSegment(config).render(0, 0, str(path)) == ""
+        assert builds == [str(path)]  # The second render is within BUILD_GRACE
+
+        assert analytics.main([str(path)]) == 0
+        output = ContextSegment(config).render(0, 0, str(path))
+        assert '◔ 50%' in output
+
+    def test_empty_without_data(self, config):
+        """Nothing is shown without usage."""
+        assert ContextSegment(config).render(200_000, 0) == ""
+
+
+class TestSessionsStatsCommand:
+    """Test `ait sessions stats` transcript totals."""
+
+    def test_reports_transcripts(self, tmp_path, monkeypatch):
+        """Transcript totals are listed per project."""
+        projects = tmp_path / "projects"
+        (projects / "-home-me-demo").mkdir(parents=True)
+        _append(projects / "-home-me-demo" / "s1.jsonl", [_assistant('m1', tools=['Grep'])])
+        monkeypatch.setattr(analytics, 'get_projects_dir', lambda: projects)
+        monkeypatch.setattr('aiterm.cli.sessions.load_sessions', lambda: [])
+
+        result = runner.invoke(app, ["sessions", "stats"])
+        assert result.exit_code == 0
+        assert "-home-me-demo" in result.output
+        assert "Grep: 1 calls" in result.output
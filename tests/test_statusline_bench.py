@@ -0,0 +1,148 @@
+"""Tests for the statusLine latency benchmark.
+
+Tests cover:
+- Percentile and summary math
+- Payload loading
+- Running scenarios (cold/warm, per-segment timings)
+- Comparing result sets
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from aiterm.statusline.bench import (
+    SCENARIOS,
+    compare_results,
+    load_payloads,
+    percentile,
+    run_benchmark,
+    summarize,
+    write_results,
+)
+from aiterm.statusline.config import StatusLineConfig
+
+requires_git = pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Config with a temp path (user config untouched)."""
+    config = StatusLineConfig()
+    config.config_path = tmp_path / "statusline.json"
+    return config
+
+
+class TestStatistics:
+    """Test percentile math."""
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate between samples."""
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+
+    def test_percentile_empty(self):
+        """No samples gives 0."""
+        assert percentile([], 95) == 0.0
+
+    def test_summarize_in_ms(self):
+        """Summaries convert seconds to milliseconds."""
+        summary = summarize([0.001, 0.002, 0.003])
+        assert summary['n'] == 3
+        assert summary['p50'] == 2.0
+        assert summary['mean'] == 2.0
+        assert set(summary) == {'n', 'mean', 'p50', 'p95', 'p99'}
+
+
+class TestPayloads:
+    """Test loading recorded payloads."""
+
+    def test_load_single_and_list(self, tmp_path):
+        """Files may hold one payload or a list."""
+        single = tmp_path / "one.json"
+        single.write_text(json.dumps({"model": {"display_name": "A"}}))
+        many = tmp_path / "many.json"
+        many.write_text(json.dumps([{"model": {"display_name": "B"}}, {"session_id": "x"}]))
+
+        assert len(load_payloads([single, many])) == 3
+
+    def test_load_rejects_non_objects(self, tmp_path):
+        """Non-object payloads are rejected."""
+        path = tmp_path / "bad.json"
+        path.write_text("[1, 2]")
+        with pytest.raises(ValueError):
+            load_payloads([path])
+
+
+class TestRunBenchmark:
+    """Test running scenarios."""
+
+    def test_unknown_scenario(self, config):
+        """Unknown scenarios raise before doing any work."""
+        with pytest.raises(ValueError, match="nope"):
+            run_benchmark(['nope'], config=config)
+
+    @requires_git
+    def test_results_layout(self, config):
+        """Results hold cold/warm totals and per-segment timings."""
+        results = run_benchmark(['nogit', 'small'], iterations=3, cold_iterations=2, config=config)
+
+        assert results['params']['iterations'] == 3
+        for name in ('nogit', 'small'):
+            cold = results['scenarios'][name]['cold']
+            warm = results['scenarios'][name]['warm']
+            assert cold['total']['n'] == 2
+            assert warm['total']['n'] == 3
+            assert 'git' in warm['segments']
+            assert warm['segments']['git']['p50'] <= warm['total']['p99'] + 1
+
+    def test_cold_render_in_fresh_process(self, config, tmp_path, monkeypatch):
+        """Cold renders run in a child process and leave this one untouched."""
+        from aiterm.statusline import bench, budget
+
+        monkeypatch.setenv('AITERM_CACHE_DIR', str(tmp_path / "cache"))
+        monkeypatch.setattr(budget, '_LAST_GOOD', {})
+        payload = bench._payload_for(bench.DEFAULT_PAYLOADS[0], tmp_path)
+
+        sample = bench._cold_render(config, payload)
+        assert sample['total'] > 0
+        assert 'git' in sample['segments']
+        assert budget._LAST_GOOD == {}
+
+    def test_cache_dir_restored(self, config, monkeypatch):
+        """The benchmark's cache dir does not leak into the environment."""
+        monkeypatch.setenv('AITERM_CACHE_DIR', '/tmp/keep-me')
+        run_benchmark(['nogit'], iterations=1, cold_iterations=1, config=config)
+        assert os.environ['AITERM_CACHE_DIR'] == '/tmp/keep-me'
+
+    @requires_git
+    def test_scenarios_build(self, tmp_path):
+        """Every scenario builds at a small scale."""
+        for name, build in SCENARIOS.items():
+            assert build(tmp_path / name, 0.01).is_dir()
+
+
+class TestCompare:
+    """Test diffing result sets."""
+
+    def test_compare_and_roundtrip(self, tmp_path):
+        """Results written to disk diff against new results."""
+        summary = {'n': 1, 'mean': 10.0, 'p50': 10.0, 'p95': 10.0, 'p99': 10.0}
+        baseline = {'scenarios': {'small': {'warm': {'total': summary, 'segments': {'git': summary}}}}}
+        path = tmp_path / "base.json"
+        write_results(baseline, path)
+
+        faster = dict(summary, p50=5.0)
+        current = {'scenarios': {'small': {'warm': {
+            'total': faster, 'segments': {'git': faster, 'usage': faster}
+        }}}}
+
+        rows = {row['name']: row for row in compare_results(json.loads(path.read_text()), current)}
+        assert rows['total']['change_pct'] == -50.0
+        assert rows['git']['baseline'] == 10.0
+        assert rows['usage']['baseline'] is None
+        assert rows['usage']['change_pct'] is None
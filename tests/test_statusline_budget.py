@@ -0,0 +1,233 @@
+"""Tests for concurrent segment evaluation and render time budgets.
+
+Tests cover:
+- Segments run concurrently and are collected in order
+- Segments within budget return their output
+- Overrunning segments fall back to last good output or nothing
+- Total budget caps every segment
+- Busy segments are not started twice
+- Overrun records and the renderer integration
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from aiterm.statusline import budget as budget_module
+from aiterm.statusline.budget import RenderBudget, get_overruns
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.renderer import StatusLineRenderer
+
+
+@pytest.fixture(autouse=True)
+def segment_state(monkeypatch):
+    """Isolate in-process segment state."""
+    monkeypatch.setattr(budget_module, '_LAST_GOOD', {})
+    monkeypatch.setattr(budget_module, '_RUNNING', {})
+
+
+def _blocking(release: threading.Event, value: str = "late"):
+    """Segment that waits until released."""
+    def render():
+        release.wait(5)
+        return value
+    return render
+
+
+class TestRenderBudget:
+    """Test budget enforcement."""
+
+    def test_within_budget(self):
+        """Fast segments return their output."""
+        budget = RenderBudget(total_ms=1000, segment_ms=500)
+        assert budget.run('git', lambda cwd: f"git {cwd}", '/repo') == "git /repo"
+        assert get_overruns() == {}
+
+    def test_disabled_runs_inline(self):
+        """Total budget 0 runs segments in the calling thread."""
+        budget = RenderBudget(total_ms=0)
+        assert budget.run('git', threading.current_thread) is threading.current_thread()
+
+    def test_parallel_without_budget(self):
+        """Parallel mode runs segments concurrently and waits for all of them."""
+        budget = RenderBudget(total_ms=0, parallel=True)
+
+        def slow(value):
+            time.sleep(0.1)
+            return value
+
+        start = time.monotonic()
+        tasks = [budget.submit(name, slow, name) for name in ('git', 'project', 'usage')]
+        assert [budget.collect(task) for task in tasks] == ['git', 'project', 'usage']
+        assert time.monotonic() - start < 0.25
+
+    def test_overrun_skipped_and_recorded(self):
+        """An overrunning segment renders nothing and is recorded."""
+        release = threading.Event()
+        budget = RenderBudget(total_ms=1000, segment_ms=20)
+
+        assert budget.run('git', _blocking(release)) == ""
+        release.set()
+
+        overruns = get_overruns()
+        assert overruns['git']['count'] == 1
+        assert overruns['git']['budget_ms'] == 20
+        assert overruns['git']['last_ms'] >= 20
+
+    def test_overrun_serves_last_good(self):
+        """An overrunning segment shows its last good output for the same key."""
+        RenderBudget(total_ms=1000).run('git', lambda: "cached", key='/repo')
+
+        release = threading.Event()
+        budget = RenderBudget(total_ms=1000, segment_ms=20)
+        assert budget.run('git', _blocking(release), key='/repo') == "cached"
+        assert budget.run('project', lambda: "other", key='/repo') == "other"
+        release.set()
+
+    def test_last_good_is_per_key(self):
+        """Last good output for one key is not served for another."""
+        RenderBudget(total_ms=1000).run('git', lambda: "repo-a", key='/a')
+
+        release = threading.Event()
+        budget = RenderBudget(total_ms=1000, segment_ms=20)
+        assert budget.run('git', _blocking(release), key='/b') == ""
+        release.set()
+
+    def test_per_segment_override(self):
+        """Per-segment budgets override the default."""
+        budget = RenderBudget(total_ms=1000, segment_ms=10, overrides={'git': 500})
+
+        def slow():
+            time.sleep(0.05)
+            return "done"
+
+        assert budget.run('git', slow) == "done"
+
+    def test_total_budget_caps_segments(self):
+        """Segments never wait past the total budget."""
+        release = threading.Event()
+        budget = RenderBudget(total_ms=30, segment_ms=5000)
+
+        start = time.monotonic()
+        assert budget.run('usage', _blocking(release)) == ""
+        assert time.monotonic() - start < 1
+        assert budget.run('time', lambda: "skipped") == ""
+        release.set()
+
+    def test_busy_segment_not_restarted(self):
+        """A segment still running from a previous render is not started again."""
+        release = threading.Event()
+        RenderBudget(total_ms=1000, segment_ms=20).run('git', _blocking(release))
+
+        calls = []
+        assert RenderBudget(total_ms=1000).run('git', lambda: calls.append(1)) == ""
+        assert calls == []
+        assert get_overruns()['git']['last_ms'] is None
+        release.set()
+
+    def test_busy_segment_is_per_key(self):
+        """A slow segment for one key does not block another key."""
+        release = threading.Event()
+        RenderBudget(total_ms=1000, segment_ms=20).run('git', _blocking(release), key='/a')
+
+        assert RenderBudget(total_ms=1000).run('git', lambda: "repo-b", key='/b') == "repo-b"
+        release.set()
+
+    def test_segment_error_propagates(self):
+        """Errors raised by a segment reach the renderer."""
+        budget = RenderBudget(total_ms=1000)
+        with pytest.raises(ZeroDivisionError):
+            budget.run('git', lambda: 1 / 0)
+
+    def test_from_config(self, tmp_path):
+        """Budgets are read from config."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('performance.render_budget_ms', 800)
+        config.set('performance.git_budget_ms', 50)
+
+        budget = RenderBudget.from_config(config)
+        assert budget.total_ms == 800
+        assert budget.get_segment_budget('git') == 0.05
+        assert budget.get_segment_budget('agents') == 0.2
+        assert not RenderBudget.from_config(config, enforce=False).enabled
+
+
+class TestRendererBudget:
+    """Test StatusLineRenderer concurrency and hung segments."""
+
+    @pytest.fixture
+    def render_input(self, tmp_path):
+        """Minimal Claude Code JSON input."""
+        return json.dumps({
+            "workspace": {"current_dir": str(tmp_path), "project_dir": str(tmp_path)},
+            "model": {"display_name": "Claude Sonnet 4.5"},
+        })
+
+    def test_segments_run_concurrently(self, tmp_path, monkeypatch, render_input):
+        """Render time is the slowest segment, not the sum, and order is kept."""
+        from aiterm.statusline import segments
+
+        def slow(text):
+            def render(self, *args):
+                time.sleep(0.15)
+                return text
+            return render
+
+        monkeypatch.setattr(segments.ProjectSegment, 'render', slow("<project>"))
+        monkeypatch.setattr(segments.GitSegment, 'render', slow("<git>"))
+        monkeypatch.setattr(segments.ThinkingSegment, 'render', slow("<thinking>"))
+        monkeypatch.setattr(segments.TimeSegment, 'render', slow("<time>"))
+        monkeypatch.setattr(segments.UsageSegment, 'render', slow("<usage>"))
+
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('git.show_worktrees', False)
+        config.set('display.show_background_agents', False)
+
+        start = time.monotonic()
+        output = StatusLineRenderer(config).render(render_input)
+        assert time.monotonic() - start < 0.5
+
+        line1, line2 = output.split("\n")
+        assert line1.index("<project>") < line1.index("<git>")
+        assert line2.index("<thinking>") < line2.index("<time>") < line2.index("<usage>")
+
+    def test_hung_git_does_not_stall_render(self, tmp_path, monkeypatch, render_input):
+        """A hung git segment is skipped within the render budget."""
+        from aiterm.statusline.segments import GitSegment
+
+        release = threading.Event()
+        monkeypatch.setattr(GitSegment, 'render', lambda self, cwd: release.wait(5) and "git")
+
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('performance.git_budget_ms', 50)
+
+        renderer = StatusLineRenderer(config, enforce_budgets=True)
+        start = time.monotonic()
+        output = renderer.render(render_input)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert "Sonnet" in output
+        assert get_overruns()['git']['count'] == 1
+
+    def test_one_shot_render_waits_for_slow_git(self, tmp_path, monkeypatch, render_input):
+        """Without enforced budgets a slow git segment is still shown."""
+        from aiterm.statusline.segments import GitSegment
+
+        def slow(self, cwd):
+            time.sleep(0.2)
+            return "<git>"
+
+        monkeypatch.setattr(GitSegment, 'render', slow)
+
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('performance.git_budget_ms', 50)
+
+        assert "<git>" in StatusLineRenderer(config).render(render_input)
+        assert get_overruns() == {}
@@ -202,7 +202,7 @@ class TestStatusLineConfig:
 
         git_settings = config.list_settings(category='git')
 
-        assert len(git_settings) == 6  # 6 git settings (added git.show_worktrees)
+        assert len(git_settings) == 9  # 9 git settings (added untracked cap, cache and collapse)
         assert all(s['category'] == 'git' for s in git_settings)
         assert any(s['key'] == 'git.show_ahead_behind' for s in git_settings)
 
@@ -212,7 +212,7 @@ class TestStatusLineConfig:
 
         display_settings = config.list_settings(category='display')
 
-        assert len(display_settings) == 17  # 17 display settings (13 original + 4 spacing)
+        assert len(display_settings) == 18  # 18 display settings (14 original + 4 spacing)
         assert all(s['category'] == 'display' for s in display_settings)
 
     def test_deep_merge(self, config):
@@ -291,7 +291,7 @@ class TestStatusLineConfig:
 
     def test_categories_exist(self, config):
         """Test that all defined categories are valid."""
-        valid_categories = {'display', 'git', 'theme', 'usage', 'project', 'time'}
+        valid_categories = {'display', 'git', 'theme', 'usage', 'project', 'time', 'performance'}
         schema = config.get_schema()
 
         for key, meta in schema.items():
@@ -329,3 +329,95 @@ class TestStatusLineConfig:
         assert '  ' in content  # Has indentation
         data = json.loads(content)  # Valid JSON
         assert data['display']['show_git'] == False
+
+
+class TestConfigSnapshot:
+    """Test the shared, pre-flattened config snapshot."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Config file with one user setting."""
+        path = tmp_path / "statusline.json"
+        path.write_text(json.dumps({"display": {"show_git": False}}))
+        return path
+
+    def _config(self, path):
+        config = StatusLineConfig()
+        config.config_path = path
+        return config
+
+    def test_instances_share_parse(self, config_path, monkeypatch):
+        """A second instance for the same file does not re-read it."""
+        first = self._config(config_path)
+        assert first.get('display.show_git') is False
+
+        monkeypatch.setattr(StatusLineConfig, '_parse', lambda *a: pytest.fail("re-parsed"))
+        second = self._config(config_path)
+        assert second.get('display.show_git') is False
+        assert second._get_snapshot() is first._get_snapshot()
+
+    def test_prefix_keys_flattened(self, config_path):
+        """Key prefixes return the nested dict, unknown keys the default."""
+        config = self._config(config_path)
+        assert config.get('display')['show_git'] is False
+        assert config.get('display.show_git.nope', 'd') == 'd'
+        assert config.get('theme.name') == 'purple-charcoal'
+
+    def test_refresh_on_file_change(self, config_path):
+        """refresh() reloads only when the file changed."""
+        config = self._config(config_path)
+        assert config.get('display.show_git') is False
+        assert config.refresh() is False
+
+        config_path.write_text(json.dumps({"display": {"show_git": True, "show_thinking_indicator": False}}))
+        assert config.get('display.show_git') is False  # Memoized until refresh
+        assert config.refresh() is True
+        assert config.get('display.show_git') is True
+
+    def test_validation_precomputed(self, config_path):
+        """Type errors are found when the file is parsed."""
+        config_path.write_text(json.dumps({"git": {"truncate_branch_length": "long"}}))
+        config = self._config(config_path)
+
+        assert config._get_snapshot().errors
+        is_valid, errors = config.validate()
+        assert not is_valid
+        assert 'git.truncate_branch_length' in errors[0]
+
+    def test_set_does_not_leak_before_save(self, config_path):
+        """Invalid set() leaves the shared snapshot untouched."""
+        config = self._config(config_path)
+        other = self._config(config_path)
+
+        with pytest.raises(ValueError):
+            config.set('display.show_git', 'yes')
+        assert other.get('display.show_git') is False
+
+        config.set('display.show_git', True)
+        other.refresh()
+        assert other.get('display.show_git') is True
+
+    def test_path_change_reloads(self, config_path, tmp_path):
+        """Pointing an instance at another file loads that file."""
+        config = self._config(config_path)
+        assert config.get('display.show_git') is False
+
+        config.config_path = tmp_path / "missing.json"
+        assert config.get('display.show_git') is True
+
+    def test_load_returns_copy(self, config_path):
+        """Mutating load()'s result does not change the shared snapshot."""
+        config = self._config(config_path)
+        loaded = config.load()
+        loaded['display']['show_git'] = True
+        loaded['theme'] = {}
+
+        assert config.get('display.show_git') is False
+        assert self._config(config_path).load()['display']['show_git'] is False
+
+        config.get('display')['show_git'] = True
+        assert config.get('display.show_git') is False
+
+    def test_shared_handle(self):
+        """shared() returns one process-wide instance."""
+        assert StatusLineConfig.shared() is StatusLineConfig.shared()
@@ -0,0 +1,162 @@
+"""Tests for the statusLine render daemon and thin client.
+
+Tests cover:
+- Daemon round trip over a Unix socket
+- Client fallback when the daemon is down
+- Terminal width and session environment forwarding
+- Idle timeout and shutdown
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from aiterm.statusline.client import FORWARDED_ENV, render_local, render_via_daemon, session_env
+from aiterm.statusline.daemon import RenderDaemon, get_pid_path, get_socket_path, is_running
+
+
+@pytest.fixture
+def payload(tmp_path):
+    """Claude Code JSON payload pointing at a temp directory."""
+    return json.dumps({
+        "workspace": {"current_dir": str(tmp_path), "project_dir": str(tmp_path)},
+        "model": {"display_name": "Claude Sonnet 4.5"},
+        "output_style": {"name": "default"},
+        "session_id": "daemon-test",
+        "cost": {"total_lines_added": 7, "total_lines_removed": 2},
+    })
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon in a background thread on a temp socket."""
+    socket_path = tmp_path / "sl.sock"
+    server = RenderDaemon(socket_path, idle_timeout=10)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while not is_running(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    yield server
+
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+class TestSocketPath:
+    """Test socket path resolution."""
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        """AITERM_STATUSLINE_SOCKET overrides default path."""
+        monkeypatch.setenv('AITERM_STATUSLINE_SOCKET', str(tmp_path / "x.sock"))
+        assert get_socket_path() == tmp_path / "x.sock"
+
+    def test_pid_path_next_to_socket(self, tmp_path):
+        """PID file lives next to the socket."""
+        assert get_pid_path(tmp_path / "x.sock") == tmp_path / "x.pid"
+
+
+class TestRenderDaemon:
+    """Test daemon request handling."""
+
+    def test_round_trip(self, daemon, payload):
+        """Client receives a full 2-line statusLine from the daemon."""
+        output = render_via_daemon(payload, 120, socket_path=daemon.socket_path)
+
+        assert output is not None
+        assert "╭─" in output
+        assert "╰─" in output
+        assert "Sonnet" in output
+
+    def test_includes_window_title(self, daemon, payload):
+        """Window title escape is captured and returned to the client."""
+        output = render_via_daemon(payload, 120, socket_path=daemon.socket_path)
+        assert output.startswith("\033]0;")
+
+    def test_matches_in_process_render(self, daemon, payload, capsys):
+        """Daemon output matches in-process rendering."""
+        remote = render_via_daemon(payload, 120, socket_path=daemon.socket_path)
+
+        local = render_local(payload)
+        title = capsys.readouterr().out
+
+        # Clock may tick between renders; compare everything but time
+        assert remote.split('\n')[0] == (title + local).split('\n')[0]
+
+    def test_invalid_json_input(self, daemon):
+        """Invalid Claude Code JSON is reported like in-process rendering."""
+        output = render_via_daemon("{ invalid", 120, socket_path=daemon.socket_path)
+        assert "Invalid JSON" in output
+
+    def test_malformed_request(self, daemon):
+        """Malformed daemon requests get an error statusLine."""
+        assert b"Invalid daemon request" in daemon.handle_request(b"not json")
+
+    def test_columns_forwarded(self, daemon, payload):
+        """Client terminal width is applied to the renderer."""
+        render_via_daemon(payload, 77, socket_path=daemon.socket_path)
+        assert daemon._renderer.terminal_width == 77
+
+    def test_session_env_forwarded(self, daemon, payload, monkeypatch):
+        """The client's environment is applied for its render only."""
+        monkeypatch.setenv('CONDA_DEFAULT_ENV', 'daemon-env')
+        seen = {}
+
+        def render(json_input):
+            seen['conda'] = os.environ.get('CONDA_DEFAULT_ENV')
+            seen['trace'] = os.environ.get('AITERM_TRACE')
+            return "ok"
+
+        daemon._get_renderer()
+        monkeypatch.setattr(daemon._renderer, 'render', render)
+        env = {'CONDA_DEFAULT_ENV': 'stats-env'}
+        render_via_daemon(payload, 120, socket_path=daemon.socket_path, env=env)
+
+        assert seen == {'conda': 'stats-env', 'trace': None}
+        assert os.environ['CONDA_DEFAULT_ENV'] == 'daemon-env'
+
+    def test_client_sends_session_env(self, monkeypatch):
+        """Only the forwarded variables are sent."""
+        monkeypatch.setenv('CONDA_DEFAULT_ENV', 'stats-env')
+        monkeypatch.setenv('AITERM_UNRELATED', '1')
+        env = session_env()
+        assert env['CONDA_DEFAULT_ENV'] == 'stats-env'
+        assert set(env) <= set(FORWARDED_ENV)
+
+    def test_malformed_env(self, daemon):
+        """A non-object env is rejected."""
+        request = json.dumps({'input': '{}', 'env': ['PATH']}).encode('utf-8')
+        assert b"Invalid daemon request" in daemon.handle_request(request)
+
+    def test_counts_requests(self, daemon, payload):
+        """Daemon counts served requests."""
+        render_via_daemon(payload, 120, socket_path=daemon.socket_path)
+        render_via_daemon(payload, 120, socket_path=daemon.socket_path)
+        assert daemon.requests_served == 2
+
+    def test_idle_timeout_exits(self, tmp_path):
+        """Daemon exits and cleans up after idle timeout."""
+        socket_path = tmp_path / "idle.sock"
+        server = RenderDaemon(socket_path, idle_timeout=0.2)
+        server.serve_forever()
+
+        assert not socket_path.exists()
+
+
+class TestClientFallback:
+    """Test thin client behavior without a daemon."""
+
+    def test_no_daemon_returns_none(self, tmp_path, payload):
+        """Missing socket means daemon unavailable."""
+        assert render_via_daemon(payload, 120, socket_path=tmp_path / "none.sock") is None
+
+    def test_render_local(self, payload, capsys):
+        """In-process fallback renders a statusLine."""
+        output = render_local(payload)
+        assert "╭─" in output
+        assert "Sonnet" in output
@@ -0,0 +1,112 @@
+"""Tests for the minimal-import statusLine entry point.
+
+Tests cover:
+- `python -m aiterm.statusline` and `ait statusline render` output
+- No CLI framework (typer/rich) or HTTP stack imported on the render path
+- Import-time budget for the render path
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Modules the render path must never import (top-level package names or
+# exact modules)
+FORBIDDEN_MODULES = (
+    'typer', 'rich', 'click', 'http', 'email', 'ssl', 'asyncio',
+    'urllib.request', 'aiterm.cli.main', 'aiterm.cli.statusline',
+)
+
+# Cumulative import time of the render path (measured ~140 ms with
+# -X importtime on a slow machine; typer + rich alone add more than that)
+IMPORT_BUDGET_MS = 300
+
+
+@pytest.fixture
+def env(tmp_path):
+    """Subprocess environment with an isolated cache and home."""
+    return dict(os.environ, AITERM_CACHE_DIR=str(tmp_path / "cache"), HOME=str(tmp_path))
+
+
+@pytest.fixture
+def payload(tmp_path):
+    """Claude Code JSON."""
+    return json.dumps({
+        "workspace": {"current_dir": str(tmp_path), "project_dir": str(tmp_path)},
+        "model": {"display_name": "Claude Sonnet 4.5"},
+        "session_id": "entry-test",
+    })
+
+
+def _run(code, payload, env):
+    """Run Python code with the payload on stdin."""
+    return subprocess.run(
+        [sys.executable, '-c', code], input=payload, capture_output=True, text=True, env=env, timeout=60
+    )
+
+
+def _forbidden_loaded_code(call):
+    """Code that runs an entry point, then reports forbidden modules."""
+    return (
+        "import sys, json\n"
+        f"try:\n    {call}\nexcept SystemExit:\n    pass\n"
+        f"forbidden = {FORBIDDEN_MODULES!r}\n"
+        "loaded = [m for m in sys.modules if m in forbidden or m.split('.')[0] in forbidden]\n"
+        "sys.stderr.write('LOADED=' + json.dumps(sorted(loaded)))\n"
+    )
+
+
+class TestEntryPoints:
+    """Test the statusLine entry points."""
+
+    def test_module_renders(self, payload, env):
+        """`python -m aiterm.statusline` prints the two-line statusLine."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'aiterm.statusline'],
+            input=payload, capture_output=True, text=True, env=env, timeout=60
+        )
+        assert result.returncode == 0
+        assert '╭─' in result.stdout
+        assert '╰─' in result.stdout
+        assert 'Sonnet' in result.stdout
+
+    @pytest.mark.parametrize('call', [
+        "import runpy; runpy.run_module('aiterm.statusline', run_name='__main__')",
+        "sys.argv = ['ait', 'statusline', 'render']; from aiterm.cli.entry import main; main()",
+    ])
+    def test_no_cli_imports(self, payload, env, call):
+        """Rendering never loads typer, rich, the CLI app or the HTTP stack."""
+        result = _run(_forbidden_loaded_code(call), payload, env)
+        assert '╰─' in result.stdout
+        loaded = json.loads(result.stderr.rsplit('LOADED=', 1)[1])
+        assert loaded == []
+
+    def test_invalid_json(self, env):
+        """Bad input still produces a statusLine."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'aiterm.statusline'],
+            input='not json', capture_output=True, text=True, env=env, timeout=60
+        )
+        assert 'Invalid JSON' in result.stdout
+
+
+class TestImportBudget:
+    """Guard the render path's import time."""
+
+    def test_import_time_budget(self, env):
+        """Importing the render path stays within IMPORT_BUDGET_MS."""
+        timings = []
+        for _ in range(3):  # Best of three, to ride out a busy machine
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', 'import aiterm.statusline.__main__'],
+                capture_output=True, text=True, env=env, timeout=60
+            )
+            match = re.search(r'\|\s*(\d+) \| aiterm\.statusline\.__main__$', result.stderr, re.MULTILINE)
+            assert match, result.stderr[-500:]
+            timings.append(int(match.group(1)) / 1000)
+
+        assert min(timings) < IMPORT_BUDGET_MS
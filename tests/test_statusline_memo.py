@@ -0,0 +1,111 @@
+"""Tests for whole-render memoization.
+
+Tests cover:
+- Fingerprints change with input, width, config, git state and time
+- Repeated identical renders reuse the stored output (and window title)
+- Bounded render cache and the opt-out setting
+"""
+
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from aiterm.statusline import memo
+from aiterm.statusline.renderer import StatusLineRenderer
+from aiterm.statusline.config import StatusLineConfig
+
+
+@pytest.fixture
+def payload(tmp_path):
+    """Claude Code JSON for a project directory."""
+    project = tmp_path / "proj"
+    project.mkdir()
+    return json.dumps({
+        "workspace": {"current_dir": str(project), "project_dir": str(project)},
+        "model": {"display_name": "Claude Sonnet 4.5"},
+        "session_id": "memo-test",
+    })
+
+
+def _fingerprint(json_input, cwd='', stamp=None, width=120, now=1000.0):
+    """Fingerprint with defaults for the fields under test."""
+    return memo.get_fingerprint(json_input, cwd, stamp, 'purple-charcoal', width, 5, now=now)
+
+
+class TestFingerprint:
+    """Test what the fingerprint depends on."""
+
+    def test_stable(self):
+        """Identical input and environment give the same fingerprint."""
+        assert _fingerprint('{}') == _fingerprint('{}', now=1004.0)
+
+    @pytest.mark.parametrize('changes', [
+        {'json_input': '{"a": 1}'},
+        {'width': 80},
+        {'stamp': (1, 2)},
+        {'now': 1005.0},  # Next time bucket
+    ])
+    def test_changes(self, changes):
+        """Input, width, config and time bucket are all part of it."""
+        args = {'json_input': '{}', **changes}
+        assert _fingerprint(**args) != _fingerprint('{}')
+
+    def test_git_state(self, tmp_path):
+        """Staging a file changes the fingerprint."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+        before = _fingerprint('{}', cwd=str(repo))
+
+        (repo / "file.txt").write_text("x\n")
+        subprocess.run(['git', '-C', str(repo), 'add', 'file.txt'], check=True)
+        assert _fingerprint('{}', cwd=str(repo)) != before
+
+
+class TestRenderMemo:
+    """Test memoized renders."""
+
+    def test_repeat_render_reuses_output(self, payload, monkeypatch, capsys):
+        """A repeated render skips the segments and replays the title."""
+        monkeypatch.setattr(memo, 'time', SimpleNamespace(time=lambda: 1000.0))  # One time bucket
+        renderer = StatusLineRenderer(StatusLineConfig(), memoize=True)
+        first = renderer.render(payload)
+        first_title = capsys.readouterr().out
+
+        monkeypatch.setattr(renderer, '_build_line1', lambda *a, **k: pytest.fail("re-rendered"))
+        assert renderer.render(payload) == first
+        assert capsys.readouterr().out == first_title
+
+    def test_different_input_renders(self, payload):
+        """Changed input is rendered, not served from the cache."""
+        renderer = StatusLineRenderer(StatusLineConfig(), memoize=True)
+        renderer.render(payload)
+        changed = json.loads(payload)
+        changed['model']['display_name'] = 'Claude Opus 4.5'
+        assert 'Opus' in renderer.render(json.dumps(changed))
+
+    def test_disabled_by_default(self, payload, cache_dir):
+        """Renderers only memoize when asked to."""
+        StatusLineRenderer(StatusLineConfig()).render(payload)
+        assert not (cache_dir / memo.RENDER_CACHE_FILE).exists()
+
+    def test_ttl_zero_disables(self, payload, cache_dir, monkeypatch):
+        """performance.render_cache_ttl = 0 turns memoization off."""
+        config = StatusLineConfig()
+        real_get = config.get
+        monkeypatch.setattr(
+            config, 'get',
+            lambda key, default=None: 0 if key == 'performance.render_cache_ttl' else real_get(key, default)
+        )
+        StatusLineRenderer(config, memoize=True).render(payload)
+        assert not (cache_dir / memo.RENDER_CACHE_FILE).exists()
+
+    def test_bounded(self, monkeypatch):
+        """Only the newest MAX_ENTRIES renders are kept."""
+        monkeypatch.setattr(memo, 'MAX_ENTRIES', 2)
+        for i in range(3):
+            memo.store(f"fp{i}", f"out{i}", "")
+        assert memo.lookup("fp0") is None
+        assert memo.lookup("fp2") == ("out2", "")
@@ -274,6 +274,17 @@ class TestThinkingSegment:
         # Should return empty string gracefully
         assert output == ""
 
+    def test_render_when_enabled(self, segment, tmp_path, monkeypatch):
+        """Test the indicator follows alwaysThinkingEnabled."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        settings_file = tmp_path / ".claude" / "settings.json"
+        settings_file.parent.mkdir()
+        settings_file.write_text('{"alwaysThinkingEnabled": true}')
+        assert "🧠" in segment.render()
+
+        settings_file.write_text('{"alwaysThinkingEnabled": false}')
+        assert segment.render() == ""
+
 
 class TestSpacingFeatures:
     """Test spacing features for gap between left and right segments."""
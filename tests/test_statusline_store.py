@@ -0,0 +1,206 @@
+"""Tests for the stale-while-revalidate segment store.
+
+Tests cover:
+- Serving stored values without waiting for probes
+- Background refresh of stale/missing entries (deduplicated)
+- Inline probing when TTL is 0
+- Bounded entries, and pending markers that keep concurrent results
+- Worker entry point
+- ProjectSegment rendering through the store
+"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.segments import ProjectSegment, _path_digest
+from aiterm.statusline.refresh import main
+from aiterm.statusline import store as store_module
+from aiterm.statusline.store import SegmentStore, register_probe
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store backed by a temp file."""
+    return SegmentStore(tmp_path / "segments.json")
+
+
+@pytest.fixture
+def spawn():
+    """Capture background worker launches."""
+    with patch('aiterm.statusline.store._spawn_worker') as mock_spawn:
+        yield mock_spawn
+
+
+register_probe('test_echo', lambda value: f"echo {value}")
+
+
+class TestSegmentStore:
+    """Test store lookups and refresh scheduling."""
+
+    def test_missing_entry_spawns_refresh(self, store, spawn):
+        """Unknown entries return None and start a worker."""
+        assert store.get('test_echo', ['a'], ttl=60) is None
+        spawn.assert_called_once_with('test_echo', ['a'], store.path)
+
+    def test_fresh_entry_served(self, store, spawn):
+        """Fresh entries are served without a refresh."""
+        store.put('test_echo', ['a'], "cached")
+        assert store.get('test_echo', ['a'], ttl=60) == "cached"
+        spawn.assert_not_called()
+
+    def test_stale_entry_served_and_refreshed(self, store, spawn):
+        """Stale entries are still served while a refresh starts."""
+        store.put('test_echo', ['a'], "old")
+        time.sleep(0.02)
+
+        assert store.get('test_echo', ['a'], ttl=0.01) == "old"
+        spawn.assert_called_once()
+
+    def test_refresh_deduplicated(self, store, spawn):
+        """Only one refresh starts while one is pending."""
+        store.get('test_echo', ['a'], ttl=60)
+        store.get('test_echo', ['a'], ttl=60)
+        assert spawn.call_count == 1
+
+    def test_ttl_zero_runs_inline(self, store, spawn):
+        """TTL 0 runs the probe synchronously."""
+        assert store.get('test_echo', ['b'], ttl=0) == "echo b"
+        spawn.assert_not_called()
+
+    def test_failing_probe_stores_none(self, store):
+        """Probe errors store None rather than raising."""
+        register_probe('test_fail', lambda: 1 / 0)
+        assert store.refresh('test_fail', []) is None
+
+    def test_unknown_probe(self, store):
+        """Unknown probes return None."""
+        assert store.refresh('does_not_exist', []) is None
+
+    def test_bounded(self, store, monkeypatch):
+        """Only the newest MAX_ENTRIES results are kept."""
+        monkeypatch.setattr(store_module, 'MAX_ENTRIES', 2)
+        for value in ('a', 'b', 'c'):
+            store.put('test_echo', [value], value)
+
+        assert len(store._load()) == 2
+        assert store.get('test_echo', ['c'], ttl=60) == "c"
+        assert store.get('test_echo', ['b'], ttl=60) == "b"
+
+    def test_pending_marker_keeps_concurrent_result(self, store, spawn, monkeypatch):
+        """Marking a refresh does not overwrite a result stored meanwhile."""
+        def worker_stores(name, hit):
+            SegmentStore(store.path).put('test_echo', ['other'], "from worker")
+
+        monkeypatch.setattr(store_module, 'record_lookup', worker_stores)
+        store.get('test_echo', ['a'], ttl=60)
+
+        assert store.get('test_echo', ['other'], ttl=60) == "from worker"
+        spawn.assert_called_once()
+
+
+class TestWorker:
+    """Test the background worker entry point."""
+
+    def test_main_refreshes_entry(self, store, spawn):
+        """Worker runs the probe and stores the result."""
+        assert main(['test_echo', json.dumps(['w']), '--store', str(store.path)]) == 0
+        assert store.get('test_echo', ['w'], ttl=60) == "echo w"
+
+    def test_detached_worker_fills_entry(self, store, tmp_path, monkeypatch):
+        """A real background worker stores the probe result."""
+        import aiterm
+        monkeypatch.setenv('PYTHONPATH', str(Path(aiterm.__file__).parent.parent))
+        assert store.get('dependency_warnings', [str(tmp_path), 'default'], ttl=60) is None
+
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            entry = json.loads(store.path.read_text()).get(f'dependency_warnings:["{tmp_path}","default"]', {})
+            if 'time' in entry:
+                break
+            time.sleep(0.05)
+
+        assert 'time' in entry
+        assert entry['value'] is None
+
+    def test_main_bad_args(self, store):
+        """Invalid JSON args exit with an error."""
+        assert main(['test_echo', '{ nope', '--store', str(store.path)]) == 2
+
+    def test_worker_runs_project_probe(self, store, tmp_path):
+        """Registered project probes run in the worker."""
+        (tmp_path / '.nvmrc').write_text("20.11.0\n")
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('project.detect_node_version', True)
+
+        with patch('aiterm.statusline.segments.StatusLineConfig', return_value=config):
+            assert store.refresh('node_version', [str(tmp_path)]) == "v20.11.0"
+
+
+class TestProjectSegmentStore:
+    """Test ProjectSegment renders slow probes from the store."""
+
+    @pytest.fixture
+    def segment(self, tmp_path):
+        """Segment with node version detection enabled (temp config)."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('project.detect_node_version', True)
+        return ProjectSegment(config)
+
+    def test_render_does_not_block_on_probe(self, segment, tmp_path, spawn):
+        """Render never runs the slow probe inline."""
+        with patch('subprocess.run') as mock_run:
+            segment.render(str(tmp_path), str(tmp_path))
+            mock_run.assert_not_called()
+        spawn.assert_called_once()
+
+    def test_render_uses_stored_value(self, segment, tmp_path, spawn):
+        """Stored value appears in the rendered segment."""
+        segment.store.put('node_version', [str(tmp_path), _path_digest()], "v22.1.0")
+        assert "v22.1.0" in segment.render(str(tmp_path), str(tmp_path))
+
+    def test_probe_key_includes_environment(self, tmp_path, spawn, monkeypatch):
+        """Sessions with different conda envs or PATHs keep separate values."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('project.detect_python_env', True)
+        config.set('project.detect_node_version', True)
+        segment = ProjectSegment(config)
+
+        monkeypatch.setenv('CONDA_DEFAULT_ENV', 'stats-env')
+        segment.store.put('python_env', [str(tmp_path), 'stats-env'], "conda: stats-env")
+        segment.store.put('node_version', [str(tmp_path), _path_digest()], "v22.1.0")
+        assert "conda: stats-env" in segment.render(str(tmp_path), str(tmp_path))
+
+        monkeypatch.setenv('CONDA_DEFAULT_ENV', 'ml-env')
+        monkeypatch.setenv('PATH', '/opt/other/bin')
+        output = segment.render(str(tmp_path), str(tmp_path))
+        assert "stats-env" not in output
+        assert "v22.1.0" not in output
+
+    def test_python_env_probe_uses_key_env(self, store, tmp_path, monkeypatch):
+        """The worker reports the conda env from the key, not its own."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('project.detect_python_env', True)
+        monkeypatch.setenv('CONDA_DEFAULT_ENV', 'daemon-env')
+
+        with patch('aiterm.statusline.segments.StatusLineConfig', return_value=config):
+            assert store.refresh('python_env', [str(tmp_path), 'stats-env']) == "conda: stats-env"
+
+    def test_disabled_probe_skips_store(self, tmp_path, spawn):
+        """Disabled probes never schedule a refresh."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        config.set('project.detect_node_version', False)
+        config.set('project.detect_python_env', False)
+        config.set('project.show_dependency_warnings', False)
+
+        ProjectSegment(config).render(str(tmp_path), str(tmp_path))
+        spawn.assert_not_called()
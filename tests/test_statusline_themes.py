@@ -1,5 +1,9 @@
 """Tests for StatusLine theme system."""
 
+import gc
+import weakref
+from dataclasses import fields, replace
+
 import pytest
 from pathlib import Path
 
@@ -289,11 +293,11 @@ class TestThemeColorConsistency:
         themes = [PURPLE_CHARCOAL, COOL_BLUES, FOREST_GREENS]
 
         # Get attributes from first theme
-        base_attrs = set(vars(themes[0]).keys())
+        base_attrs = {f.name for f in fields(themes[0])}
 
         # Check all themes have same attributes
         for theme in themes[1:]:
-            theme_attrs = set(vars(theme).keys())
+            theme_attrs = {f.name for f in fields(theme)}
             assert theme_attrs == base_attrs, f"Theme {theme.name} has different attributes"
 
     def test_all_color_codes_valid_format(self):
@@ -301,7 +305,7 @@ class TestThemeColorConsistency:
         themes = [PURPLE_CHARCOAL, COOL_BLUES, FOREST_GREENS]
 
         for theme in themes:
-            attrs = vars(theme)
+            attrs = {f.name: getattr(theme, f.name) for f in fields(theme)}
             for key, value in attrs.items():
                 if key == 'name':
                     continue  # Skip name attribute
@@ -312,3 +316,46 @@ class TestThemeColorConsistency:
                 # Should start with either 48;5; (background) or 38;5; (foreground)
                 assert value.startswith('48;5;') or value.startswith('38;5;'), \
                     f"{theme.name}.{key} has invalid ANSI code format: {value}"
+
+
+class TestThemeTable:
+    """Test precompiled theme escape tables."""
+
+    def test_table_built_once(self):
+        """The compiled table is reused for a theme."""
+        assert PURPLE_CHARCOAL.table is PURPLE_CHARCOAL.table
+
+    def test_table_freed_with_theme(self):
+        """Compiling a table does not keep its theme alive."""
+        theme = replace(PURPLE_CHARCOAL, name='temporary')
+        assert theme.table.sgr['dir_bg'] == PURPLE_CHARCOAL.table.sgr['dir_bg']
+        ref = weakref.ref(theme)
+        del theme
+        gc.collect()
+        assert ref() is None
+
+    def test_table_is_immutable(self):
+        """Compiled tables cannot be modified."""
+        table = COOL_BLUES.table
+        with pytest.raises(TypeError):
+            table.sgr['time_fg'] = ''
+        with pytest.raises(AttributeError):
+            table.dir_open = ''
+
+    def test_sgr_sequences(self):
+        """Every color key compiles to a full escape sequence."""
+        table = FOREST_GREENS.table
+        assert table.sgr['dir_bg'] == '\033[48;5;22m'
+        assert set(table.sgr) == {f.name for f in fields(FOREST_GREENS) if f.name != 'name'}
+
+    @pytest.mark.parametrize('mode,spaces', [('minimal', 1), ('standard', 2), ('relaxed', 3), ('bogus', 2)])
+    def test_separators(self, mode, spaces):
+        """Separator variants match the spacing modes."""
+        pad = ' ' * spaces
+        assert PURPLE_CHARCOAL.table.get_separator(mode) == f"{pad}\033[38;5;240m│\033[0m{pad}"
+
+    def test_edges(self):
+        """Powerline edges use the theme colors."""
+        table = PURPLE_CHARCOAL.table
+        assert table.dir_open == "\033[48;5;54;38;5;250m ░▒▓ "
+        assert table.vcs_modified_open == "\033[38;5;54;48;5;60m\033[48;5;60;38;5;250m"
@@ -0,0 +1,193 @@
+"""Tests for statusLine render tracing.
+
+Tests cover:
+- Per-thread span counters (subprocesses, bytes read, cache lookups)
+- Trace file append, rotation and reading
+- Per-segment summaries
+- Renderer integration via AITERM_TRACE
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from aiterm.git.status import read_status
+from aiterm.statusline import trace
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.renderer import StatusLineRenderer
+from aiterm.utils import tracing
+from aiterm.utils.cache import atomic_write_json, read_json, record_lookup
+
+
+@pytest.fixture(autouse=True)
+def trace_state(monkeypatch):
+    """Clear trace settings and restore subprocess.Popen."""
+    monkeypatch.delenv('AITERM_TRACE', raising=False)
+    monkeypatch.delenv('AITERM_TRACE_FILE', raising=False)
+    yield
+    tracing.end_span()
+    tracing.uninstall()
+
+
+class TestSpans:
+    """Test per-thread counters."""
+
+    def test_no_span_is_noop(self):
+        """Counting without a span does nothing."""
+        tracing.note_read(10)
+        tracing.note_subprocess()
+        assert tracing.current_span() is None
+
+    def test_counts_subprocess_and_output(self):
+        """Installed hook counts processes and captured output."""
+        tracing.install()
+        span = tracing.start_span()
+        subprocess.run([sys.executable, '-c', 'print("abcd")'], capture_output=True)
+        tracing.end_span()
+
+        assert span.subprocesses == 1
+        assert span.bytes_read >= 4
+
+    def test_read_counts_bytes(self, cache_dir):
+        """Cache reads count encoded bytes, not characters."""
+        cache_dir.mkdir(parents=True)
+        path = cache_dir / "x.json"
+        path.write_text('{"key": "\u00e9\u00e9"}', encoding='utf-8')
+
+        span = tracing.start_span()
+        assert read_json(path) == {"key": "\u00e9\u00e9"}
+        tracing.end_span()
+
+        assert span.bytes_read == path.stat().st_size
+
+    def test_counts_streamed_git_status(self, tmp_path):
+        """Streamed git status output is counted."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+        (repo / "file.txt").write_text("x")
+
+        tracing.install()
+        span = tracing.start_span()
+        status = read_status(str(repo))
+        tracing.end_span()
+
+        assert status is not None
+        assert span.subprocesses == 1
+        assert span.bytes_read > 0
+
+    def test_counts_cache_reads_and_lookups(self, cache_dir):
+        """Cache helpers report bytes and hit/miss to the span."""
+        path = cache_dir / "x.json"
+        atomic_write_json(path, {"key": "value"})
+
+        span = tracing.start_span()
+        read_json(path)
+        record_lookup('git_status', hit=False)
+        record_lookup('git_status', hit=True)
+        tracing.end_span()
+
+        assert span.bytes_read >= len('{"key":"value"}')
+        assert span.caches == {'git_status': 'hit'}
+
+
+class TestTraceFile:
+    """Test writing and reading the trace file."""
+
+    def test_enabled_flag(self, monkeypatch):
+        """AITERM_TRACE=1 enables tracing, 0 does not."""
+        assert not trace.is_enabled()
+        monkeypatch.setenv('AITERM_TRACE', '1')
+        assert trace.is_enabled()
+        monkeypatch.setenv('AITERM_TRACE', '0')
+        assert not trace.is_enabled()
+
+    def test_path_override(self, tmp_path, monkeypatch):
+        """AITERM_TRACE_FILE overrides the trace path."""
+        monkeypatch.setenv('AITERM_TRACE_FILE', str(tmp_path / "t.jsonl"))
+        assert trace.get_trace_path() == tmp_path / "t.jsonl"
+
+    def test_rotation_keeps_records(self, tmp_path, monkeypatch):
+        """Oversized files rotate to .1 and both are read back."""
+        monkeypatch.setattr(trace, 'MAX_TRACE_BYTES', 100)
+        path = tmp_path / "trace.jsonl"
+
+        for i in range(10):
+            trace.write_record({'ms': float(i), 'pad': 'x' * 30}, path)
+
+        assert (tmp_path / "trace.jsonl.1").exists()
+        records = trace.read_records(path)
+        assert records[-1]['ms'] == 9.0
+        assert [r['ms'] for r in records] == sorted(r['ms'] for r in records)
+
+    def test_read_skips_corrupt_and_limits(self, tmp_path):
+        """Corrupt lines are skipped and --last keeps the newest."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text('{"ms": 1}\nnot json\n{"ms": 2}\n{"ms": 3}\n')
+        assert [r['ms'] for r in trace.read_records(path, limit=2)] == [2, 3]
+
+
+class TestSummary:
+    """Test per-segment summaries."""
+
+    def test_summarize_records(self):
+        """Summaries average counters and compute hit rates."""
+        records = [
+            {'ms': 10.0, 'segments': {'git': {
+                'ms': 8.0, 'subprocs': 1, 'bytes': 2048, 'cache': {'git_status': 'miss'}, 'overrun': False}}},
+            {'ms': 4.0, 'segments': {'git': {
+                'ms': 2.0, 'subprocs': 0, 'bytes': 0, 'cache': {'git_status': 'hit'}, 'overrun': True}}},
+        ]
+        summary = trace.summarize_records(records)
+
+        assert summary['total']['n'] == 2
+        assert summary['total']['max'] == 10.0
+        assert summary['git']['subprocs'] == 0.5
+        assert summary['git']['kb'] == 1.0
+        assert summary['git']['hit_rate'] == 0.5
+        assert summary['git']['overruns'] == 1
+
+
+class TestRendererTracing:
+    """Test trace records written by the renderer."""
+
+    @pytest.fixture
+    def render_input(self, tmp_path):
+        """Minimal Claude Code JSON input."""
+        return json.dumps({
+            "workspace": {"current_dir": str(tmp_path), "project_dir": str(tmp_path)},
+            "model": {"display_name": "Claude Sonnet 4.5"},
+        })
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Config with a temp path."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        return config
+
+    def test_no_trace_by_default(self, config, render_input, cache_dir):
+        """Nothing is written unless AITERM_TRACE is set."""
+        StatusLineRenderer(config).render(render_input)
+        assert not (cache_dir / trace.TRACE_FILE).exists()
+
+    def test_render_appends_record(self, config, render_input, cache_dir, monkeypatch):
+        """Each traced render appends one record with segment details."""
+        monkeypatch.setenv('AITERM_TRACE', '1')
+        renderer = StatusLineRenderer(config)
+        renderer.render(render_input)
+        renderer.render(render_input)
+
+        records = trace.read_records(cache_dir / trace.TRACE_FILE)
+        assert len(records) == 2
+        git = records[0]['segments']['git']
+        assert set(git) == {'ms', 'subprocs', 'bytes', 'cache', 'overrun'}
+        assert records[0]['ms'] >= git['ms']
+
+    def test_render_restores_popen(self, config, render_input, monkeypatch):
+        """The Popen hook is only installed for the traced render."""
+        monkeypatch.setenv('AITERM_TRACE', '1')
+        StatusLineRenderer(config).render(render_input)
+        assert subprocess.Popen is tracing._ORIGINAL_POPEN
@@ -0,0 +1,147 @@
+"""Tests for the incremental transcript reader.
+
+Tests cover:
+- Tail reads from the end of large JSONL transcripts
+- Incremental polls from a remembered offset
+- Partial final lines, truncation and replacement
+- Timestamp parsing (epoch, ISO 8601, legacy layout)
+"""
+
+import json
+import os
+
+import pytest
+
+from aiterm.statusline import transcript
+from aiterm.statusline.transcript import TranscriptReader, get_last_record, parse_timestamp, tail_records
+
+
+def _write_records(path, records, mode='w'):
+    """Write records as JSONL."""
+    with open(path, mode) as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+class TestTailRecords:
+    """Test reading from the end of a transcript."""
+
+    def test_large_transcript_reads_only_tail(self, tmp_path, monkeypatch):
+        """Only the last block is read for the newest record."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'n': i, 'pad': 'x' * 200} for i in range(20000)])
+
+        reads = []
+        real_open = open
+
+        class CountingFile:
+            def __init__(self, f):
+                self.f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self.f.close()
+
+            def seek(self, *args):
+                return self.f.seek(*args)
+
+            def read(self, size=-1):
+                data = self.f.read(size)
+                reads.append(len(data))
+                return data
+
+        monkeypatch.setattr('builtins.open', lambda *a, **k: CountingFile(real_open(*a, **k)))
+        records = tail_records(str(path), 2)
+        monkeypatch.undo()
+
+        assert [r['n'] for r in records] == [19998, 19999]
+        assert sum(reads) <= transcript.BLOCK_SIZE
+        assert os.path.getsize(path) > 100 * transcript.BLOCK_SIZE
+
+    def test_skips_corrupt_lines(self, tmp_path):
+        """Corrupt and non-object lines are skipped."""
+        path = tmp_path / "t.jsonl"
+        path.write_text('{"n": 1}\nnot json\n[1, 2]\n')
+        assert tail_records(str(path), 5) == [{'n': 1}]
+
+    def test_missing_file(self, tmp_path):
+        """Missing transcripts have no records."""
+        assert tail_records(str(tmp_path / "nope.jsonl")) == []
+
+
+class TestTranscriptReader:
+    """Test incremental polling."""
+
+    def test_poll_returns_only_appended(self, tmp_path):
+        """Each poll returns only records appended since the previous one."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'n': 1}, {'n': 2}])
+        reader = TranscriptReader(str(path))
+
+        assert reader.poll() == []
+        assert reader.last_record == {'n': 2}
+
+        _write_records(path, [{'n': 3}, {'n': 4}], mode='a')
+        assert reader.poll() == [{'n': 3}, {'n': 4}]
+        assert reader.poll() == []
+        assert reader.last_record == {'n': 4}
+
+    def test_from_start(self, tmp_path):
+        """from_start readers return every record on the first poll."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'n': 1}, {'n': 2}])
+        assert TranscriptReader(str(path), from_start=True).poll() == [{'n': 1}, {'n': 2}]
+
+    def test_partial_line_not_consumed(self, tmp_path):
+        """A half-written line is picked up once it is complete."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'n': 1}])
+        reader = TranscriptReader(str(path), from_start=True)
+        reader.poll()
+
+        with open(path, 'a') as f:
+            f.write('{"n": ')
+        assert reader.poll() == []
+        assert reader.last_record == {'n': 1}
+
+        with open(path, 'a') as f:
+            f.write('2}\n')
+        assert reader.poll() == [{'n': 2}]
+
+    def test_truncated_file_restarts(self, tmp_path):
+        """A truncated (rewritten) transcript is read from the start."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'n': i} for i in range(10)])
+        reader = TranscriptReader(str(path), from_start=True)
+        reader.poll()
+
+        _write_records(path, [{'n': 'new'}])
+        assert reader.poll() == [{'n': 'new'}]
+
+    def test_shared_reader(self, tmp_path):
+        """get_last_record follows the transcript across calls."""
+        path = tmp_path / "t.jsonl"
+        _write_records(path, [{'timestamp': 1}])
+        assert get_last_record(str(path)) == {'timestamp': 1}
+
+        _write_records(path, [{'timestamp': 2}], mode='a')
+        assert get_last_record(str(path)) == {'timestamp': 2}
+
+
+class TestParseTimestamp:
+    """Test record timestamps."""
+
+    @pytest.mark.parametrize('record,expected', [
+        ({'timestamp': 1700000000}, 1700000000.0),
+        ({'timestamp': '2023-11-14T22:13:20.000Z'}, 1700000000.0),
+        ({'messages': [{'timestamp': 5}, {'timestamp': 1700000000}]}, 1700000000.0),
+        ({'timestamp': 0}, None),
+        ({'timestamp': 'yesterday'}, None),
+        ({'messages': []}, None),
+        ({}, None),
+    ])
+    def test_parse(self, record, expected):
+        """Epoch, ISO and legacy timestamps are understood."""
+        assert parse_timestamp(record) == expected
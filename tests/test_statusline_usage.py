@@ -0,0 +1,218 @@
+"""Tests for the shared usage cache.
+
+Tests cover:
+- One fetch per TTL window for concurrent callers (single flight)
+- Cached failures, expiry and legacy cache files
+- Credential lookups reused for CREDENTIAL_TTL
+- Non-blocking reads with a background refresher (against a stub server)
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from aiterm.statusline import usage
+from aiterm.statusline.usage import UsageTracker, fetch_usage_cached, get_api_key
+
+
+USAGE_RESPONSE = {'five_hour': {'utilization': {'used': 5, 'total': 10}}}
+
+
+@pytest.fixture
+def usage_server(monkeypatch):
+    """Local stub of the usage endpoint (slow, and counting requests)."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            time.sleep(0.3)
+            body = json.dumps(USAGE_RESPONSE).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv('AITERM_USAGE_URL', f"http://127.0.0.1:{server.server_port}/usage")
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'sk-ant-api-test')
+    monkeypatch.setattr(usage, '_resolve_api_key', lambda: 'sk-ant-api-test')
+    yield requests
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def credential_cache():
+    """Isolate the credential cache."""
+    usage.clear_api_key()
+    yield
+    usage.clear_api_key()
+
+
+class TestFetchUsageCached:
+    """Test the cross-process usage cache."""
+
+    def test_concurrent_misses_fetch_once(self, cache_dir):
+        """Parallel callers share a single fetch."""
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'five_hour': {'utilization': 10}}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(fetch_usage_cached(slow_fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{'five_hour': {'utilization': 10}}] * 8
+
+    def test_failure_is_cached(self):
+        """A failed fetch is not retried until the TTL passes."""
+        calls = []
+        fetch = lambda: calls.append(1)  # noqa: E731 - returns None (failure)
+
+        assert fetch_usage_cached(fetch) is None
+        assert fetch_usage_cached(fetch) is None
+        assert len(calls) == 1
+
+    def test_expired_entry_refetched(self, cache_dir):
+        """Entries older than the TTL are fetched again."""
+        cache_file = cache_dir / usage.USAGE_CACHE_FILE
+        cache_dir.mkdir()
+        cache_file.write_text(json.dumps({'t': time.time() - 120, 'data': {'old': True}}))
+
+        assert fetch_usage_cached(lambda: {'new': True}) == {'new': True}
+        assert json.loads(cache_file.read_text())['data'] == {'new': True}
+
+    def test_legacy_cache_file_is_a_miss(self, cache_dir):
+        """Raw API data from older versions is not trusted."""
+        cache_dir.mkdir()
+        (cache_dir / usage.USAGE_CACHE_FILE).write_text(json.dumps({'five_hour': {}}))
+        assert fetch_usage_cached(lambda: {'fresh': 1}) == {'fresh': 1}
+
+    def test_fetches_without_locking(self, monkeypatch):
+        """Platforms without advisory locks still fetch."""
+        from aiterm.utils import cache as cache_module
+
+        monkeypatch.setattr(cache_module, 'fcntl', None)
+        assert fetch_usage_cached(lambda: {'fresh': 1}) == {'fresh': 1}
+
+
+class TestCredentials:
+    """Test the credential lookup."""
+
+    def test_resolved_once_per_ttl(self, monkeypatch):
+        """Repeated lookups reuse the resolved key until the TTL passes."""
+        calls = []
+        monkeypatch.setattr(usage, '_resolve_api_key', lambda: calls.append(1) or 'sk-test')
+
+        assert get_api_key() == 'sk-test'
+        assert get_api_key() == 'sk-test'
+        assert len(calls) == 1
+
+        monkeypatch.setattr(usage, 'CREDENTIAL_TTL', 0)
+        get_api_key()
+        assert len(calls) == 2
+
+    def test_env_key_change_resolves_again(self, monkeypatch):
+        """A different ANTHROPIC_API_KEY is not served from the cached lookup."""
+        monkeypatch.setattr(usage, '_resolve_api_key', lambda: os.environ.get('ANTHROPIC_API_KEY'))
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'sk-one')
+        assert get_api_key() == 'sk-one'
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'sk-two')
+        assert get_api_key() == 'sk-two'
+
+    def test_tracker_resolves_lazily(self, monkeypatch):
+        """Constructing a tracker does not look up credentials."""
+        calls = []
+        monkeypatch.setattr(usage, '_resolve_api_key', lambda: calls.append(1))
+        UsageTracker()
+        assert calls == []
+
+    def test_no_request_without_key(self, monkeypatch):
+        """Without credentials no HTTP request is made."""
+        monkeypatch.setattr(usage, '_resolve_api_key', lambda: None)
+        monkeypatch.setattr('urllib.request.urlopen', lambda *a, **k: pytest.fail("request sent"))
+        assert UsageTracker().refresh() is None
+
+
+class TestNonBlockingUsage:
+    """Test render-path reads and the background refresher."""
+
+    def test_refresh_uses_endpoint(self, usage_server):
+        """A refresh fetches from the endpoint and caches the result."""
+        tracker = UsageTracker()
+        assert tracker.refresh() == USAGE_RESPONSE
+        assert usage_server[0]['X-Api-Key'] == 'sk-ant-api-test'
+        assert usage.read_usage_cache()[0] == USAGE_RESPONSE
+
+    def test_render_read_does_not_wait(self, usage_server, monkeypatch):
+        """A cold read returns at once and starts one refresher."""
+        spawned = []
+        monkeypatch.setattr(usage, '_spawn_refresher', lambda: spawned.append(1))
+
+        tracker = UsageTracker()
+        started = time.monotonic()
+        assert tracker._fetch_api_usage() is None
+        assert tracker._fetch_api_usage() is None
+        assert time.monotonic() - started < 0.2
+
+        assert usage_server == []
+        assert spawned == [1]  # The second read is within REFRESH_GRACE
+
+    def test_no_refresher_without_credentials(self, monkeypatch):
+        """Keyless users never fork a refresher; the miss is cached instead."""
+        spawned = []
+        monkeypatch.setattr(usage, '_spawn_refresher', lambda: spawned.append(1))
+        monkeypatch.setattr(usage, '_resolve_api_key', lambda: None)
+        monkeypatch.setattr(usage, 'REFRESH_GRACE', 0)
+
+        tracker = UsageTracker()
+        assert tracker._fetch_api_usage() is None
+        assert tracker._fetch_api_usage() is None
+        assert spawned == []
+        assert usage.read_usage_cache()[1] is not None
+
+    def test_stale_data_is_marked(self, cache_dir, monkeypatch):
+        """Old cached data is returned and flagged as stale."""
+        monkeypatch.setattr(usage, '_spawn_refresher', lambda: None)
+        cache_dir.mkdir()
+        (cache_dir / usage.USAGE_CACHE_FILE).write_text(
+            json.dumps({'t': time.time() - usage.STALE_AFTER - 1, 'data': USAGE_RESPONSE})
+        )
+
+        tracker = UsageTracker()
+        assert tracker._fetch_api_usage() == USAGE_RESPONSE
+        assert tracker.is_stale
+
+    def test_refresher_process_fills_cache(self, usage_server, cache_dir):
+        """The detached refresher fetches into the cache for later renders."""
+        tracker = UsageTracker()
+        assert tracker._fetch_api_usage() is None
+
+        deadline = time.monotonic() + 20
+        while usage.read_usage_cache()[0] is None and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        assert tracker._fetch_api_usage() == USAGE_RESPONSE
+        assert not tracker.is_stale
+        assert len(usage_server) == 1
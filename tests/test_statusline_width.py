@@ -0,0 +1,97 @@
+"""Tests for statusLine display width and truncation.
+
+Tests cover:
+- Escape sequences have zero width
+- Emoji, wide characters, joiners and variation selectors
+- Truncation keeps escape sequences and never splits a glyph
+- Right-side truncation in line alignment
+"""
+
+import pytest
+
+from aiterm.statusline.config import StatusLineConfig
+from aiterm.statusline.renderer import StatusLineRenderer
+from aiterm.statusline.width import display_width, truncate
+
+
+class TestDisplayWidth:
+    """Test column width measurement."""
+
+    @pytest.mark.parametrize('text,width', [
+        ("", 0),
+        ("main", 4),
+        ("░▒▓ (wt) ▓▒░", 12),
+        ("🐍 venv", 7),
+        ("📦🌳", 4),
+        ("中文", 4),
+        ("e\u0301", 1),                 # Combining accent
+        ("\u2764\ufe0f", 2),            # VS16 emoji presentation
+        ("👨\u200d👩\u200d👧", 2),        # ZWJ family renders as one glyph
+    ])
+    def test_plain_text(self, text, width):
+        """Wide and zero-width characters are measured in columns."""
+        assert display_width(text) == width
+
+    def test_escape_sequences(self):
+        """CSI and OSC sequences have no width."""
+        assert display_width("\033[48;5;24;38;5;254m 🐍 app \033[0m") == 8
+        assert display_width("\033]0;title\007ok") == 2
+
+
+class TestTruncate:
+    """Test width-limited truncation."""
+
+    def test_fits_unchanged(self):
+        """Text that fits is returned as-is."""
+        assert truncate("short", 10) == "short"
+
+    def test_plain_truncation(self):
+        """Text is cut with an ellipsis inside the width."""
+        result = truncate("feature-branch", 8)
+        assert result == "feature…"
+        assert display_width(result) == 8
+
+    def test_keeps_escapes_and_resets(self):
+        """Escape sequences before the cut are kept and closed with a reset."""
+        result = truncate("\033[38;5;1mabcdef\033[38;5;2mghij\033[0m", 5)
+        assert result == "\033[38;5;1mabcd…\033[0m"
+
+    def test_does_not_split_wide_chars(self):
+        """A wide character that would overflow is dropped."""
+        result = truncate("a🌳🌳", 4)
+        assert result == "a🌳…"
+        assert display_width(truncate("🌳🌳", 2)) <= 2
+
+    def test_too_narrow(self):
+        """Widths smaller than the ellipsis give an empty string."""
+        assert truncate("abc", 0) == ""
+
+
+class TestAlignTruncation:
+    """Test right-side shortening in line alignment."""
+
+    @pytest.fixture
+    def renderer(self, tmp_path):
+        """Renderer with a fixed 40-column terminal."""
+        config = StatusLineConfig()
+        config.config_path = tmp_path / "statusline.json"
+        renderer = StatusLineRenderer(config)
+        renderer.terminal_width = 40
+        return renderer
+
+    def test_right_side_shortened(self, renderer):
+        """A right side that does not fit is shortened, not dropped."""
+        left = "╭─ " + "x" * 20
+        right = renderer._render_right_segment("🌳 feature-very-long-branch-name")
+
+        result = renderer._align_line(left, right)
+
+        assert result.startswith(left)
+        assert "🌳" in result
+        assert display_width(result) == 40
+
+    def test_emoji_alignment_fills_width(self, renderer):
+        """Emoji count as two columns when padding the line."""
+        result = renderer._align_line("╭─ 🐍 app", "🌳 2 worktrees")
+        assert display_width(result) <= 40
+        assert result.endswith("🌳 2 worktrees")
@@ -0,0 +1,130 @@
+"""Tests for per-terminal last-applied state.
+
+Tests cover:
+- Only changed escape sequences are written
+- Profile switches coalesced during bursts and flushed afterwards
+- Fallback without a TTY
+"""
+
+import pytest
+
+from aiterm.terminal import state
+
+
+KEY = "dev_ttys001-100"
+
+
+@pytest.fixture(autouse=True)
+def spawned(monkeypatch):
+    """Record flusher spawns."""
+    spawned = []
+    monkeypatch.setattr(state, '_spawn_flusher', lambda key, t: spawned.append((key, t)))
+    return spawned
+
+
+def _settle():
+    """Move the last call out of the debounce window."""
+    loaded = state.load_state(KEY)
+    loaded['t'] -= 10
+    state.atomic_write_json(state.get_state_path(KEY), loaded)
+
+
+class TestEmit:
+    """Test diffing against the last applied state."""
+
+    def test_first_call_writes_all(self, capsys):
+        """Everything is written to a fresh terminal."""
+        written = state.emit({'profile': 'P1', 'title': 'T1'}, deferrable=('profile',), key=KEY)
+        assert written == ['profile', 'title']
+        assert capsys.readouterr().out == 'P1T1'
+
+    def test_unchanged_slots_skipped(self, capsys, monkeypatch):
+        """Only slots whose sequence changed are written."""
+        state.emit({'profile': 'P1', 'title': 'T1'}, key=KEY)
+        _settle()
+        capsys.readouterr()
+
+        assert state.emit({'profile': 'P1', 'title': 'T2'}, key=KEY) == ['title']
+        assert capsys.readouterr().out == 'T2'
+
+    def test_no_tty_writes_everything(self, capsys, monkeypatch):
+        """Without a terminal key every sequence is written, every time."""
+        monkeypatch.setattr(state, 'get_terminal_key', lambda: None)
+        state.emit({'title': 'T1'})
+        state.emit({'title': 'T1'})
+        assert capsys.readouterr().out == 'T1T1'
+
+    def test_clear_state(self, capsys):
+        """Clearing the state makes the next call write everything."""
+        state.emit({'title': 'T1'}, key=KEY)
+        state.clear_state(KEY)
+        state.emit({'title': 'T1'}, key=KEY)
+        assert capsys.readouterr().out == 'T1T1'
+
+
+class TestDebounce:
+    """Test burst coalescing of deferrable slots."""
+
+    def test_burst_defers_profile(self, capsys, monkeypatch, spawned):
+        """A profile change inside the window is held and a flusher started."""
+        state.emit({'profile': 'P1', 'title': 'T1'}, deferrable=('profile',), key=KEY)
+        capsys.readouterr()
+
+        written = state.emit({'profile': 'P2', 'title': 'T2'}, deferrable=('profile',), key=KEY)
+
+        assert written == ['title']
+        assert capsys.readouterr().out == 'T2'
+        assert state.load_state(KEY)['pending'] == {'profile': 'P2'}
+        assert len(spawned) == 1
+
+    def test_flush_applies_latest(self, capsys, spawned):
+        """Only the newest flusher writes the final pending profile."""
+        state.emit({'profile': 'P1'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'P2'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'P3'}, deferrable=('profile',), key=KEY)
+        capsys.readouterr()
+
+        (_, first), (_, last) = spawned
+        assert state.flush(KEY, first, wait=False) == []
+        assert state.flush(KEY, last, wait=False) == ['profile']
+        assert capsys.readouterr().out == 'P3'
+        assert state.load_state(KEY)['applied']['profile'] == 'P3'
+
+    def test_bounce_back_switches_nothing(self, capsys, spawned):
+        """Bouncing back inside a burst leaves nothing pending."""
+        state.emit({'profile': 'A'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'B'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'A'}, deferrable=('profile',), key=KEY)
+
+        assert capsys.readouterr().out == 'A'
+        assert state.load_state(KEY)['pending'] == {}
+        assert state.flush(KEY, spawned[-1][1], wait=False) == []
+
+    def test_bounce_from_settled_switches_once_more(self, capsys, spawned):
+        """From a settled terminal, A -> B -> A applies B now and A once later."""
+        state.emit({'profile': 'A'}, deferrable=('profile',), key=KEY)
+        _settle()
+        capsys.readouterr()
+
+        state.emit({'profile': 'B'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'A'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'B'}, deferrable=('profile',), key=KEY)
+        state.emit({'profile': 'A'}, deferrable=('profile',), key=KEY)
+        assert capsys.readouterr().out == 'B'
+
+        assert state.flush(KEY, spawned[-1][1], wait=False) == ['profile']
+        assert capsys.readouterr().out == 'A'
+
+    def test_settled_change_written_immediately(self, capsys, monkeypatch, spawned):
+        """Outside the window profile changes are written at once."""
+        state.emit({'profile': 'P1'}, deferrable=('profile',), key=KEY)
+        _settle()
+
+        assert state.emit({'profile': 'P2'}, deferrable=('profile',), key=KEY) == ['profile']
+        assert capsys.readouterr().out == 'P1P2'
+        assert spawned == []
+
+    def test_flusher_main_rejects_bad_args(self):
+        """The flusher entry point validates its arguments."""
+        assert state.main([]) == 2
+        assert state.main([KEY, 'soon']) == 2